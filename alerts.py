@@ -0,0 +1,245 @@
+"""관심 종목 알림 규칙 엔진
+
+규칙은 "<지표 열> <연산자> <숫자 또는 지표 열>" 형식의 문자열이다.
+
+    RSI >= 70
+    Williams_R <= -80
+    MACD crosses_above MACD_Signal
+    Volume_Ratio > 150              # 거래량 / 20일 평균 (%)
+    Fear_Greed <= 25                # 봉 시각 기준 Fear & Greed 지수 (fear_greed_store)
+
+규칙 목록은 연산자별 인덱스 배열로 컴파일되고, 종목 × 지표 열 패널(마지막 봉과 직전 봉)에
+대해 연산자마다 numpy 비교 한 번으로 모든 종목/규칙을 함께 평가한다. 알림은 조건이
+거짓에서 참으로 바뀔 때만 보내며, 같은 종목/규칙은 config.ALERT_COOLDOWN_SEC 동안 다시
+보내지 않는다.
+"""
+import time
+
+import numpy as np
+
+import config
+from data_cache import BAR_COLUMNS
+from technical_analysis import INDICATOR_COLUMNS
+
+COMPARE_OPS = {
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '<': np.less,
+    '<=': np.less_equal,
+}
+CROSS_OPS = ['crosses_above', 'crosses_below']
+
+# 지표 프레임에 없지만 규칙에서 쓸 수 있는 파생 열
+DERIVED_COLUMNS = {
+    'Volume_Ratio': lambda frame: frame['Volume'] / frame['Volume_MA'] * 100,
+}
+# 파생 열을 만드는 데 필요한 지표 열
+DERIVED_INPUTS = {
+    'Volume_Ratio': ['Volume_MA'],
+}
+
+
+class RuleError(ValueError):
+    pass
+
+
+def parse_rule(text, name=None):
+    """규칙 문자열 → {'name', 'text', 'left', 'op', 'right'} (right는 float 또는 열 이름)"""
+    parts = text.split()
+    if len(parts) != 3:
+        raise RuleError(f"규칙 형식이 잘못되었습니다: '{text}' (예: RSI >= 70)")
+    left, op, right = parts
+    if op not in COMPARE_OPS and op not in CROSS_OPS:
+        raise RuleError(f"알 수 없는 연산자: {op} (사용 가능: {', '.join(list(COMPARE_OPS) + CROSS_OPS)})")
+    try:
+        right = float(right)
+    except ValueError:
+        pass
+    known = BAR_COLUMNS + INDICATOR_COLUMNS + list(DERIVED_COLUMNS)
+    for column in (left, right):
+        if isinstance(column, str) and column not in known:
+            raise RuleError(f"알 수 없는 지표 열: {column} (사용 가능: {', '.join(known)})")
+    return {'name': name or text, 'text': text, 'left': left, 'op': op, 'right': right}
+
+
+def required_columns(columns):
+    """규칙에서 쓰는 열을 평가하는 데 필요한 지표 열 (봉 열 제외, 파생 열은 입력 열로 바꿈)"""
+    required = []
+    for column in columns:
+        for name in DERIVED_INPUTS.get(column, [column]):
+            if name in INDICATOR_COLUMNS and name not in required:
+                required.append(name)
+    return required
+
+
+def latest_rows(indicators, columns):
+    """지표 프레임에서 columns의 (직전 봉, 마지막 봉) 값 배열 (없는 열은 NaN)"""
+    tail = indicators.iloc[-2:]
+    rows = np.full((2, len(columns)), np.nan)
+    for j, column in enumerate(columns):
+        try:
+            series = DERIVED_COLUMNS[column](tail) if column in DERIVED_COLUMNS else tail[column]
+        except KeyError:
+            continue
+        values = series.to_numpy(dtype=float)
+        rows[2 - len(values):, j] = values
+    return rows
+
+
+class RuleSet:
+    """규칙 목록을 연산자별 배열로 컴파일해 패널 전체에 한 번에 평가"""
+
+    def __init__(self, rules):
+        self.rules = [parse_rule(rule) if isinstance(rule, str) else parse_rule(rule[1], rule[0])
+                      for rule in rules]
+        columns = []
+        for rule in self.rules:
+            for column in (rule['left'], rule['right']):
+                if isinstance(column, str) and column not in columns:
+                    columns.append(column)
+        self.columns = columns
+        self.left_index = np.array([columns.index(rule['left']) for rule in self.rules], dtype=int)
+        self.groups = self._compile()
+
+    def _compile(self):
+        index = {column: j for j, column in enumerate(self.columns)}
+        groups = []
+        for op in list(COMPARE_OPS) + CROSS_OPS:
+            members = [i for i, rule in enumerate(self.rules) if rule['op'] == op]
+            if not members:
+                continue
+            rights = [self.rules[i]['right'] for i in members]
+            is_column = np.array([isinstance(right, str) for right in rights])
+            groups.append({
+                'op': op,
+                'rules': np.array(members),
+                'left': np.array([index[self.rules[i]['left']] for i in members]),
+                'is_column': is_column,
+                'right': np.array([index[right] if isinstance(right, str) else 0 for right in rights]),
+                'constant': np.array([np.nan if isinstance(right, str) else right for right in rights]),
+            })
+        return groups
+
+    def evaluate(self, last, prev):
+        """last/prev: (종목 수, 열 수) 배열 → (종목 수, 규칙 수) bool 배열 (NaN이 섞이면 거짓)"""
+        hits = np.zeros((len(last), len(self.rules)), dtype=bool)
+        for group in self.groups:
+            left = last[:, group['left']]
+            right = np.where(group['is_column'], last[:, group['right']], group['constant'])
+            op = group['op']
+            if op in COMPARE_OPS:
+                hit = COMPARE_OPS[op](left, right)
+            else:
+                prev_left = prev[:, group['left']]
+                prev_right = np.where(group['is_column'], prev[:, group['right']], group['constant'])
+                if op == 'crosses_above':
+                    hit = (prev_left <= prev_right) & (left > right)
+                else:
+                    hit = (prev_left >= prev_right) & (left < right)
+            hits[:, group['rules']] = hit
+        return hits
+
+
+class AlertPanel:
+    """종목 × 지표 열 패널 (마지막 봉과 직전 봉 값, 종목별 규칙 충족 상태)
+
+    종목 데이터가 갱신될 때 해당 행만 바꾼다. 행은 미리 잡아 둔 배열을 두 배씩 늘려 사용한다.
+    """
+
+    def __init__(self, n_columns, n_rules, capacity=64):
+        self.symbols = []
+        self.rows = {}
+        self.bar_times = []
+        self.last = np.full((capacity, n_columns), np.nan)
+        self.prev = np.full((capacity, n_columns), np.nan)
+        self.active = np.zeros((capacity, n_rules), dtype=bool)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def _grow(self):
+        capacity = len(self.last) * 2
+        for name in ('last', 'prev', 'active'):
+            old = getattr(self, name)
+            new = np.full((capacity, old.shape[1]), np.nan) if old.dtype != bool \
+                else np.zeros((capacity, old.shape[1]), dtype=bool)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def update(self, symbol, rows, bar_time=None):
+        """symbol의 (직전 봉, 마지막 봉) 값 갱신 (latest_rows 결과)"""
+        row = self.rows.get(symbol)
+        if row is None:
+            if len(self.symbols) == len(self.last):
+                self._grow()
+            row = len(self.symbols)
+            self.rows[symbol] = row
+            self.symbols.append(symbol)
+            self.bar_times.append(None)
+            self.active[row] = False
+        self.prev[row], self.last[row] = rows
+        self.bar_times[row] = bar_time
+
+    def remove(self, symbol):
+        """symbol 행 삭제 (마지막 행을 빈자리로 옮김)"""
+        row = self.rows.pop(symbol, None)
+        if row is None:
+            return
+        end = len(self.symbols) - 1
+        if row != end:
+            moved = self.symbols[end]
+            self.symbols[row] = moved
+            self.bar_times[row] = self.bar_times[end]
+            self.rows[moved] = row
+            for array in (self.last, self.prev, self.active):
+                array[row] = array[end]
+        self.symbols.pop()
+        self.bar_times.pop()
+
+
+class AlertEngine:
+    """알림 규칙 + 종목 패널 + 중복 알림 억제"""
+
+    def __init__(self, rules=None, cooldown=None):
+        self.rules = RuleSet(config.ALERT_RULES if rules is None else rules)
+        self.cooldown = config.ALERT_COOLDOWN_SEC if cooldown is None else cooldown
+        self.panel = AlertPanel(len(self.rules.columns), len(self.rules.rules))
+        self.last_sent = {}
+
+    def update(self, symbol, rows, bar_time=None):
+        self.panel.update(symbol, rows, bar_time)
+
+    def update_frame(self, symbol, indicators):
+        """지표 프레임으로 symbol 행 갱신"""
+        self.panel.update(symbol, latest_rows(indicators, self.rules.columns), indicators.index[-1])
+
+    def remove(self, symbol):
+        self.panel.remove(symbol)
+
+    def evaluate(self, now=None):
+        """모든 종목/규칙을 평가해 새로 충족된 조건의 알림 목록 반환"""
+        now = time.time() if now is None else now
+        n = len(self.panel)
+        if n == 0:
+            return []
+        hits = self.rules.evaluate(self.panel.last[:n], self.panel.prev[:n])
+        rising = hits & ~self.panel.active[:n]
+        self.panel.active[:n] = hits
+
+        alerts = []
+        for row, rule_index in zip(*np.nonzero(rising)):
+            symbol = self.panel.symbols[row]
+            rule = self.rules.rules[rule_index]
+            key = (symbol, rule['name'])
+            if now - self.last_sent.get(key, -np.inf) < self.cooldown:
+                continue
+            self.last_sent[key] = now
+            alerts.append({
+                'symbol': symbol,
+                'rule': rule['name'],
+                'condition': rule['text'],
+                'value': float(self.panel.last[row, self.rules.left_index[rule_index]]),
+                'bar_time': self.panel.bar_times[row],
+                'time': now,
+            })
+        return alerts
@@ -0,0 +1,428 @@
+"""로컬 HTTP/JSON 서비스
+
+GUI와 같은 수집기/캐시/지표 계산으로 봉 데이터, 지표 시계열, 최신 신호 분류를 제공한다.
+
+    python api_server.py --port 8765
+    python api_server.py --offline          # 합성 데이터(benchmarks 스텁)로 실행
+
+    GET /health
+    GET /memory                             # 캐시 종목별 메모리 사용량
+    GET /bars/AAPL?period=1y&interval=1d&limit=100
+    GET /indicators/AAPL?names=RSI,MACD&limit=100
+    GET /signals/AAPL
+    GET /correlation/SPY?symbols=AAPL,MSFT,NVDA&window=60   # 경로의 종목이 베타/상대 강도 벤치마크
+
+같은 응답 키(경로 + 쿼리)에 대한 동시 요청은 하나의 계산으로 합쳐지고, 완성된 응답은
+간격별 TTL 동안 ETag와 함께 캐시된다 (If-None-Match가 일치하면 304).
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs, unquote
+
+import numpy as np
+
+import config
+import metrics
+from cross_asset import CrossAssetPanel, load_closes
+from data_cache import shared_cache, ttl_for
+from data_fetcher import breakers
+from technical_analysis import TechnicalAnalysis, INDICATOR_COLUMNS, SIGNAL_COLUMNS, as_float64
+
+logger = logging.getLogger(__name__)
+
+BAR_COLUMNS = [('open', 'Open'), ('high', 'High'), ('low', 'Low'), ('close', 'Close'), ('volume', 'Volume')]
+MAX_HEADER_LINES = 100
+
+STATUS_TEXT = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class ApiError(Exception):
+    """클라이언트에 그대로 전달할 오류 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _values(series):
+    """float 목록으로 변환 (NaN은 JSON null)"""
+    values = as_float64(np.asarray(series))
+    return [None if v != v else v for v in values.tolist()]
+
+
+def _timestamps(index):
+    return [ts.isoformat() if hasattr(ts, 'isoformat') else str(ts) for ts in index]
+
+
+def _limit(params):
+    raw = params.get('limit')
+    if raw is None:
+        return None
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise ApiError(400, f"limit은 정수여야 합니다: {raw}")
+    if limit <= 0:
+        raise ApiError(400, "limit은 1 이상이어야 합니다")
+    return limit
+
+
+def _positive_int(params, name, default):
+    raw = params.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ApiError(400, f"{name}은 정수여야 합니다: {raw}")
+    if value <= 1:
+        raise ApiError(400, f"{name}은 2 이상이어야 합니다")
+    return value
+
+
+def _view(symbol, params):
+    return (symbol.upper(), params.get('period', config.DEFAULT_PERIOD),
+            params.get('interval', config.DEFAULT_INTERVAL))
+
+
+class ResponseCache:
+    """완성된 응답 본문 캐시 (LRU + 만료 시각, 이벤트 루프 스레드 전용)"""
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or config.API_RESPONSE_CACHE_ENTRIES
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if time.time() > entry['expires']:
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, status, body, expires):
+        entry = {
+            'status': status,
+            'body': body,
+            'etag': '"' + hashlib.sha1(body).hexdigest()[:24] + '"',
+            'expires': expires,
+        }
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return entry
+
+
+class ApiServer:
+    """asyncio 기반 로컬 API 서버
+
+    계산(수집, 지표, JSON 직렬화)은 스레드 풀에서 실행되고 이벤트 루프는 연결 처리만
+    담당하므로 수백 개의 동시 연결도 계산 한 번으로 처리한다.
+    """
+
+    def __init__(self, cache=None, host=None, port=None, workers=None):
+        self.cache = cache or shared_cache
+        self.host = host or config.API_HOST
+        self.port = config.API_PORT if port is None else port
+        self.executor = ThreadPoolExecutor(max_workers=workers or config.API_WORKERS,
+                                           thread_name_prefix='api')
+        self.responses = ResponseCache()
+        self.inflight = {}
+        self.server = None
+        self.stats = {'requests': 0, 'computed': 0, 'cache_hits': 0, 'coalesced': 0, 'not_modified': 0}
+        self.routes = {
+            'bars': self.build_bars,
+            'indicators': self.build_indicators,
+            'signals': self.build_signals,
+            'correlation': self.build_correlation,
+        }
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port,
+                                                 limit=64 * 1024, backlog=1024)
+        self.port = self.server.sockets[0].getsockname()[1]
+        logger.info("API 서버 시작: http://%s:%d", self.host, self.port)
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    # --- 연결 처리 ---
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), config.API_KEEPALIVE_SEC)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                headers = await self._read_headers(reader)
+                if headers is None:
+                    break
+                keep_alive = await self._handle_request(request_line, headers, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_headers(self, reader):
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if not line:
+                return None
+            line = line.decode('latin-1').strip()
+            if not line:
+                return headers
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        return None
+
+    async def _handle_request(self, request_line, headers, writer):
+        self.stats['requests'] += 1
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+            self._write(writer, 400, *self._error_body("잘못된 요청 형식"), keep_alive=False)
+            return False
+
+        keep_alive = (headers.get('connection', '').lower() != 'close'
+                      and version.upper() == 'HTTP/1.1')
+        if method not in ('GET', 'HEAD'):
+            self._write(writer, 405, *self._error_body("GET만 지원합니다"), keep_alive=keep_alive)
+            return keep_alive
+
+        entry = await self.respond(target)
+        if entry['etag'] and headers.get('if-none-match') == entry['etag']:
+            self.stats['not_modified'] += 1
+            self._write(writer, 304, b'', entry['etag'], entry['max_age'], keep_alive, head=True)
+        else:
+            self._write(writer, entry['status'], entry['body'], entry['etag'], entry['max_age'],
+                        keep_alive, head=(method == 'HEAD'))
+        return keep_alive
+
+    def _write(self, writer, status, body, etag=None, max_age=0, keep_alive=True, head=False):
+        lines = [
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if etag:
+            lines.append(f"ETag: {etag}")
+            lines.append(f"Cache-Control: max-age={max_age}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1'))
+        if not head:
+            writer.write(body)
+
+    def _error_body(self, message):
+        return json.dumps({'error': message}, ensure_ascii=False).encode('utf-8'), None
+
+    # --- 응답 생성 (캐시 + 동시 요청 합치기) ---
+
+    async def respond(self, target):
+        """target(경로 + 쿼리)에 대한 응답 {status, body, etag, max_age}"""
+        url = urlsplit(target)
+        parts = [unquote(p) for p in url.path.split('/') if p]
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        key = (tuple(parts), tuple(sorted(params.items())))
+
+        if parts == ['health']:
+            body = json.dumps({'status': 'ok', 'stats': self.stats}).encode('utf-8')
+            return {'status': 200, 'body': body, 'etag': None, 'max_age': 0}
+        if parts == ['memory']:
+            body = self._dump(self.cache.memory_report())
+            return {'status': 200, 'body': body, 'etag': None, 'max_age': 0}
+        if len(parts) != 2 or parts[0] not in self.routes:
+            body, _ = self._error_body(f"알 수 없는 경로: {url.path}")
+            return {'status': 404, 'body': body, 'etag': None, 'max_age': 0}
+
+        cached = self.responses.get(key)
+        if cached is not None:
+            self.stats['cache_hits'] += 1
+            return self._with_max_age(cached)
+
+        task = self.inflight.get(key)
+        if task is not None:
+            self.stats['coalesced'] += 1
+        else:
+            task = asyncio.ensure_future(self._compute(key, parts[0], parts[1], params))
+            self.inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self.inflight.pop(k, None))
+        # 한 클라이언트가 끊겨도 같은 계산을 기다리는 다른 요청은 계속 진행
+        return self._with_max_age(await asyncio.shield(task))
+
+    async def _compute(self, key, route, symbol, params):
+        self.stats['computed'] += 1
+        loop = asyncio.get_running_loop()
+        try:
+            with metrics.span(f'api.{route}'):
+                body, expires = await loop.run_in_executor(self.executor, self.routes[route], symbol, params)
+            return self.responses.put(key, 200, body, expires)
+        except ApiError as e:
+            body, _ = self._error_body(e.message)
+            return {'status': e.status, 'body': body, 'etag': None, 'expires': 0}
+        except Exception as e:
+            logger.exception("API 응답 생성 실패: %s", key)
+            body, _ = self._error_body(f"{type(e).__name__} - {e}")
+            return {'status': 500, 'body': body, 'etag': None, 'expires': 0}
+
+    def _with_max_age(self, entry):
+        max_age = max(0, int(entry['expires'] - time.time())) if entry['etag'] else 0
+        return {'status': entry['status'], 'body': entry['body'], 'etag': entry['etag'], 'max_age': max_age}
+
+    # --- 응답 본문 (작업 스레드에서 실행) ---
+
+    def _load(self, symbol, params, columns=None):
+        symbol, period, interval = _view(symbol, params)
+        entry = self.cache.load(symbol, period, interval, columns=columns)
+        if entry is None and breakers['yahoo'].is_open:
+            raise ApiError(503, f"야후 파이낸스 요청 차단 중입니다 ({breakers['yahoo'].retry_in():.0f}초 후 재시도)")
+        if entry is None:
+            raise ApiError(404, f"{symbol} 데이터를 가져올 수 없습니다 (period={period}, interval={interval})")
+        expires = entry['fetched_at'] + ttl_for(interval)
+        return entry, expires
+
+    def _dump(self, payload):
+        return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def build_bars(self, symbol, params):
+        limit = _limit(params)
+        entry, expires = self._load(symbol, params, columns=())
+        data = entry['data'] if limit is None else entry['data'].tail(limit)
+        payload = {
+            'symbol': entry['symbol'],
+            'period': entry['period'],
+            'interval': entry['interval'],
+            'count': len(data),
+            'timestamps': _timestamps(data.index),
+        }
+        for name, column in BAR_COLUMNS:
+            payload[name] = _values(data[column])
+        return self._dump(payload), expires
+
+    def build_indicators(self, symbol, params):
+        limit = _limit(params)
+        names = [n.strip() for n in params.get('names', '').split(',') if n.strip()] or INDICATOR_COLUMNS
+        unknown = [n for n in names if n not in INDICATOR_COLUMNS]
+        if unknown:
+            raise ApiError(400, f"알 수 없는 지표: {', '.join(unknown)} (사용 가능: {', '.join(INDICATOR_COLUMNS)})")
+        entry, expires = self._load(symbol, params, columns=names)
+        indicators = entry['indicators'] if limit is None else entry['indicators'].tail(limit)
+        payload = {
+            'symbol': entry['symbol'],
+            'period': entry['period'],
+            'interval': entry['interval'],
+            'count': len(indicators),
+            'timestamps': _timestamps(indicators.index),
+            'series': {name: _values(indicators[name]) for name in names if name in indicators.columns},
+        }
+        return self._dump(payload), expires
+
+    def build_signals(self, symbol, params):
+        entry, expires = self._load(symbol, params, columns=SIGNAL_COLUMNS)
+        payload = {
+            'symbol': entry['symbol'],
+            'period': entry['period'],
+            'interval': entry['interval'],
+            'signals': TechnicalAnalysis.latest_signals(entry['indicators']),
+        }
+        return self._dump(payload), expires
+
+    def build_correlation(self, benchmark, params):
+        benchmark = benchmark.upper()
+        symbols = [s.strip().upper() for s in params.get('symbols', '').split(',') if s.strip()] \
+            or config.WATCHLIST_DEFAULT
+        window = _positive_int(params, 'window', config.CROSS_ASSET_WINDOW)
+        lookback = _positive_int(params, 'lookback', config.CROSS_ASSET_RS_LOOKBACK)
+        _, period, interval = _view(benchmark, params)
+        closes, missing = load_closes([benchmark] + symbols, period, interval, cache=self.cache)
+        if benchmark not in closes.columns:
+            raise ApiError(404, f"{benchmark} 데이터를 가져올 수 없습니다 (period={period}, interval={interval})")
+        panel = CrossAssetPanel(closes, benchmark, window=window,
+                                min_periods=min(window, config.CROSS_ASSET_MIN_PERIODS), rs_lookback=lookback)
+        corr = panel.correlation()
+        strength = panel.relative_strength()
+        payload = {
+            'benchmark': benchmark,
+            'period': period,
+            'interval': interval,
+            'window': window,
+            'lookback': lookback,
+            'as_of': _timestamps([panel.as_of])[0],
+            'symbols': panel.symbols,
+            'missing': missing,
+            'correlation': [_values(corr[symbol]) for symbol in panel.symbols],
+            'beta': dict(zip(panel.symbols, _values(panel.betas()))),
+            'relative_strength': [
+                {'symbol': symbol, 'return_pct': row[0], 'vs_benchmark_pct': row[1],
+                 'rank': None if row[2] is None else int(row[2])}
+                for symbol, row in zip(strength.index, zip(*(_values(strength[c]) for c in strength.columns)))
+            ],
+        }
+        return self._dump(payload), time.time() + ttl_for(interval)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="STRP 로컬 HTTP/JSON 서비스")
+    parser.add_argument('--host', default=config.API_HOST)
+    parser.add_argument('--port', type=int, default=config.API_PORT)
+    parser.add_argument('--workers', type=int, default=config.API_WORKERS, help="계산 스레드 수")
+    parser.add_argument('--offline', action='store_true',
+                        help="네트워크 대신 합성 데이터 사용 (benchmarks 스텁)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=config.LOG_LEVEL,
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    if args.offline:
+        from benchmarks.stubs import offline_providers
+        providers = offline_providers()
+    else:
+        import contextlib
+        providers = contextlib.nullcontext()
+
+    server = ApiServer(host=args.host, port=args.port, workers=args.workers)
+    with providers:
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
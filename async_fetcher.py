@@ -0,0 +1,141 @@
+"""DataFetcher 비동기 파사드
+
+    fetcher = AsyncFetcher()
+    async for symbol, data in fetcher.stream_stock_data(symbols, '1y', '1d'):
+        ...
+
+블로킹 DataFetcher 메서드를 공급자별 세마포어로 동시 실행 수를 제한한 스레드 풀에서
+실행한다. 같은 요청(같은 심볼/기간/간격 등)이 진행 중이면 새로 보내지 않고 그 결과를
+함께 기다린다. 기다리는 쪽이 모두 취소되면 아직 시작하지 않은 요청은 보내지 않고,
+진행 중인 요청은 CancelToken으로 중단한다.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+from data_fetcher import DataFetcher, CancelToken, LoadCancelled
+
+
+class AsyncFetcher:
+    """공급자별 동시성 제한 + 진행 중 요청 합치기 (이벤트 루프 하나에서만 사용)"""
+
+    def __init__(self, concurrency=None):
+        self.concurrency = dict(config.ASYNC_PROVIDER_CONCURRENCY)
+        self.concurrency.update(concurrency or {})
+        self.executor = ThreadPoolExecutor(max_workers=sum(self.concurrency.values()),
+                                           thread_name_prefix='async-fetch')
+        self.semaphores = {provider: asyncio.Semaphore(limit)
+                           for provider, limit in self.concurrency.items()}
+        self.inflight = {}
+        self.stats = {'calls': 0, 'coalesced': 0, 'cancelled': 0}
+        self._local = threading.local()
+
+    def _fetcher(self):
+        fetcher = getattr(self._local, 'fetcher', None)
+        if fetcher is None:
+            fetcher = DataFetcher()
+            self._local.fetcher = fetcher
+        return fetcher
+
+    def _invoke(self, method, args, kwargs):
+        return getattr(self._fetcher(), method)(*args, **kwargs)
+
+    async def _call(self, provider, method, args, cancellable):
+        async with self.semaphores[provider]:
+            self.stats['calls'] += 1
+            token = CancelToken() if cancellable else None
+            kwargs = {'cancel': token} if cancellable else {}
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, self._invoke, method, args, kwargs)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if token is not None:
+                    token.cancel()
+                # 스레드가 실제로 끝날 때까지 자리를 유지해 공급자별 동시성 제한을 지킴
+                await asyncio.wait([future])
+                if not future.cancelled():
+                    future.exception()  # 취소로 생긴 LoadCancelled는 여기서 소비
+                raise
+
+    async def _request(self, key, provider, method, *args, cancellable=False):
+        """key가 같은 요청은 하나의 호출로 합쳐서 실행"""
+        entry = self.inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self._call(provider, method, args, cancellable))
+            entry = {'task': task, 'waiters': 0}
+            self.inflight[key] = entry
+            task.add_done_callback(lambda _t, k=key, e=entry: self._forget(k, e))
+        else:
+            self.stats['coalesced'] += 1
+
+        entry['waiters'] += 1
+        try:
+            return await asyncio.shield(entry['task'])
+        except asyncio.CancelledError:
+            if entry['waiters'] == 1 and not entry['task'].done():
+                # 결과를 기다리는 쪽이 더 없으면 요청 자체를 취소
+                self.stats['cancelled'] += 1
+                entry['task'].cancel()
+            raise
+        finally:
+            entry['waiters'] -= 1
+
+    def _forget(self, key, entry):
+        if self.inflight.get(key) is entry:
+            del self.inflight[key]
+
+    async def stock_data(self, symbol, period="1y", interval="1d"):
+        """주가 데이터 (실패 시 None)"""
+        symbol = symbol.upper()
+        try:
+            return await self._request(('stock', symbol, period, interval), 'yahoo',
+                                       'get_stock_data', symbol, period, interval, cancellable=True)
+        except LoadCancelled:
+            return None
+
+    async def stock_info(self, symbol, period=None, interval=None):
+        """종목 기본 정보 (period/interval을 주면 그 봉 데이터가 없던 심볼은 요청 없이 기본값)"""
+        symbol = symbol.upper()
+        return await self._request(('info', symbol, period, interval), 'yahoo', 'get_stock_info',
+                                   symbol, period, interval, cancellable=True)
+
+    async def interest_rates(self):
+        return await self._request(('interest',), 'fred', 'get_interest_rates')
+
+    async def country_rate(self, country_code):
+        code = country_code.upper()
+        return await self._request(('country', code), 'fred', 'get_country_rates', code)
+
+    async def all_country_rates(self, country_codes=None):
+        codes = tuple(sorted(c.upper() for c in country_codes)) if country_codes else None
+        return await self._request(('countries', codes), 'fred', 'get_all_country_rates', codes)
+
+    async def fear_greed(self):
+        return await self._request(('fng',), 'fng', 'get_fear_greed_index')
+
+    async def stream_stock_data(self, symbols, period="1y", interval="1d"):
+        """(심볼, 데이터 또는 None)을 완료되는 순서대로 내보내는 비동기 제너레이터
+
+        중복 심볼은 한 번만 요청한다. 소비를 중단하면 남은 요청은 취소된다.
+        """
+        symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+
+        async def fetch(symbol):
+            return symbol, await self.stock_data(symbol, period, interval)
+
+        tasks = [asyncio.ensure_future(fetch(symbol)) for symbol in symbols]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def gather_stock_data(self, symbols, period="1y", interval="1d"):
+        """심볼 → 데이터(또는 None) 사전"""
+        return {symbol: data async for symbol, data in self.stream_stock_data(symbols, period, interval)}
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
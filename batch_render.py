@@ -0,0 +1,214 @@
+"""헤드리스 배치 차트 렌더링
+
+종목 목록을 PNG/SVG 파일로 저장한다. 데이터는 디스크 캐시에서 읽고, 없으면 메인
+프로세스가 비동기 수집기(async_fetcher)로 속도 제한을 지키며 수집해 캐시에 넣는다. 렌더링은 프로세스 풀에서
+병렬로 수행하며 각 워커는 Figure/Agg 캔버스 하나를 만들어 계속 재사용한다.
+
+    python batch_render.py AAPL MSFT NVDA --format png
+    python batch_render.py --symbols-file symbols.txt --workers 8 --out-dir charts
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+from disk_cache import DiskCache, file_stem
+
+FORMATS = ['png', 'svg']
+
+# 워커 프로세스마다 한 번 만들어 재사용하는 렌더러와 캐시
+_renderer = None
+_cache = None
+
+
+class ImageRenderer:
+    """고정 크기 Figure + Agg 캔버스 + 차트 템플릿 (차트마다 축을 새로 만들지 않음)"""
+
+    def __init__(self, width_px, height_px, dpi):
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from chart_renderer import ChartTemplate, configure_fonts
+
+        configure_fonts()
+        self.dpi = dpi
+        self.figure = Figure(figsize=(width_px / dpi, height_px / dpi), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.template = ChartTemplate(self.figure)
+
+    def render(self, arrays, title, path, fmt):
+        self.template.draw(arrays, title)
+        self.canvas.print_figure(path, format=fmt, dpi=self.dpi)
+
+
+def _init_worker(width_px, height_px, dpi, cache_dir, fear_greed_path):
+    global _renderer, _cache
+    from fear_greed_store import fear_greed_store
+    _renderer = ImageRenderer(width_px, height_px, dpi)
+    _cache = DiskCache(cache_dir)
+    # spawn된 프로세스는 config를 새로 읽으므로 부모가 갱신한 저장소 파일을 그대로 쓰도록 지정
+    fear_greed_store.path = fear_greed_path
+
+
+def output_path(out_dir, symbol, period, interval, fmt):
+    return os.path.join(out_dir, f"{file_stem(symbol, period, interval)}.{fmt}")
+
+
+def render_symbol(symbol, period, interval, path, fmt):
+    """워커 프로세스: 캐시된 데이터로 지표 계산 후 이미지 저장"""
+    from technical_analysis import TechnicalAnalysis
+    from chart_renderer import chart_columns, prepare_chart_arrays
+
+    start = time.perf_counter()
+    result = {'symbol': symbol, 'path': path, 'error': None}
+    try:
+        data = _cache.load(symbol, period, interval, max_age=-1)
+        if data is None:
+            raise ValueError("캐시에 데이터가 없습니다")
+        indicators = TechnicalAnalysis(data, interval).calculate_all_indicators(chart_columns())
+        arrays = prepare_chart_arrays(data, indicators)
+        _renderer.render(arrays, f'{symbol} Stock Price ({period}, {interval})', path, fmt)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__} - {e}"
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+async def fetch_to_cache(symbols, period, interval, cache, on_ready, on_failed):
+    """캐시에 없는 종목을 비동기 수집기로 받아 디스크 캐시에 저장 (완료되는 순서대로 콜백)"""
+    from async_fetcher import AsyncFetcher
+
+    fetcher = AsyncFetcher()
+    try:
+        async for symbol, data in fetcher.stream_stock_data(symbols, period, interval):
+            if data is None:
+                on_failed(symbol)
+            else:
+                cache.save(symbol, period, interval, data)
+                on_ready(symbol)
+    finally:
+        fetcher.close()
+
+
+def render_batch(symbols, period, interval, fmt='png', out_dir=None, workers=None,
+                 size=None, dpi=None, cache_dir=None, max_age=None, progress=print):
+    """종목 목록을 이미지로 렌더링. 종목별 결과(dict) 목록 반환
+
+    캐시에 있는 종목은 바로 렌더링 풀로 보내고, 없는 종목은 수집되는 대로 이어서 보낸다.
+    """
+    out_dir = out_dir or config.BATCH_OUTPUT_DIR
+    width_px, height_px = size or config.BATCH_IMAGE_SIZE
+    dpi = dpi or config.BATCH_IMAGE_DPI
+    cache = DiskCache(cache_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    from fear_greed_store import fear_greed_store
+    if config.CHART_SHOW_FEAR_GREED:
+        # 렌더링 프로세스는 저장된 이력만 읽으므로 배치마다 한 번 갱신
+        fear_greed_store.refresh()
+
+    symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+    results = []
+
+    # Windows와 동작을 맞추고 수집 스레드와 fork가 섞이지 않도록 spawn 사용
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                             initargs=(width_px, height_px, dpi, cache.directory, fear_greed_store.path)) as pool:
+        renders = []
+
+        def submit(symbol):
+            path = output_path(out_dir, symbol, period, interval, fmt)
+            renders.append(pool.submit(render_symbol, symbol, period, interval, path, fmt))
+
+        missing = []
+        for symbol in symbols:
+            if cache.load(symbol, period, interval, max_age) is not None:
+                submit(symbol)
+            else:
+                missing.append(symbol)
+
+        if missing:
+            progress(f"수집 필요: {len(missing)}개 종목 (캐시 {len(symbols) - len(missing)}개)")
+
+            def failed(symbol):
+                results.append({'symbol': symbol, 'path': None,
+                                'error': "데이터를 가져올 수 없습니다", 'seconds': 0.0})
+
+            asyncio.run(fetch_to_cache(missing, period, interval, cache, submit, failed))
+
+        for done, future in enumerate(as_completed(renders), 1):
+            result = future.result()
+            results.append(result)
+            if result['error']:
+                progress(f"[{done}/{len(renders)}] ❌ {result['symbol']}: {result['error']}")
+            else:
+                progress(f"[{done}/{len(renders)}] {result['symbol']} → {result['path']} "
+                         f"({result['seconds']:.2f}s)")
+    return results
+
+
+def read_symbols(args):
+    symbols = list(args.symbols)
+    if args.symbols_file:
+        with open(args.symbols_file, encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    symbols.extend(line.replace(',', ' ').split())
+    return symbols
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="STRP 헤드리스 배치 차트 렌더링")
+    parser.add_argument('symbols', nargs='*', help="티커 심볼 목록")
+    parser.add_argument('--symbols-file', help="한 줄에 하나(또는 쉼표/공백 구분)씩 심볼이 적힌 파일")
+    parser.add_argument('--period', default=config.DEFAULT_PERIOD)
+    parser.add_argument('--interval', default=config.DEFAULT_INTERVAL)
+    parser.add_argument('--format', choices=FORMATS, default='png')
+    parser.add_argument('--out-dir', default=config.BATCH_OUTPUT_DIR)
+    parser.add_argument('--cache-dir', default=None, help="디스크 캐시 디렉터리 (기본: config.DISK_CACHE_DIR, --offline이면 임시 디렉터리)")
+    parser.add_argument('--workers', type=int, default=None, help="렌더링 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--size', default=None, help="이미지 크기 (예: 1400x800)")
+    parser.add_argument('--dpi', type=int, default=config.BATCH_IMAGE_DPI)
+    parser.add_argument('--max-age', type=float, default=None,
+                        help="캐시 유효 시간(초). 기본은 간격별 TTL, 음수면 오래된 캐시도 사용")
+    parser.add_argument('--offline', action='store_true',
+                        help="네트워크 대신 합성 데이터 사용 (benchmarks 스텁)")
+    args = parser.parse_args(argv)
+    args.size = tuple(int(v) for v in args.size.lower().split('x')) if args.size else None
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    symbols = read_symbols(args)
+    if not symbols:
+        print("렌더링할 심볼이 없습니다.")
+        return 1
+
+    if args.offline:
+        from benchmarks.stubs import offline_providers
+        providers = offline_providers()
+    else:
+        import contextlib
+        providers = contextlib.nullcontext()
+
+    start = time.perf_counter()
+    with providers:
+        results = render_batch(symbols, args.period, args.interval, args.format, args.out_dir,
+                               args.workers, args.size, args.dpi, args.cache_dir, args.max_age)
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if r['error']]
+    rendered = len(results) - len(failed)
+    print(f"\n완료: {rendered}/{len(results)}개 렌더링, 실패 {len(failed)}개, "
+          f"총 {elapsed:.1f}s ({rendered / elapsed if elapsed else 0:.1f} charts/s)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,374 @@
+"""오프라인 성능 벤치마크
+
+합성 OHLCV와 스텁 공급자만 사용하므로 네트워크 없이 CPU 전용 리눅스에서 실행된다.
+
+    python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --baseline bench.json --threshold 0.2
+"""
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import matplotlib
+
+from benchmarks.synthetic import make_ohlcv
+from benchmarks.stubs import offline_providers, StubTicker, stub_requests_get
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+FULL_SIZES = [1_000, 10_000, 100_000, 1_000_000, 5_000_000]
+
+
+def measure(func, repeat, number=1):
+    """func를 number번 실행하는 시간을 repeat회 측정 (1회당 초)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return times
+
+
+class BenchContext:
+    """벤치마크 간에 공유하는 데이터/위젯 (크기별 재사용)"""
+
+    def __init__(self, args):
+        self.args = args
+        self.frames = {}
+        self.indicators = {}
+        self._app = None
+        self._canvas = None
+
+    def frame(self, n):
+        if n not in self.frames:
+            self.frames[n] = make_ohlcv(n, self.args.interval, seed=self.args.seed)
+        return self.frames[n]
+
+    def indicator_frame(self, n):
+        if n not in self.indicators:
+            from technical_analysis import TechnicalAnalysis
+            self.indicators[n] = TechnicalAnalysis(self.frame(n), self.args.interval).calculate_all_indicators()
+        return self.indicators[n]
+
+    def app(self):
+        if self._app is None:
+            from PyQt5.QtWidgets import QApplication
+            self._app = QApplication.instance() or QApplication([])
+        return self._app
+
+    def canvas(self):
+        if self._canvas is None:
+            self.app()
+            from chart_canvas import ChartCanvas
+            self._canvas = ChartCanvas(width=14, height=8)
+            self._canvas.resize(1400, 800)
+        return self._canvas
+
+
+def bench_indicators(ctx, n):
+    from technical_analysis import TechnicalAnalysis
+    frame = ctx.frame(n)
+    return lambda: TechnicalAnalysis(frame, ctx.args.interval).calculate_all_indicators()
+
+
+def bench_chart_indicators(ctx, n):
+    """차트에 그리는 지표 열만 계산 (지표 계산 그래프가 필요한 노드만 실행)"""
+    from technical_analysis import TechnicalAnalysis
+    from chart_renderer import chart_columns
+    frame = ctx.frame(n)
+    return lambda: TechnicalAnalysis(frame, ctx.args.interval).calculate_all_indicators(chart_columns())
+
+
+def bench_prepare_chart(ctx, n):
+    from chart_renderer import prepare_chart_arrays
+    frame, indicators = ctx.frame(n), ctx.indicator_frame(n)
+    return lambda: prepare_chart_arrays(frame, indicators)
+
+
+def bench_render_headless(ctx, n):
+    from chart_renderer import prepare_chart_arrays, render_figure
+    arrays = prepare_chart_arrays(ctx.frame(n), ctx.indicator_frame(n))
+    return lambda: render_figure(arrays, 'BENCH', 1400, 800, 100)
+
+
+def bench_render_template(ctx, n):
+    from batch_render import ImageRenderer
+    from chart_renderer import prepare_chart_arrays
+    arrays = prepare_chart_arrays(ctx.frame(n), ctx.indicator_frame(n))
+    renderer = ImageRenderer(1400, 800, 100)
+    return lambda: renderer.render(arrays, 'BENCH', io.BytesIO(), 'png')
+
+
+def bench_plot_candlestick(ctx, n):
+    canvas = ctx.canvas()
+    frame, indicators = ctx.frame(n), ctx.indicator_frame(n)
+
+    def run():
+        canvas.plot_candlestick(frame, 'BENCH', indicators)
+        canvas.draw()
+    return run
+
+
+def bench_on_hover(ctx, n):
+    from matplotlib.backend_bases import MouseEvent
+    canvas = ctx.canvas()
+    canvas.plot_candlestick(ctx.frame(n), 'BENCH', ctx.indicator_frame(n))
+    canvas.draw()
+    rng = np.random.default_rng(ctx.args.seed)
+    transform = canvas.main_ax.transData
+    y = float(ctx.frame(n)['Close'].median())
+    events = []
+    for x in rng.integers(0, n, 50):
+        px, py = transform.transform((x, y))
+        events.append(MouseEvent('motion_notify_event', canvas, px, py))
+
+    def run():
+        for event in events:
+            canvas.on_hover(event)
+    return run
+
+
+def bench_indicator_table_scroll(ctx, n):
+    """봉 n개 지표 표를 50번 건너뛰며 스크롤하고 다시 그리기 (보이는 칸만 포맷하므로 n과 무관해야 함)"""
+    ctx.app()
+    from indicator_table import IndicatorTable
+    table = IndicatorTable()
+    table.resize(900, 600)
+    table.show()
+    table.set_frame(ctx.indicator_frame(n), intraday=ctx.args.interval.endswith(('m', 'h')))
+    ctx.app().processEvents()  # 창이 실제로 표시되어야 repaint가 그림
+    scroll = table.verticalScrollBar()
+    positions = np.random.default_rng(ctx.args.seed).integers(0, scroll.maximum() + 1, 50)
+
+    def run():
+        for position in positions:
+            scroll.setValue(int(position))
+            table.viewport().repaint()
+    return run
+
+
+def bench_vwap_profile(ctx, n):
+    """세션 VWAP + 밴드와 거래량 프로필 (가격대 config.VOLUME_PROFILE_BINS개)"""
+    from technical_analysis import TechnicalAnalysis
+    ta = TechnicalAnalysis(ctx.frame(n), ctx.args.interval)
+
+    def run():
+        ta.calculate_vwap()
+        ta.calculate_volume_profile()
+    return run
+
+
+def bench_fear_greed_asof(ctx, n):
+    """Fear & Greed 일별 이력(스텁 2000일)을 봉 n개에 as-of 조인"""
+    from fear_greed_store import asof_values, parse_readings
+    readings = parse_readings(stub_requests_get(None, params={'limit': 0}).json())
+    index = ctx.frame(n).index
+    return lambda: asof_values(readings, index, max_gap_days=3)
+
+
+def bench_alert_rules(ctx, n):
+    """종목 n개 패널에 규칙 100개 평가 (n은 봉 수가 아니라 종목 수)"""
+    from alerts import RuleSet, latest_rows
+    columns = ['RSI', 'Williams_R', 'MACD', 'MACD_Signal', 'Volume_Ratio', 'Close', 'MA20', 'MA50',
+               'BB_Upper', 'BB_Lower']
+    ops = ['>', '>=', '<', '<=', 'crosses_above', 'crosses_below']
+    rng = np.random.default_rng(ctx.args.seed)
+    rules = []
+    for k in range(100):
+        right = columns[(k + 3) % len(columns)] if k % 2 else f"{rng.uniform(-80, 150):.1f}"
+        rules.append((f"rule{k}", f"{columns[k % len(columns)]} {ops[k % len(ops)]} {right}"))
+    rule_set = RuleSet(rules)
+
+    # 실제 지표 프레임의 연속된 두 봉을 종목마다 무작위로 뽑아 패널 구성
+    indicators = ctx.indicator_frame(1_000)
+    values = np.vstack([latest_rows(indicators.iloc[:i + 1], rule_set.columns)[1]
+                        for i in range(len(indicators))])
+    picks = rng.integers(1, len(values), n)
+    last, prev = values[picks], values[picks - 1]
+    return lambda: rule_set.evaluate(last, prev)
+
+
+def bench_cross_asset_append(ctx, n):
+    """종목 min(n, 1000)개 × 5년 일봉 패널에 새 봉 20개 추가 후 상관계수/베타/상대 강도 계산
+
+    쌍별 합계 행렬이 종목 수의 제곱으로 커지므로 종목 수는 1000개에서 자른다.
+    """
+    from cross_asset import CrossAssetPanel
+    symbols = min(n, 1_000)
+    rng = np.random.default_rng(ctx.args.seed)
+    returns = rng.normal(0, 0.01, (1_280, symbols))
+    returns[:, 1:] += 0.5 * returns[:, [0]]
+    index = pd.bdate_range('2020-01-01', periods=len(returns))
+    closes = pd.DataFrame(100 * np.exp(np.cumsum(returns, axis=0)), index=index,
+                          columns=[f"S{i}" for i in range(symbols)])
+    history, new_bars = closes.iloc[:-20], closes.iloc[-20:]
+
+    def run():
+        panel = CrossAssetPanel(history, 'S0')
+        for timestamp, row in new_bars.iterrows():
+            panel.append(timestamp, row)
+        panel.correlation()
+        panel.betas()
+        panel.relative_strength()
+    return run
+
+
+def bench_symbol_search(ctx, n):
+    """심볼 n개 색인에서 자동 완성 검색 20개 (심볼 접두어, 회사 이름, 오타 섞어서, 1회당 20번)"""
+    from benchmarks.synthetic import make_symbols
+    from benchmarks.stubs import KNOWN_SYMBOLS
+    from symbol_index import SymbolIndex
+    index = SymbolIndex(make_symbols(n, ctx.args.seed) + KNOWN_SYMBOLS).prepare()
+    queries = ['A', 'AP', 'APP', 'AAPL', 'APPL', 'appl', 'apple', 'micro', 'micro sys', 'summit ther',
+               'NVDIA', 'GOOG', 'QQQQ', 'MSFTT', 'BRK-B', 'Z', 'ZZZZZ', 'alphabet', 'X', 'TSLA']
+
+    def run():
+        for query in queries:
+            index.search(query)
+    return run
+
+
+def bench_get_stock_data(ctx, n):
+    from data_fetcher import DataFetcher
+    StubTicker.frames[('BENCH', 'max', ctx.args.interval)] = ctx.frame(n)
+    fetcher = DataFetcher()
+    return lambda: fetcher.get_stock_data('BENCH', 'max', ctx.args.interval)
+
+
+# (이름, 함수, 렌더링 벤치마크 여부)
+BENCHMARKS = [
+    ('get_stock_data', bench_get_stock_data, False),
+    ('calculate_all_indicators', bench_indicators, False),
+    ('chart_indicators', bench_chart_indicators, False),
+    ('prepare_chart_arrays', bench_prepare_chart, False),
+    ('vwap_volume_profile', bench_vwap_profile, False),
+    ('fear_greed_asof', bench_fear_greed_asof, False),
+    ('alert_rules_x100', bench_alert_rules, False),
+    ('cross_asset_append_x20', bench_cross_asset_append, False),
+    ('symbol_search_x20', bench_symbol_search, False),
+    ('render_figure', bench_render_headless, True),
+    ('render_template_png', bench_render_template, True),
+    ('plot_candlestick', bench_plot_candlestick, True),
+    ('on_hover_x50', bench_on_hover, True),
+    ('indicator_table_scroll_x50', bench_indicator_table_scroll, False),
+]
+
+
+def run_all(args):
+    ctx = BenchContext(args)
+    results = {}
+    selected = set(args.only) if args.only else None
+    for n in args.sizes:
+        for name, factory, is_render in BENCHMARKS:
+            if selected and name not in selected:
+                continue
+            if is_render and n > args.render_max:
+                continue
+            key = f"{name}/{n}"
+            with contextlib.redirect_stdout(io.StringIO()):
+                func = factory(ctx, n)
+                func()  # 워밍업 (캐시, 폰트 로딩 등)
+                times = measure(func, args.repeat)
+            results[key] = {
+                'median_s': statistics.median(times),
+                'min_s': min(times),
+                'repeat': len(times),
+                'bars': n,
+            }
+            print(f"{key:<40} median {results[key]['median_s'] * 1000:10.2f} ms   "
+                  f"min {results[key]['min_s'] * 1000:10.2f} ms")
+    return results
+
+
+def environment_info(args):
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'matplotlib': matplotlib.__version__,
+        'interval': args.interval,
+        'seed': args.seed,
+    }
+
+
+def compare(results, baseline, threshold):
+    """기준 결과 대비 threshold(비율) 이상 느려진 항목 목록"""
+    regressions = []
+    print(f"\n{'benchmark':<40} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        ratio = current['median_s'] / previous['median_s'] if previous['median_s'] else float('inf')
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  << 느려짐'
+            regressions.append((key, ratio))
+        print(f"{key:<40} {previous['median_s'] * 1000:10.2f}ms {current['median_s'] * 1000:10.2f}ms "
+              f"{ratio:8.2f}{flag}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="STRP 오프라인 성능 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=None,
+                        help=f"막대 수 목록 (기본: {DEFAULT_SIZES})")
+    parser.add_argument('--full', action='store_true', help="5M 막대까지 측정")
+    parser.add_argument('--interval', default='1d', help="합성 데이터 간격 (1m ~ 1mo)")
+    parser.add_argument('--render-max', type=int, default=100_000,
+                        help="렌더링/호버 벤치마크를 수행할 최대 막대 수")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', nargs='+', help="특정 벤치마크만 실행")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="회귀 판정 비율 (0.2 = 20%% 이상 느려지면 실패)")
+    args = parser.parse_args(argv)
+    if args.sizes is None:
+        args.sizes = FULL_SIZES if args.full else DEFAULT_SIZES
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    warnings.filterwarnings('ignore')
+
+    with offline_providers():
+        results = run_all(args)
+
+    report = {'environment': environment_info(args), 'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건 (기준 {args.threshold:.0%} 초과)")
+            return 1
+        print("\n✅ 성능 회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
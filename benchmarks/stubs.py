@@ -0,0 +1,177 @@
+import contextlib
+import os
+import shutil
+import tempfile
+import time
+import zlib
+
+import pandas as pd
+
+import config
+import data_fetcher
+from benchmarks.synthetic import make_ohlcv, make_series, make_symbols, bars_for
+
+INVALID_SYMBOLS = {'INVALID', 'DELISTED'}
+# 스텁 심볼 디렉터리에 합성 심볼과 함께 넣는 실제 종목
+KNOWN_SYMBOLS = [
+    ('AAPL', 'Apple Inc.'), ('MSFT', 'Microsoft Corporation'), ('NVDA', 'NVIDIA Corporation'),
+    ('AMZN', 'Amazon.com, Inc.'), ('GOOGL', 'Alphabet Inc.'), ('META', 'Meta Platforms, Inc.'),
+    ('TSLA', 'Tesla, Inc.'), ('SPY', 'SPDR S&P 500 ETF Trust'), ('QQQ', 'Invesco QQQ Trust, Series 1'),
+    ('BRK-B', 'Berkshire Hathaway Inc.'),
+]
+
+
+def symbol_seed(symbol):
+    return zlib.crc32(symbol.encode('utf-8'))
+
+
+class StubTicker:
+    """yfinance.Ticker 대체 (네트워크 없이 합성 데이터 반환)"""
+    latency = 0.0
+    frames = {}
+
+    def __init__(self, symbol, session=None):
+        self.ticker = symbol
+
+    def history(self, period='1mo', interval='1d', start=None, end=None, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.ticker in INVALID_SYMBOLS:
+            return pd.DataFrame()
+        key = (self.ticker, period, interval)
+        frame = StubTicker.frames.get(key)
+        if frame is None:
+            frame = make_ohlcv(bars_for(period, interval), interval, seed=symbol_seed(self.ticker))
+            StubTicker.frames[key] = frame
+        return frame.copy()
+
+    @property
+    def info(self):
+        if self.ticker in INVALID_SYMBOLS:
+            return {}
+        close = self.history('5d', '1d')['Close'].iloc[-1]
+        return {
+            'longName': f'{self.ticker} Synthetic Inc.',
+            'currentPrice': close,
+            'regularMarketPrice': close,
+            'currency': 'USD',
+            'marketCap': 1_000_000_000,
+        }
+
+
+class StubFred:
+    """fredapi.Fred 대체"""
+    latency = 0.0
+
+    def __init__(self, api_key=None, **kwargs):
+        self.api_key = api_key
+
+    def get_series(self, series_id, observation_start=None, observation_end=None, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        series = make_series(252 * 30, seed=symbol_seed(series_id))
+        if observation_start is not None:
+            series = series[series.index >= pd.Timestamp(observation_start)]
+        if observation_end is not None:
+            series = series[series.index <= pd.Timestamp(observation_end)]
+        return series
+
+
+class StubResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+    @property
+    def text(self):
+        return self.payload
+
+
+def symbol_directory(n_symbols=5_000, seed=0):
+    """nasdaqtraded.txt 형식의 합성 심볼 디렉터리"""
+    lines = ['Nasdaq Traded|Symbol|Security Name|Listing Exchange|Test Issue']
+    rows = KNOWN_SYMBOLS + [(symbol, name) for symbol, name in make_symbols(n_symbols, seed)
+                            if symbol not in INVALID_SYMBOLS]
+    # 디렉터리는 클래스 주식을 '.'로 표기 (BRK.B)
+    lines += [f"Y|{symbol.replace('-', '.')}|{name} - Common Stock|Q|N" for symbol, name in rows]
+    lines.append('File Creation Time: 1231202400:00||||')
+    return '\n'.join(lines)
+
+
+def stub_requests_get(url, params=None, timeout=None, **kwargs):
+    """나스닥 심볼 디렉터리와 alternative.me Fear & Greed API 대체"""
+    if url == config.SYMBOL_INDEX_URL:
+        return StubResponse(symbol_directory())
+    limit = int((params or {}).get('limit', 1) or 0)
+    count = 2000 if limit == 0 else limit
+    now = int(pd.Timestamp('2024-12-31', tz='UTC').timestamp())
+    data = []
+    for i in range(count):
+        value = 50 + int(40 * ((i * 7919) % 100 - 50) / 50)
+        data.append({
+            'value': str(max(0, min(100, value))),
+            'value_classification': 'Neutral',
+            'timestamp': str(now - i * 86400),
+        })
+    return StubResponse({'data': data})
+
+
+def reset_provider_state():
+    """실패한 심볼 기억과 회로 차단기 상태 초기화 (스텁 전후의 결과가 섞이지 않도록)"""
+    data_fetcher.negative_cache.clear()
+    for breaker in data_fetcher.breakers.values():
+        breaker.success()
+
+
+@contextlib.contextmanager
+def offline_providers(latency=0.0):
+    """yfinance/FRED/alternative.me를 합성 데이터 스텁으로 바꾸고 속도 제한을 해제
+
+    디스크 캐시와 로컬 저장소(Fear & Greed, FRED, 심볼 색인)도 임시 디렉터리로 옮겨 합성
+    데이터가 실제 cache/에 남지 않게 하고, 끝나면 원래 경로로 되돌린 뒤 임시 디렉터리를 지운다.
+    """
+    from data_cache import shared_cache
+    from fear_greed_store import fear_greed_store
+    from fred_store import fred_store
+    from symbol_index import symbol_store
+
+    directory = tempfile.mkdtemp(prefix='strp-offline-')
+    fear_greed_path = os.path.join(directory, os.path.basename(config.FEAR_GREED_STORE_PATH))
+    fred_dir = os.path.join(directory, 'fred')
+    symbol_index_path = os.path.join(directory, os.path.basename(config.SYMBOL_INDEX_PATH))
+    patches = [
+        (data_fetcher.yf, 'Ticker', StubTicker),
+        (data_fetcher.fredapi, 'Fred', StubFred),
+        (data_fetcher.requests, 'get', stub_requests_get),
+        (data_fetcher, 'yahoo_limiter', data_fetcher.RateLimiter(1e9, 1e9)),
+        (config, 'FRED_API_KEY', config.FRED_API_KEY or 'offline'),
+        (config, 'DISK_CACHE_DIR', os.path.join(directory, 'cache')),
+        (config, 'CACHE_SPILL_DIR', os.path.join(directory, 'spill')),
+        (config, 'FEAR_GREED_STORE_PATH', fear_greed_path),
+        (config, 'FRED_STORE_DIR', fred_dir),
+        (config, 'SYMBOL_INDEX_PATH', symbol_index_path),
+        # 이미 만들어진 저장소/캐시 객체는 경로를 따로 들고 있으므로 같이 옮기고 읽어 둔 내용도 비움
+        (fear_greed_store, 'path', fear_greed_path),
+        (fear_greed_store, 'readings', None),
+        (fred_store, 'directory', fred_dir),
+        (fred_store, 'series', {}),
+        (symbol_store, 'path', symbol_index_path),
+        (symbol_store, '_index', None),
+        (shared_cache, '_disk', None),
+    ]
+    saved = [(target, name, getattr(target, name)) for target, name, _ in patches]
+    StubTicker.latency = latency
+    StubFred.latency = latency
+    for target, name, value in patches:
+        setattr(target, name, value)
+    reset_provider_state()
+    try:
+        yield
+    finally:
+        reset_provider_state()
+        for target, name, value in saved:
+            setattr(target, name, value)
+        shutil.rmtree(directory, ignore_errors=True)
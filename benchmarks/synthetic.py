@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+# 간격별 pandas 주기와 1년 기준 막대 수 (거래일 252일, 하루 390분 기준)
+INTERVAL_FREQ = {
+    '1m': ('min', 252 * 390),
+    '2m': ('2min', 252 * 195),
+    '5m': ('5min', 252 * 78),
+    '15m': ('15min', 252 * 26),
+    '30m': ('30min', 252 * 13),
+    '60m': ('60min', 252 * 7),
+    '90m': ('90min', 252 * 5),
+    '1h': ('60min', 252 * 7),
+    '1d': ('B', 252),
+    '5d': ('5B', 52),
+    '1wk': ('W-FRI', 52),
+    '1mo': ('MS', 12),
+    '3mo': ('QS', 4),
+}
+
+PERIOD_YEARS = {
+    '1d': 1 / 252, '5d': 5 / 252, '1mo': 1 / 12, '3mo': 0.25, '6mo': 0.5,
+    '1y': 1, '2y': 2, '5y': 5, '10y': 10, 'ytd': 0.75, 'max': 20,
+}
+
+
+def bars_for(period, interval):
+    """기간/간격 조합에 해당하는 대략적인 막대 수"""
+    _, per_year = INTERVAL_FREQ.get(interval, INTERVAL_FREQ['1d'])
+    return max(2, int(round(PERIOD_YEARS.get(period, 1) * per_year)))
+
+
+def make_ohlcv(n_bars, interval='1d', seed=0, start_price=100.0, annual_vol=0.3,
+               end='2024-12-31'):
+    """시드 고정 합성 OHLCV (기하 브라운 운동)
+
+    yfinance history()와 같은 열(Open/High/Low/Close/Volume/Dividends/Stock Splits)과
+    DatetimeIndex를 가진 DataFrame을 반환한다.
+    """
+    freq, per_year = INTERVAL_FREQ.get(interval, INTERVAL_FREQ['1d'])
+    rng = np.random.default_rng(seed)
+    sigma = annual_vol / np.sqrt(per_year)
+
+    log_returns = rng.normal(0.0, sigma, n_bars)
+    close = start_price * np.exp(np.cumsum(log_returns))
+    open_ = np.empty(n_bars)
+    open_[0] = start_price
+    open_[1:] = close[:-1] * np.exp(rng.normal(0.0, sigma * 0.2, n_bars - 1))
+    spread = np.abs(rng.normal(0.0, sigma, (2, n_bars))) * close
+    high = np.maximum(open_, close) + spread[0]
+    low = np.maximum(np.minimum(open_, close) - spread[1], 0.01)
+    volume = rng.lognormal(mean=13.0, sigma=0.5, size=n_bars).round()
+
+    index = pd.date_range(end=pd.Timestamp(end), periods=n_bars, freq=freq, tz='America/New_York')
+    return pd.DataFrame({
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Volume': volume,
+        'Dividends': 0.0,
+        'Stock Splits': 0.0,
+    }, index=index)
+
+
+def make_series(n_obs, seed=0, start_value=4.0, daily_vol=0.05, end='2024-12-31'):
+    """FRED 금리 시계열 흉내 (영업일 단위 랜덤워크)"""
+    rng = np.random.default_rng(seed)
+    values = start_value + np.cumsum(rng.normal(0.0, daily_vol, n_obs))
+    index = pd.date_range(end=pd.Timestamp(end), periods=n_obs, freq='B')
+    return pd.Series(values, index=index)
+
+
+NAME_WORDS = ['Alpha', 'Apex', 'Atlas', 'Blue', 'Bright', 'Capital', 'Cedar', 'Delta', 'Energy',
+              'First', 'Global', 'Harbor', 'Health', 'Logic', 'Micro', 'National', 'North', 'Pacific',
+              'Quantum', 'River', 'Solar', 'Summit', 'Systems', 'Therapeutics', 'United', 'Vertex']
+NAME_SUFFIXES = ['Inc.', 'Corp.', 'Holdings Inc.', 'Ltd.', 'Group Inc.', 'ETF']
+
+
+def make_symbols(n_symbols, seed=0):
+    """합성 (심볼, 회사 이름) 목록 (겹치지 않는 대문자 1~5글자 심볼)"""
+    rng = np.random.default_rng(seed)
+    symbols = set()
+    while len(symbols) < n_symbols:
+        letters = (rng.integers(0, 26, (n_symbols, 5)) + ord('A')).astype(np.uint8).tobytes()
+        lengths = rng.choice([1, 2, 3, 4, 5], size=n_symbols, p=[0.002, 0.02, 0.2, 0.5, 0.278])
+        for i, length in enumerate(lengths):
+            symbols.add(letters[i * 5:i * 5 + length].decode('ascii'))
+            if len(symbols) == n_symbols:
+                break
+    first = rng.integers(0, len(NAME_WORDS), n_symbols)
+    second = (first + rng.integers(1, len(NAME_WORDS), n_symbols)) % len(NAME_WORDS)
+    suffix = rng.integers(0, len(NAME_SUFFIXES), n_symbols)
+    return [(symbol, f"{NAME_WORDS[a]} {NAME_WORDS[b]} {NAME_SUFFIXES[c]}")
+            for symbol, a, b, c in zip(sorted(symbols), first, second, suffix)]
@@ -0,0 +1,192 @@
+import matplotlib
+matplotlib.use('Qt5Agg')
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from chart_renderer import prepare_chart_arrays, draw_chart, configure_fonts
+import metrics
+
+configure_fonts()
+
+
+class ChartCanvas(FigureCanvas):
+    """차트를 표시하는 캔버스"""
+    
+    def __init__(self, parent=None, width=10, height=6, dpi=100):
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        super().__init__(self.fig)
+        self.setParent(parent)
+        
+        self.arrays = None
+        self.symbol = None
+        self.indicators_data = None
+        self.main_ax = None
+        self.sub_axes = []
+        self.hover_line = None
+        self.hover_annotation = None
+        self._background = None
+        
+        self._connect_events()
+    
+    def _connect_events(self):
+        """Figure가 교체될 때마다 콜백이 초기화되므로 다시 연결"""
+        self.mpl_connect('motion_notify_event', self.on_hover)
+        self.mpl_connect('draw_event', self._on_draw)
+    
+    def draw(self):
+        with metrics.span('ui.draw'):
+            super().draw()
+    
+    def _on_draw(self, event):
+        """전체 그리기가 끝나면 호버 블리팅용 배경 저장"""
+        self._background = self.copy_from_bbox(self.figure.bbox)
+    
+    def render_size(self):
+        """워커 렌더링에 사용할 (가로 px, 세로 px, dpi)"""
+        width_px, height_px = self.get_width_height(physical=True)
+        return width_px, height_px, self.figure.dpi
+    
+    def plot_candlestick(self, data, symbol, indicators_data=None):
+        """캔들스틱 차트와 기술적 지표 그리기"""
+        self.plot_prepared(prepare_chart_arrays(data, indicators_data), symbol, indicators_data)
+    
+    def plot_prepared(self, arrays, symbol, indicators_data=None):
+        """워커에서 미리 계산한 배열로 차트 그리기"""
+        self.hover_line = None
+        self.hover_annotation = None
+        
+        if arrays is None:
+            self.fig.clear()
+            self.draw_idle()
+            return
+        
+        self.arrays = arrays
+        self.symbol = symbol
+        self.indicators_data = indicators_data
+        
+        self.main_ax, self.sub_axes = draw_chart(self.fig, arrays, symbol)
+        self.draw_idle()
+    
+    def adopt_rendered(self, rendered, arrays, symbol, indicators_data=None):
+        """워커에서 래스터화까지 끝난 Figure를 그대로 교체 (메인 스레드에서 다시 그리지 않음)"""
+        with metrics.span('ui.adopt'):
+            self._adopt_rendered(rendered, arrays, symbol, indicators_data)
+    
+    def _adopt_rendered(self, rendered, arrays, symbol, indicators_data):
+        agg_canvas = rendered['canvas']
+        fig = rendered['figure']
+        if (agg_canvas.get_width_height(physical=True) != self.get_width_height(physical=True)
+                or fig.dpi != self.figure.dpi):
+            # 렌더링 도중 창 크기가 바뀐 경우에는 메인 스레드에서 다시 그림
+            self.plot_prepared(arrays, symbol, indicators_data)
+            return
+        
+        original_dpi = self.figure._original_dpi
+        fig.set_canvas(self)
+        fig._original_dpi = original_dpi
+        self.figure = fig
+        self.fig = fig
+        self.renderer = agg_canvas.renderer
+        self._lastKey = agg_canvas._lastKey
+        self._connect_events()
+        
+        self.arrays = arrays
+        self.symbol = symbol
+        self.indicators_data = indicators_data
+        self.main_ax = rendered['main_ax']
+        self.sub_axes = rendered['sub_axes']
+        self.hover_line = None
+        self.hover_annotation = None
+        self._background = self.copy_from_bbox(fig.bbox)
+        self.update()
+    
+    def _clear_hover(self):
+        if self.hover_line:
+            self.hover_line.remove()
+            self.hover_line = None
+        if self.hover_annotation:
+            self.hover_annotation.remove()
+            self.hover_annotation = None
+    
+    def _blit_hover(self):
+        """배경을 복원하고 호버 요소만 다시 그림 (전체 다시 그리기 없음)"""
+        if self._background is None:
+            self.draw_idle()
+            return
+        with metrics.span('ui.hover'):
+            self.restore_region(self._background)
+            if self.hover_line:
+                self.main_ax.draw_artist(self.hover_line)
+            if self.hover_annotation:
+                self.main_ax.draw_artist(self.hover_annotation)
+            self.blit(self.figure.bbox)
+    
+    def on_hover(self, event):
+        """마우스 호버 이벤트 처리"""
+        if event.inaxes != self.main_ax or self.arrays is None:
+            if self.hover_line or self.hover_annotation:
+                self._clear_hover()
+                self._blit_hover()
+            return
+        
+        x_pos = event.xdata
+        if x_pos is None:
+            return
+        
+        idx = int(round(x_pos))
+        arrays = self.arrays
+        if idx < 0 or idx >= arrays['n']:
+            return
+        
+        date = arrays['index'][idx]
+        open_price = arrays['open'][idx]
+        high = arrays['high'][idx]
+        low = arrays['low'][idx]
+        close = arrays['close'][idx]
+        volume = arrays['volume'][idx]
+        
+        date_str = date.strftime('%Y-%m-%d %H:%M') if hasattr(date, 'strftime') else str(date)
+        
+        self._clear_hover()
+        
+        self.hover_line = self.main_ax.axvline(x=idx, color='gray', linestyle='--', 
+                                                linewidth=1, alpha=0.7, zorder=10,
+                                                animated=True)
+        
+        change = close - open_price
+        change_pct = (change / open_price) * 100 if open_price != 0 else 0
+        change_color = 'red' if change >= 0 else 'blue'
+        
+        info_text = f'{date_str}\n'
+        info_text += f'시가: ${open_price:.2f}\n'
+        info_text += f'고가: ${high:.2f}\n'
+        info_text += f'저가: ${low:.2f}\n'
+        info_text += f'종가: ${close:.2f}\n'
+        info_text += f'변화: ${change:+.2f} ({change_pct:+.2f}%)\n'
+        info_text += f'거래량: {volume:,.0f}'
+        
+        bbox_props = dict(boxstyle='round,pad=0.5', facecolor='wheat', 
+                         alpha=0.9, edgecolor=change_color, linewidth=2)
+        
+        x_range = self.main_ax.get_xlim()
+        if idx < (x_range[1] - x_range[0]) / 2:
+            x_offset = 50
+            ha = 'left'
+        else:
+            x_offset = -50
+            ha = 'right'
+        
+        self.hover_annotation = self.main_ax.annotate(
+            info_text,
+            xy=(idx, high),
+            xytext=(x_offset, 20),
+            textcoords='offset points',
+            bbox=bbox_props,
+            fontsize=9,
+            ha=ha,
+            va='bottom',
+            zorder=20,
+            animated=True
+        )
+        
+        self._blit_hover()
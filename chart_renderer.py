@@ -0,0 +1,376 @@
+import matplotlib
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.gridspec import GridSpec
+
+import config
+import metrics
+from technical_analysis import volume_profile
+
+CANDLE_WIDTH = 0.6
+UP_COLOR = 'red'
+DOWN_COLOR = 'blue'
+OVERLAY_STYLES = [
+    ('MA20', '-', 'MA20', 1.5, 0.8, 'orange'),
+    ('MA50', '-', 'MA50', 1.5, 0.8, 'green'),
+]
+BB_STYLES = [
+    ('BB_Upper', 'BB Upper', 'gray'),
+    ('BB_Middle', 'BB Middle', 'purple'),
+    ('BB_Lower', 'BB Lower', 'gray'),
+]
+VWAP_COLOR = 'teal'
+FEAR_GREED_COLOR = 'darkgoldenrod'
+# 거래량 프로필 막대가 차지하는 메인 패널 폭 비율 (오른쪽 끝 기준)
+PROFILE_WIDTH = 0.2
+
+
+def chart_columns():
+    """차트가 그리는 지표 열 (캐시/지표 계산 그래프가 이 열만 계산하도록 넘긴다)"""
+    columns = [column for column, _, _, _, _, _ in OVERLAY_STYLES]
+    columns += [column for column, _, _ in BB_STYLES]
+    columns += ['RSI', 'MACD', 'MACD_Signal', 'MACD_Histogram', 'Williams_R']
+    if config.CHART_SHOW_VWAP:
+        columns += ['VWAP', 'VWAP_Upper', 'VWAP_Lower']
+    if config.CHART_SHOW_FEAR_GREED:
+        columns.append('Fear_Greed')
+    return columns
+
+
+def _column(frame, name):
+    if frame is None or name not in frame.columns:
+        return None
+    return frame[name].to_numpy(dtype=float)
+
+
+def _bar_verts(x, bottom, top, width):
+    """막대(사각형) 꼭짓점 배열 생성 (N, 4, 2)"""
+    half = width / 2
+    verts = np.empty((len(x), 4, 2))
+    verts[:, 0, 0] = x - half
+    verts[:, 1, 0] = x - half
+    verts[:, 2, 0] = x + half
+    verts[:, 3, 0] = x + half
+    verts[:, 0, 1] = bottom
+    verts[:, 1, 1] = top
+    verts[:, 2, 1] = top
+    verts[:, 3, 1] = bottom
+    return verts
+
+
+@metrics.timed('chart.prepare')
+def prepare_chart_arrays(data, indicators_data=None):
+    """차트 렌더링에 필요한 배열을 미리 계산 (Qt/matplotlib 객체 없이 워커 스레드에서 실행 가능)"""
+    if data is None or len(data) == 0:
+        return None
+
+    open_ = data['Open'].to_numpy(dtype=float)
+    high = data['High'].to_numpy(dtype=float)
+    low = data['Low'].to_numpy(dtype=float)
+    close = data['Close'].to_numpy(dtype=float)
+    volume = data['Volume'].to_numpy(dtype=float)
+    n = len(close)
+    x = np.arange(n, dtype=float)
+
+    up = close >= open_
+    body_bottom = np.minimum(open_, close)
+    body_top = np.maximum(open_, close)
+    has_body = body_top > body_bottom
+    doji = ~has_body
+
+    arrays = {
+        'n': n,
+        'index': data.index,
+        'x': x,
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': volume,
+        'body_verts': _bar_verts(x[has_body], body_bottom[has_body], body_top[has_body], CANDLE_WIDTH),
+        'body_colors': np.where(up[has_body], UP_COLOR, DOWN_COLOR),
+        'doji_x': x[doji],
+        'doji_y': open_[doji],
+        'doji_colors': np.where(up[doji], UP_COLOR, DOWN_COLOR),
+        'has_indicators': indicators_data is not None,
+        'overlays': {},
+        'fear_greed': None,
+        'profile': None,
+    }
+
+    if config.CHART_SHOW_VOLUME_PROFILE:
+        profile = volume_profile(high, low, volume)
+        if profile is not None:
+            edges = profile['edges']
+            # 가격대별 막대를 오른쪽 끝에서 왼쪽으로 (세로 막대 꼭짓점의 x/y를 바꿔 가로 막대로)
+            right = n - 0.5
+            lengths = profile['volume'] / profile['volume'].max() * PROFILE_WIDTH * n
+            centers = (edges[:-1] + edges[1:]) / 2
+            verts = _bar_verts(centers, right - lengths, right, np.diff(edges))[..., ::-1]
+            in_value_area = (centers >= profile['value_area_low']) & (centers <= profile['value_area_high'])
+            arrays['profile'] = {
+                'verts': verts,
+                'colors': np.where(in_value_area, 'steelblue', 'lightgray'),
+                'poc': profile['poc'],
+                'value_area_low': profile['value_area_low'],
+                'value_area_high': profile['value_area_high'],
+            }
+
+    if indicators_data is not None:
+        for column, _, _, _, _, _ in OVERLAY_STYLES:
+            values = _column(indicators_data, column)
+            if values is not None:
+                arrays['overlays'][column] = values
+        if 'BB_Upper' in indicators_data.columns and 'BB_Lower' in indicators_data.columns:
+            for column, _, _ in BB_STYLES:
+                arrays['overlays'][column] = _column(indicators_data, column)
+
+        if config.CHART_SHOW_VWAP and 'VWAP' in indicators_data.columns:
+            for column in ('VWAP', 'VWAP_Upper', 'VWAP_Lower'):
+                arrays['overlays'][column] = _column(indicators_data, column)
+
+        arrays['rsi'] = _column(indicators_data, 'RSI')
+        arrays['macd'] = _column(indicators_data, 'MACD')
+        arrays['macd_signal'] = _column(indicators_data, 'MACD_Signal')
+        hist = _column(indicators_data, 'MACD_Histogram')
+        hist_valid = ~np.isnan(hist)
+        arrays['macd_hist_verts'] = _bar_verts(x[hist_valid], 0.0, hist[hist_valid], 0.8)
+        arrays['macd_hist_colors'] = np.where(hist[hist_valid] >= 0, 'green', 'red')
+        arrays['williams_r'] = _column(indicators_data, 'Williams_R')
+
+        fear_greed = _column(indicators_data, 'Fear_Greed') if config.CHART_SHOW_FEAR_GREED else None
+        if fear_greed is not None and not np.isnan(fear_greed).all():
+            # 저장소에 이력이 없으면(NaN뿐이면) 패널을 만들지 않음
+            arrays['fear_greed'] = fear_greed
+
+    return arrays
+
+
+def _draw_candles(ax, arrays):
+    """캔들 몸통/꼬리를 컬렉션 단위로 한 번에 그리기. 추가한 아티스트 목록 반환"""
+    artists = [ax.vlines(arrays['x'], arrays['low'], arrays['high'], color='black', linewidth=0.8, zorder=1)]
+    if len(arrays['body_verts']):
+        artists.append(ax.add_collection(PolyCollection(arrays['body_verts'], facecolors=arrays['body_colors'],
+                                                        edgecolors='black', linewidths=0.5, zorder=2)))
+    if len(arrays['doji_x']):
+        artists.append(ax.hlines(arrays['doji_y'], arrays['doji_x'] - 0.3, arrays['doji_x'] + 0.3,
+                                 colors=arrays['doji_colors'], linewidth=1.5, zorder=2))
+    ax.autoscale_view()
+    return artists
+
+
+def _draw_volume_profile(ax, profile, n):
+    """가격대별 거래량 막대와 POC/value area 가격선. 추가한 아티스트 목록 반환"""
+    artists = [ax.add_collection(PolyCollection(profile['verts'], facecolors=profile['colors'],
+                                                edgecolors='none', alpha=0.35, zorder=0))]
+    artists.append(ax.hlines(profile['poc'], -1, n, colors='darkred', linestyles='-', linewidth=1,
+                             alpha=0.6, label='POC', zorder=1))
+    artists.append(ax.hlines([profile['value_area_low'], profile['value_area_high']], -1, n,
+                             colors='steelblue', linestyles=':', linewidth=1, alpha=0.6, zorder=1))
+    return artists
+
+
+def configure_fonts():
+    """한글 폰트 설정 (Qt 캔버스와 헤드리스 렌더링 공용)"""
+    try:
+        matplotlib.rcParams['font.family'] = 'Malgun Gothic'  # Windows
+        matplotlib.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
+    except:
+        try:
+            matplotlib.rcParams['font.family'] = 'AppleGothic'  # Mac
+            matplotlib.rcParams['axes.unicode_minus'] = False
+        except:
+            pass  # 폰트 설정 실패해도 프로그램은 계속 실행
+
+
+def layout_key(arrays):
+    """축 구성을 결정하는 값 (같으면 ChartTemplate이 축을 재사용)"""
+    return arrays['has_indicators'], arrays['fear_greed'] is not None
+
+
+def build_layout(fig, has_indicators, has_fear_greed=False):
+    """축과 데이터와 무관한 고정 요소(기준선, 축 라벨, 격자)만 만들기. (main_ax, sub_axes) 반환"""
+    if has_indicators:
+        # 메인 차트를 더 크게 (3:1:1:1 비율, Fear & Greed 패널이 있으면 1 추가)
+        ratios = [3, 1, 1, 1] + ([1] if has_fear_greed else [])
+        gs = GridSpec(len(ratios), 1, figure=fig, height_ratios=ratios, hspace=0.3,
+                      left=0.07, right=0.98, top=0.95, bottom=0.06)
+        ax1 = fig.add_subplot(gs[0])
+        ax2 = fig.add_subplot(gs[1], sharex=ax1)
+        ax3 = fig.add_subplot(gs[2], sharex=ax1)
+        ax4 = fig.add_subplot(gs[3], sharex=ax1)
+
+        ax1.set_ylabel('Price ($)', fontsize=10)
+        ax1.grid(True, alpha=0.3, linestyle='--')
+        ax1.tick_params(labelbottom=False)
+
+        # RSI
+        ax2.axhline(y=config.RSI_OVERBOUGHT, color='r', linestyle='--', linewidth=1, alpha=0.5)
+        ax2.axhline(y=config.RSI_OVERSOLD, color='g', linestyle='--', linewidth=1, alpha=0.5)
+        ax2.axhspan(config.RSI_OVERBOUGHT, 100, alpha=0.1, color='red')
+        ax2.axhspan(0, config.RSI_OVERSOLD, alpha=0.1, color='green')
+        ax2.set_ylabel('RSI', fontsize=10)
+        ax2.set_ylim(0, 100)
+        ax2.grid(True, alpha=0.3, linestyle='--')
+        ax2.tick_params(labelbottom=False)
+
+        # MACD
+        ax3.axhline(y=0, color='black', linewidth=0.8)
+        ax3.set_ylabel('MACD', fontsize=10)
+        ax3.grid(True, alpha=0.3, linestyle='--')
+        ax3.tick_params(labelbottom=False)
+
+        # Williams %R
+        ax4.axhline(y=config.WILLIAMS_R_OVERBOUGHT, color='r', linestyle='--', linewidth=1, alpha=0.5)
+        ax4.axhline(y=config.WILLIAMS_R_OVERSOLD, color='g', linestyle='--', linewidth=1, alpha=0.5)
+        ax4.axhspan(config.WILLIAMS_R_OVERBOUGHT, 0, alpha=0.1, color='red')
+        ax4.axhspan(-100, config.WILLIAMS_R_OVERSOLD, alpha=0.1, color='green')
+        ax4.set_ylabel('Williams %R', fontsize=10)
+        ax4.set_ylim(-100, 0)
+        ax4.grid(True, alpha=0.3, linestyle='--')
+
+        if not has_fear_greed:
+            ax4.set_xlabel('Days', fontsize=10)
+            return ax1, [ax2, ax3, ax4]
+        ax4.tick_params(labelbottom=False)
+
+        # Fear & Greed (0 = 극단적 공포, 100 = 극단적 탐욕)
+        ax5 = fig.add_subplot(gs[4], sharex=ax1)
+        ax5.axhline(y=config.FEAR_GREED_EXTREME_GREED, color='r', linestyle='--', linewidth=1, alpha=0.5)
+        ax5.axhline(y=config.FEAR_GREED_EXTREME_FEAR, color='g', linestyle='--', linewidth=1, alpha=0.5)
+        ax5.axhspan(config.FEAR_GREED_EXTREME_GREED, 100, alpha=0.1, color='red')
+        ax5.axhspan(0, config.FEAR_GREED_EXTREME_FEAR, alpha=0.1, color='green')
+        ax5.set_ylabel('Fear & Greed', fontsize=10)
+        ax5.set_xlabel('Days', fontsize=10)
+        ax5.set_ylim(0, 100)
+        ax5.grid(True, alpha=0.3, linestyle='--')
+        return ax1, [ax2, ax3, ax4, ax5]
+
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.93, bottom=0.08)
+    ax = fig.add_subplot(111)
+    ax.set_ylabel('Price ($)', fontsize=11)
+    ax.set_xlabel('Days', fontsize=11)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    return ax, []
+
+
+def draw_series(main_ax, sub_axes, arrays, title):
+    """데이터에 따라 바뀌는 요소(캔들, 지표선, 범례, 제목) 그리기. 추가한 아티스트 목록 반환"""
+    n = arrays['n']
+    x = arrays['x']
+    artists = _draw_candles(main_ax, arrays)
+
+    if not arrays['has_indicators']:
+        if arrays['profile'] is not None:
+            artists += _draw_volume_profile(main_ax, arrays['profile'], n)
+        main_ax.set_title(title, fontsize=14, fontweight='bold')
+        main_ax.set_xlim(-1, n)
+        return artists
+
+    ax1 = main_ax
+    ax2, ax3, ax4 = sub_axes[:3]
+
+    overlays = arrays['overlays']
+    for column, style, label, linewidth, alpha, color in OVERLAY_STYLES:
+        if column in overlays:
+            artists += ax1.plot(x, overlays[column], style, label=label, linewidth=linewidth,
+                                alpha=alpha, color=color)
+
+    if 'BB_Upper' in overlays:
+        for column, label, color in BB_STYLES:
+            artists += ax1.plot(x, overlays[column], '--', label=label, linewidth=1, alpha=0.5, color=color)
+        artists.append(ax1.fill_between(x, overlays['BB_Upper'], overlays['BB_Lower'], alpha=0.1, color='purple'))
+
+    if 'VWAP' in overlays:
+        artists += ax1.plot(x, overlays['VWAP'], '-', label='VWAP', linewidth=1.2, alpha=0.8, color=VWAP_COLOR)
+        artists += ax1.plot(x, overlays['VWAP_Upper'], ':', label=f'VWAP ±{config.VWAP_BAND_STD:g}σ',
+                            linewidth=1, alpha=0.6, color=VWAP_COLOR)
+        artists += ax1.plot(x, overlays['VWAP_Lower'], ':', linewidth=1, alpha=0.6, color=VWAP_COLOR)
+
+    if arrays['profile'] is not None:
+        artists += _draw_volume_profile(ax1, arrays['profile'], n)
+
+    ax1.set_title(title, fontsize=13, fontweight='bold')
+    ax1.legend(loc='upper left', fontsize=8, ncol=2)
+    ax1.set_xlim(-1, n)
+
+    artists += ax2.plot(x, arrays['rsi'], label='RSI', color='purple', linewidth=1.5)
+    ax2.legend(loc='upper left', fontsize=8)
+
+    artists += ax3.plot(x, arrays['macd'], label='MACD', color='blue', linewidth=1.5)
+    artists += ax3.plot(x, arrays['macd_signal'], label='Signal', color='red', linewidth=1.5)
+    artists.append(ax3.add_collection(PolyCollection(arrays['macd_hist_verts'], facecolors=arrays['macd_hist_colors'],
+                                                     alpha=0.3, label='Histogram')))
+    ax3.autoscale_view(scalex=False)
+    ax3.legend(loc='upper left', fontsize=8)
+
+    artists += ax4.plot(x, arrays['williams_r'], label='Williams %R', color='orange', linewidth=1.5)
+    ax4.legend(loc='upper left', fontsize=8)
+
+    if len(sub_axes) > 3:
+        artists += sub_axes[3].plot(x, arrays['fear_greed'], label='Fear & Greed', color=FEAR_GREED_COLOR,
+                                    linewidth=1.5, drawstyle='steps-post')
+        sub_axes[3].legend(loc='upper left', fontsize=8)
+
+    return artists
+
+
+def draw_chart(fig, arrays, symbol, title=None):
+    """미리 계산된 배열로 캔들스틱 차트와 기술적 지표를 그리기. (main_ax, sub_axes) 반환"""
+    fig.clear()
+
+    if arrays is None:
+        return None, []
+
+    if title is None:
+        title = f'{symbol} Stock Price (마우스를 차트 위에 올려보세요)'
+    main_ax, sub_axes = build_layout(fig, *layout_key(arrays))
+    draw_series(main_ax, sub_axes, arrays, title)
+    return main_ax, sub_axes
+
+
+class ChartTemplate:
+    """축과 고정 요소를 유지한 채 데이터 요소만 바꿔 그리는 재사용 Figure
+
+    여러 차트를 연속으로 렌더링할 때 축/눈금을 매번 새로 만들지 않는다.
+    """
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.layout_key = None
+        self.main_ax = None
+        self.sub_axes = []
+        self.artists = []
+
+    def draw(self, arrays, title):
+        key = layout_key(arrays)
+        if self.layout_key != key:
+            self.fig.clear()
+            self.main_ax, self.sub_axes = build_layout(self.fig, *key)
+            self.layout_key = key
+        else:
+            for artist in self.artists:
+                artist.remove()
+            for ax in [self.main_ax] + self.sub_axes:
+                # 이전 차트의 데이터 범위가 자동 축척에 남지 않도록 초기화
+                ax.ignore_existing_data_limits = True
+        self.artists = draw_series(self.main_ax, self.sub_axes, arrays, title)
+        return self.main_ax, self.sub_axes
+
+
+def render_figure(arrays, symbol, width_px, height_px, dpi):
+    """Agg 백엔드로 새 Figure를 만들고 래스터화까지 수행 (워커 스레드/헤드리스 용)"""
+    fig = Figure(figsize=(width_px / dpi, height_px / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    with metrics.span('chart.layout'):
+        main_ax, sub_axes = draw_chart(fig, arrays, symbol)
+    with metrics.span('chart.rasterize'):
+        canvas.draw()
+    return {
+        'figure': fig,
+        'canvas': canvas,
+        'main_ax': main_ax,
+        'sub_axes': sub_axes,
+    }
@@ -8,6 +8,166 @@ MACD_FAST = 12
 MACD_SLOW = 26
 MACD_SIGNAL = 9
 WILLIAMS_R_PERIOD = 14
+BB_PERIOD = 20
+BB_STD_DEV = 2
+ATR_PERIOD = 14
+VOLUME_MA_PERIOD = 20
 
 DEFAULT_PERIOD = "1y"
 DEFAULT_INTERVAL = "1d"
+
+# 야후 파이낸스 요청 속도 제한 (모든 스레드 공유)
+YAHOO_REQUESTS_PER_SECOND = 2.0
+YAHOO_BURST = 4
+
+# 데이터가 없는(잘못되었거나 상장 폐지된) 심볼을 기억하는 시간. 그동안은 요청 없이 바로 실패
+NEGATIVE_CACHE_TTL = 60 * 60
+# 공급자별 회로 차단기: (연속 실패 횟수, 차단 시간(초)). 차단 중에는 요청 없이 바로 실패하고,
+# 차단 시간이 지나면 요청 하나만 시험 삼아 보낸다
+CIRCUIT_BREAKERS = {
+    'yahoo': (3, 60),
+    'fred': (3, 5 * 60),
+    'fng': (1, 5 * 60),
+    'nasdaq': (1, 30 * 60),
+}
+
+# 공유 데이터/지표 캐시
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL_INTRADAY = 60
+CACHE_TTL_DAILY = 15 * 60
+CACHE_TTL_INFO = 60 * 60
+# 메모리 캐시 예산 (넘으면 가장 오래 쓰지 않은 종목을 디스크 캐시로 내보냄)
+CACHE_MEMORY_BUDGET_MB = 256
+# 메모리 예산을 넘어 내보낸 항목을 저장하는 곳 (배치 렌더링의 DISK_CACHE_DIR과 따로 둠)
+CACHE_SPILL_DIR = "cache/spill"
+# float32로 바꿨을 때 가격 오차가 이 값 이하인 종목만 float32로 보관
+CACHE_FLOAT32_PRICE_ATOL = 1e-4
+
+# 지표 신호 기준값 (신호 분류와 기본 알림 규칙에 사용)
+RSI_OVERBOUGHT = 70
+RSI_OVERSOLD = 30
+WILLIAMS_R_OVERBOUGHT = -20
+WILLIAMS_R_OVERSOLD = -80
+VOLUME_SURGE_PCT = 150
+
+# 관심 종목(워치리스트)
+WATCHLIST_DEFAULT = ['AAPL', 'MSFT', 'NVDA', 'AMZN', 'GOOGL', 'META', 'TSLA', '005930.KS']
+WATCHLIST_PERIOD = "6mo"
+WATCHLIST_INTERVAL = "1d"
+WATCHLIST_MAX_CONCURRENCY = 4
+WATCHLIST_REFRESH_SEC = 60
+
+# 기술적 지표 탭의 전체 기간 표 (indicator_table.py): 처음에 보여줄 열 (머리글 우클릭으로 변경)
+INDICATOR_TABLE_COLUMNS = ['Close', 'Volume', 'RSI', 'MACD', 'Williams_R', 'ATR']
+INDICATOR_TABLE_COLUMN_WIDTH = 110
+
+# 경제 지표 탭: 이 시간(초)보다 오래된 데이터는 탭을 열 때 다시 조회
+ECONOMIC_REFRESH_SEC = 10 * 60
+
+# 유휴 시간 예측 프리페치 (다음에 볼 가능성이 높은 기간/간격을 미리 캐시)
+PREFETCH_ENABLED = True
+PREFETCH_IDLE_MS = 1500
+PREFETCH_MAX_PER_MINUTE = 8
+PREFETCH_TOKEN_RESERVE = 2
+PREFETCH_RECENT_SYMBOLS = 5
+
+# 핫패스 구간 시간 측정 (metrics.py). 끄면 측정 비용은 함수 호출 한 번 수준
+METRICS_ENABLED = True
+# 지정하면 프로그램 종료 시 측정 결과를 이 경로에 JSON으로 저장
+METRICS_EXPORT_PATH = None
+# 로그 레벨 (DEBUG로 바꾸면 요청/재시도 상세 로그 출력)
+LOG_LEVEL = "INFO"
+
+# 디스크 캐시 (배치 렌더링 등 프로세스 간에 공유하는 OHLCV 데이터)
+DISK_CACHE_DIR = "cache"
+
+# 배치 차트 렌더링 (batch_render.py)
+BATCH_OUTPUT_DIR = "charts"
+BATCH_IMAGE_SIZE = (1400, 800)
+BATCH_IMAGE_DPI = 100
+
+# 로컬 HTTP/JSON 서비스 (api_server.py)
+API_HOST = "127.0.0.1"
+API_PORT = 8765
+API_WORKERS = 4
+API_RESPONSE_CACHE_ENTRIES = 512
+API_KEEPALIVE_SEC = 15
+
+# 비동기 수집기 (async_fetcher.py) 공급자별 동시 요청 수
+# 야후는 요청 속도 제한(YAHOO_REQUESTS_PER_SECOND)을 채울 수 있을 만큼 여유 있게 둔다
+ASYNC_PROVIDER_CONCURRENCY = {
+    'yahoo': 8,
+    'fred': 2,
+    'fng': 2,
+}
+
+# FRED 시계열 로컬 저장소 (fred_store.py): 전체 이력을 저장하고 이후에는 새 관측치만 요청
+FRED_STORE_DIR = "cache/fred"
+FRED_REFRESH_SEC = 6 * 60 * 60
+FRED_US_SERIES = {
+    'nominal_rate': 'DGS10',
+    'real_rate': 'DFII10',
+}
+FRED_COUNTRY_SERIES = {
+    'US': 'DGS10',
+    'KR': 'IRLTLT01KRM156N',
+    'JP': 'IRLTLT01JPM156N',
+    'GB': 'IRLTLT01GBM156N',
+    'DE': 'IRLTLT01DEM156N'
+}
+
+# Fear & Greed 이력 저장소 (fear_greed_store.py): 처음에 전체 이력, 이후에는 마지막 저장일 이후만 요청
+FEAR_GREED_URL = "https://api.alternative.me/fng/"
+FEAR_GREED_STORE_PATH = "cache/fear_greed.pkl"
+FEAR_GREED_REFRESH_SEC = 6 * 60 * 60
+# 봉 시각보다 이만큼(일) 넘게 오래된 지수 값은 봉에 붙이지 않음 (NaN)
+FEAR_GREED_MAX_GAP_DAYS = 3
+
+# 티커 심볼 색인 (symbol_index.py): 나스닥 심볼 디렉터리를 로컬에 저장해 자동 완성과 검색 전 확인에 사용
+SYMBOL_INDEX_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqtraded.txt"
+SYMBOL_INDEX_PATH = "cache/symbols.csv"
+SYMBOL_INDEX_REFRESH_SEC = 7 * 24 * 60 * 60
+# 자동 완성 목록에 보여줄 후보 수
+SYMBOL_SUGGESTIONS = 8
+
+# 작업 공간 스냅샷 (session.py): 종료 시 저장하고 다음 실행 때 즉시 복원한 뒤 백그라운드에서 갱신
+SESSION_RESTORE_ENABLED = True
+SESSION_SNAPSHOT_PATH = "cache/session.pkl"
+
+# 관심 종목 알림 규칙 (alerts.py): (이름, "<지표 열> <연산자> <숫자 또는 지표 열>")
+# 연산자: > >= < <= crosses_above crosses_below, Volume_Ratio는 거래량 / 20일 평균(%)
+ALERT_RULES = [
+    ("RSI 과매수", f"RSI >= {RSI_OVERBOUGHT}"),
+    ("RSI 과매도", f"RSI <= {RSI_OVERSOLD}"),
+    ("Williams %R 과매수", f"Williams_R >= {WILLIAMS_R_OVERBOUGHT}"),
+    ("Williams %R 과매도", f"Williams_R <= {WILLIAMS_R_OVERSOLD}"),
+    ("MACD 골든크로스", "MACD crosses_above MACD_Signal"),
+    ("MACD 데드크로스", "MACD crosses_below MACD_Signal"),
+    ("거래량 급증", f"Volume_Ratio > {VOLUME_SURGE_PCT}"),
+]
+# 같은 종목/규칙 알림을 다시 보내지 않는 시간
+ALERT_COOLDOWN_SEC = 60 * 60
+# 관심 종목 탭에 남겨 둘 최근 알림 수
+ALERT_HISTORY = 100
+
+# 관심 종목 교차 분석 (cross_asset.py): 수익률 상관계수/베타 창, 상대 강도 기간(봉 수)
+CROSS_ASSET_WINDOW = 60
+CROSS_ASSET_MIN_PERIODS = 20
+CROSS_ASSET_RS_LOOKBACK = 63
+CROSS_ASSET_BENCHMARK = "SPY"
+
+# 저장된 봉 재생 부하 테스트 (replay.py): 갱신마다 다시 계산할 봉 수, 밀려 있어도 차트를 다시 그리는 최대 대기 시간
+REPLAY_WINDOW_BARS = 300
+REPLAY_MAX_STALE_MS = 500
+
+# 거래량 프로필/VWAP (technical_analysis.py): 가격대 수, value area 비율, VWAP 밴드 표준편차 배수
+VOLUME_PROFILE_BINS = 50
+VOLUME_PROFILE_VALUE_AREA = 0.70
+VWAP_BAND_STD = 2.0
+# 차트 메인 패널에 VWAP 밴드와 거래량 프로필 표시
+CHART_SHOW_VWAP = True
+CHART_SHOW_VOLUME_PROFILE = True
+# 차트 하단에 Fear & Greed 이력 패널 표시 (극단적 공포/탐욕 기준선)
+CHART_SHOW_FEAR_GREED = True
+FEAR_GREED_EXTREME_FEAR = 25
+FEAR_GREED_EXTREME_GREED = 75
@@ -0,0 +1,208 @@
+"""여러 종목 교차 분석 (수익률 상관계수 행렬, 벤치마크 대비 베타, 상대 강도 순위)
+
+    panel = CrossAssetPanel(align_closes(frames), benchmark='SPY')
+    panel.correlation()          # 최근 window개 봉의 수익률 상관계수 행렬
+    panel.betas()                # 벤치마크 대비 베타
+    panel.relative_strength()    # lookback 기간 수익률과 벤치마크 대비 순위
+    panel.append(timestamp, {'AAPL': 191.2, ...})   # 새 봉 추가 (창을 다시 계산하지 않음)
+
+상관계수와 베타는 창 안의 종목 쌍별 합계(관측 수, 합, 제곱합, 곱의 합)로 계산한다.
+새 봉이 들어오면 들어온 행을 더하고 창에서 빠지는 행을 빼는 것으로 합계를 갱신하므로
+봉 하나당 비용은 창 크기와 무관하게 종목 수의 제곱에 비례한다. 결측값은 쌍별로 제외한다
+(pandas DataFrame.corr()와 같은 방식).
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# 누적 덧셈/뺄셈 오차가 쌓이지 않도록 이 횟수마다 창 전체로 합계를 다시 계산
+RESYNC_EVERY = 500
+
+
+def align_closes(frames):
+    """종목 → OHLCV 프레임(또는 종가 Series) 사전을 날짜 × 종목 종가 패널로 정렬"""
+    closes = {}
+    for symbol, frame in frames.items():
+        if frame is None or len(frame) == 0:
+            continue
+        closes[symbol] = frame['Close'] if isinstance(frame, pd.DataFrame) else frame
+    if not closes:
+        return pd.DataFrame()
+    return pd.DataFrame(closes).sort_index().astype(float)
+
+
+def load_closes(symbols, period, interval, cache=None, workers=None):
+    """공유 캐시를 통해 여러 종목을 동시에 불러와 종가 패널과 불러오지 못한 종목 목록 반환"""
+    from data_cache import shared_cache
+    cache = cache or shared_cache
+    symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+
+    def load(symbol):
+        try:
+            # 종가만 쓰므로 지표는 계산하지 않음
+            return cache.load(symbol, period, interval, columns=())
+        except Exception as e:
+            logger.warning("%s 데이터를 불러오지 못했습니다: %s", symbol, e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers or config.WATCHLIST_MAX_CONCURRENCY,
+                            thread_name_prefix='cross-asset') as pool:
+        entries = dict(zip(symbols, pool.map(load, symbols)))
+    frames = {symbol: entry['data'] for symbol, entry in entries.items() if entry is not None}
+    missing = [symbol for symbol, entry in entries.items() if entry is None]
+    return align_closes(frames), missing
+
+
+class RollingMoments:
+    """최근 window개 행에 대한 종목 쌍별(둘 다 값이 있는 행만) 합계
+
+    count[i, j] = 관측 수, sum_x[i, j] = Σx_i, sum_xx[i, j] = Σx_i², sum_xy[i, j] = Σx_i·x_j
+    (모두 i와 j가 함께 있는 행에 대한 합이며 sum_x[j, i]가 같은 행에서의 Σx_j)
+    """
+
+    def __init__(self, n_columns, window):
+        self.window = window
+        self.values = np.zeros((window, n_columns))
+        self.mask = np.zeros((window, n_columns))
+        self.position = 0
+        self.filled = 0
+        self.pushes = 0
+        self.resync()
+
+    def extend(self, rows):
+        """여러 행을 한꺼번에 넣고 합계를 행렬 곱으로 다시 계산 (초기 적재용)"""
+        for row in rows[-self.window:]:
+            self._store(row)
+        self.resync()
+
+    def _store(self, row):
+        mask = ~np.isnan(row)
+        self.values[self.position] = np.where(mask, row, 0.0)
+        self.mask[self.position] = mask
+        self.position = (self.position + 1) % self.window
+        self.filled = min(self.filled + 1, self.window)
+
+    def push(self, row):
+        """새 행 추가, 창을 벗어나는 행은 제거 (O(종목 수²))"""
+        old = self.position
+        full = self.filled == self.window
+        old_values, old_mask = self.values[old].copy(), self.mask[old].copy()
+        self._store(row)
+        new_values, new_mask = self.values[old], self.mask[old]
+        if full:
+            # 들어온 행은 +, 빠지는 행은 -로 묶어 rank-2 행렬 곱 한 번씩으로 갱신
+            left = np.stack([new_values, old_values])
+            signed_mask = np.stack([new_mask, -old_mask])
+            signed_values = np.stack([new_values, -old_values])
+            masks = np.stack([new_mask, old_mask])
+        else:
+            left = new_values[None]
+            signed_mask = new_mask[None]
+            signed_values = new_values[None]
+            masks = new_mask[None]
+        stacked = np.hstack([masks, left, left * left])
+        self.by_mask += (stacked.T @ signed_mask).reshape(3, *self.sum_xy.shape)
+        self.sum_xy += left.T @ signed_values
+        self.pushes += 1
+        if self.pushes % RESYNC_EVERY == 0:
+            self.resync()
+
+    def resync(self):
+        values = self.values[:self.filled] if self.filled < self.window else self.values
+        mask = self.mask[:self.filled] if self.filled < self.window else self.mask
+        # count, sum_x, sum_xx는 모두 mask를 오른쪽에 곱하므로 한 배열에 모아 함께 갱신
+        self.by_mask = (np.hstack([mask, values, values * values]).T @ mask).reshape(3, -1, mask.shape[1])
+        self.count, self.sum_x, self.sum_xx = self.by_mask
+        self.sum_xy = values.T @ values
+
+
+class CrossAssetPanel:
+    """정렬된 종가 패널의 교차 분석 (새 봉은 append로 점진 갱신)"""
+
+    def __init__(self, closes, benchmark=None, window=None, min_periods=None, rs_lookback=None):
+        self.symbols = list(closes.columns)
+        self.benchmark = benchmark if benchmark in self.symbols else None
+        self.window = window or config.CROSS_ASSET_WINDOW
+        self.min_periods = min_periods or config.CROSS_ASSET_MIN_PERIODS
+        self.rs_lookback = rs_lookback or config.CROSS_ASSET_RS_LOOKBACK
+
+        values = closes.to_numpy(dtype=float)
+        # 결측 봉은 마지막 유효 종가로 채워 둔다 (결측 뒤 첫 수익률은 마지막 유효 종가 기준)
+        filled = closes.ffill().to_numpy(dtype=float)
+        self.timestamps = list(closes.index[-(self.rs_lookback + 1):])
+        self.recent_closes = filled[-(self.rs_lookback + 1):].copy()
+        self.last_close = filled[-1] if len(filled) else np.full(len(self.symbols), np.nan)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.diff(np.log(filled), axis=0)
+        returns[np.isnan(values[1:])] = np.nan
+        self.moments = RollingMoments(len(self.symbols), self.window)
+        self.moments.extend(returns)
+
+    @property
+    def as_of(self):
+        return self.timestamps[-1] if self.timestamps else None
+
+    def append(self, timestamp, closes):
+        """새 봉 종가(종목 → 가격 사전 또는 Series) 추가. 없는 종목은 결측으로 처리"""
+        row = np.array([closes.get(symbol, np.nan) for symbol in self.symbols], dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.log(row / self.last_close)
+        returns[~np.isfinite(returns)] = np.nan
+        self.moments.push(returns)
+        self.last_close = np.where(np.isnan(row), self.last_close, row)
+
+        self.recent_closes = np.vstack([self.recent_closes, self.last_close])[-(self.rs_lookback + 1):]
+        self.timestamps = (self.timestamps + [timestamp])[-(self.rs_lookback + 1):]
+
+    def correlation(self):
+        """수익률 상관계수 행렬 (관측 수가 min_periods 미만인 쌍은 NaN)"""
+        m = self.moments
+        n = m.count
+        sum_y = m.sum_x.T
+        sum_yy = m.sum_xx.T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = n * m.sum_xy - m.sum_x * sum_y
+            var_x = n * m.sum_xx - m.sum_x ** 2
+            var_y = n * sum_yy - sum_y ** 2
+            corr = cov / np.sqrt(var_x * var_y)
+        corr[(n < self.min_periods) | (var_x <= 0) | (var_y <= 0)] = np.nan
+        np.clip(corr, -1.0, 1.0, out=corr)
+        return pd.DataFrame(corr, index=self.symbols, columns=self.symbols)
+
+    def betas(self):
+        """벤치마크 수익률 대비 베타 (벤치마크가 없으면 빈 Series)"""
+        if self.benchmark is None:
+            return pd.Series(dtype=float)
+        m = self.moments
+        b = self.symbols.index(self.benchmark)
+        n = m.count[:, b]
+        sum_x = m.sum_x[:, b]          # 종목 수익률 합
+        sum_b = m.sum_x[b, :]          # 같은 행에서의 벤치마크 수익률 합
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = n * m.sum_xy[:, b] - sum_x * sum_b
+            var_b = n * m.sum_xx[b, :] - sum_b ** 2
+            beta = cov / var_b
+        beta[(n < self.min_periods) | (var_b <= 0)] = np.nan
+        return pd.Series(beta, index=self.symbols, name='beta')
+
+    def relative_strength(self):
+        """rs_lookback 기간 수익률(%)과 벤치마크 대비 초과 수익률(%), 순위 (1 = 가장 강함)"""
+        start, end = self.recent_closes[0], self.recent_closes[-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change = end / start - 1
+        result = pd.DataFrame({'return_pct': change * 100}, index=self.symbols)
+        if self.benchmark is not None:
+            bench = change[self.symbols.index(self.benchmark)]
+            result['vs_benchmark_pct'] = ((1 + change) / (1 + bench) - 1) * 100
+        else:
+            result['vs_benchmark_pct'] = np.nan
+        key = result['vs_benchmark_pct'] if self.benchmark is not None else result['return_pct']
+        result['rank'] = key.rank(ascending=False, method='min')
+        return result.sort_values('rank', na_position='last')
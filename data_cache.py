@@ -0,0 +1,356 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import config
+import metrics
+from data_fetcher import DataFetcher
+from fear_greed_store import fear_greed_store
+from technical_analysis import TechnicalAnalysis, INDICATOR_COLUMNS, INTRADAY_INTERVALS, with_columns
+
+logger = logging.getLogger(__name__)
+
+
+# 차트/지표에 쓰는 봉 열 (yfinance의 Dividends, Stock Splits 등은 버림)
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+BAR_COLUMNS = PRICE_COLUMNS + ['Volume']
+
+
+def make_key(symbol, period, interval):
+    return (symbol.upper(), period, interval)
+
+
+def ttl_for(interval):
+    """간격별 캐시 유효 시간(초)"""
+    return config.CACHE_TTL_INTRADAY if interval in INTRADAY_INTERVALS else config.CACHE_TTL_DAILY
+
+
+def compact_bars(data):
+    """봉 데이터 압축 (쓰지 않는 열 제거, 가격은 float32로 바꿔도 오차가
+    config.CACHE_FLOAT32_PRICE_ATOL 이내일 때만 float32, 거래량은 정수)"""
+    bars = data[[column for column in BAR_COLUMNS if column in data.columns]]
+    dtypes = {}
+
+    prices = [column for column in PRICE_COLUMNS if column in bars and bars[column].dtype == np.float64]
+    if prices:
+        values = bars[prices].to_numpy()
+        error = np.abs(values.astype(np.float32) - values)
+        error = error[~np.isnan(error)]
+        if not error.size or error.max() <= config.CACHE_FLOAT32_PRICE_ATOL:
+            dtypes.update({column: np.float32 for column in prices})
+
+    if 'Volume' in bars and bars['Volume'].dtype.kind in 'fiu':
+        volume = bars['Volume'].to_numpy()
+        if not volume.size:
+            pass
+        elif bars['Volume'].dtype.kind != 'f' or (not np.isnan(volume).any() and (volume == np.round(volume)).all()):
+            fits_int32 = volume.min() >= 0 and volume.max() <= np.iinfo(np.int32).max
+            dtypes['Volume'] = np.int32 if fits_int32 else np.int64
+
+    dtypes = {column: dtype for column, dtype in dtypes.items() if bars[column].dtype != dtype}
+    return bars.astype(dtypes) if dtypes else bars
+
+
+def share_bars(bars, data, indicators):
+    """지표 프레임의 OHLCV 열을 압축한 봉 데이터와 공유하도록 다시 구성
+
+    data는 지표를 계산할 때 쓴 원본이며, 지표 프레임에서 원본 열(Dividends 등 포함)을 빼고
+    지표 열만 bars 옆에 붙인다. 열과 인덱스는 복사하지 않고 그대로 참조한다.
+    """
+    studies = indicators.drop(columns=[column for column in data.columns if column in indicators.columns])
+    columns = {column: bars[column] for column in bars.columns}
+    columns.update((column, studies[column]) for column in studies.columns)
+    return pd.DataFrame(columns, index=bars.index, copy=False)
+
+
+def frame_nbytes(*frames):
+    """여러 프레임이 실제로 차지하는 메모리 (공유하는 열/인덱스는 한 번만 계산)"""
+    seen = set()
+    total = 0
+    for frame in frames:
+        if frame is None:
+            continue
+        if id(frame.index) not in seen:
+            seen.add(id(frame.index))
+            total += frame.index.memory_usage()
+        for column in frame.columns:
+            values = frame[column].to_numpy()
+            key = (values.__array_interface__['data'][0], values.nbytes)
+            if key not in seen:
+                seen.add(key)
+                total += values.nbytes
+    return total
+
+
+class DataCache:
+    """주가/지표 공유 캐시 (LRU + TTL, 스레드 안전)
+
+    메인 차트와 워치리스트가 같은 캐시를 사용하므로 같은 종목을 두 번
+    내려받거나 지표를 두 번 계산하지 않는다. 같은 키에 대한 동시 요청은
+    키별 잠금으로 하나의 로딩으로 합쳐진다.
+
+    봉 데이터는 압축해서 보관하고(compact_bars) 지표 프레임은 봉 열을 공유한다.
+    항목 수나 메모리 예산(config.CACHE_MEMORY_BUDGET_MB)을 넘으면 가장 오래 쓰지 않은
+    종목부터 디스크 캐시로 내보내고, 다시 필요하면 네트워크 대신 디스크에서 읽는다.
+    """
+
+    def __init__(self, max_entries=None, memory_budget_mb=None, spill_dir=None):
+        self.max_entries = max_entries or config.CACHE_MAX_ENTRIES
+        self.memory_budget = int((memory_budget_mb or config.CACHE_MEMORY_BUDGET_MB) * 1024 * 1024)
+        self.spill_dir = spill_dir
+        self._disk = None
+        self.memory_bytes = 0
+        self.stats = {'spilled': 0, 'disk_hits': 0}
+        self.entries = OrderedDict()
+        self.infos = {}
+        self.lock = threading.Lock()
+        self.key_locks = {}
+        self._local = threading.local()
+
+    def _fetcher(self):
+        # requests.Session은 스레드 간 공유하지 않도록 스레드마다 생성
+        fetcher = getattr(self._local, 'fetcher', None)
+        if fetcher is None:
+            fetcher = DataFetcher()
+            self._local.fetcher = fetcher
+        return fetcher
+
+    @property
+    def disk(self):
+        """내보낸 종목을 저장하는 디스크 캐시 (disk_cache가 이 모듈을 import하므로 처음 쓸 때 생성)"""
+        if self._disk is None:
+            from disk_cache import DiskCache
+            self._disk = DiskCache(self.spill_dir or config.CACHE_SPILL_DIR)
+        return self._disk
+
+    def _key_lock(self, key):
+        with self.lock:
+            lock = self.key_locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self.key_locks[key] = lock
+            return lock
+
+    def get(self, symbol, period, interval, max_age=None):
+        """유효한 캐시 항목 반환 (없으면 None)"""
+        key = make_key(symbol, period, interval)
+        max_age = ttl_for(interval) if max_age is None else max_age
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or time.time() - entry['fetched_at'] > max_age:
+                return None
+            self.entries.move_to_end(key)
+            return entry
+
+    def put(self, symbol, period, interval, data, indicators=None, fetched_at=None):
+        """캐시에 저장 (fetched_at: 다른 곳에서 복원한 데이터의 원래 수집 시각)"""
+        key = make_key(symbol, period, interval)
+        bars = compact_bars(data)
+        if indicators is not None:
+            indicators = share_bars(bars, data, indicators)
+        entry = {
+            'symbol': key[0],
+            'period': period,
+            'interval': interval,
+            'data': bars,
+            'indicators': indicators,
+            'fetched_at': fetched_at or time.time(),
+            'nbytes': frame_nbytes(bars, indicators),
+        }
+        evicted = []
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.memory_bytes -= previous['nbytes']
+            self.entries[key] = entry
+            self.memory_bytes += entry['nbytes']
+            while len(self.entries) > 1 and (len(self.entries) > self.max_entries
+                                             or self.memory_bytes > self.memory_budget):
+                old_key, old_entry = self.entries.popitem(last=False)
+                self.memory_bytes -= old_entry['nbytes']
+                self.key_locks.pop(old_key, None)
+                evicted.append(old_entry)
+        for old_entry in evicted:
+            self._spill(old_entry)
+        return entry
+
+    def _spill(self, entry):
+        """메모리에서 내보낸 항목을 디스크 캐시에 저장 (파일 시각은 원래 수집 시각)"""
+        try:
+            path = self.disk.save(entry['symbol'], entry['period'], entry['interval'], entry['data'])
+            os.utime(path, (entry['fetched_at'], entry['fetched_at']))
+            self.stats['spilled'] += 1
+        except OSError as e:
+            logger.warning("캐시 항목을 디스크로 내보내지 못했습니다 (%s): %s", entry['symbol'], e)
+
+    def _load_spilled(self, symbol, period, interval):
+        """디스크로 내보냈던 유효한 봉 데이터와 원래 수집 시각 (없으면 None, None)
+
+        spill 디렉터리에는 이 캐시가 내보낸 파일만 있으므로 다른 도구가 DISK_CACHE_DIR에 쓴 파일은 읽지 않는다.
+        """
+        age = self.disk.age(symbol, period, interval)
+        data = self.disk.load(symbol, period, interval)
+        if data is None or age is None:
+            return None, None
+        self.stats['disk_hits'] += 1
+        return data, time.time() - age
+
+    def _acquire(self, lock, cancel):
+        """키 잠금 획득 (대기 중에도 취소 확인)"""
+        if cancel is None:
+            lock.acquire()
+            return
+        while not lock.acquire(timeout=0.1):
+            cancel.check()
+
+    @staticmethod
+    def _refresh_stores(columns, present=(), cancel=None):
+        """새로 계산할 열이 로컬 저장소를 읽으면(Fear_Greed) 계산 전에 저장소를 최신으로 맞춤"""
+        if 'Fear_Greed' in columns and 'Fear_Greed' not in present:
+            fear_greed_store.refresh()
+            if cancel is not None:
+                cancel.check()
+
+    def _add_columns(self, key, entry, columns):
+        """캐시 항목에 없는 지표 열만 계산해 붙인 새 항목으로 교체 (키 잠금을 잡은 상태에서 호출)"""
+        base = entry['indicators'] if entry['indicators'] is not None else entry['data']
+        self._refresh_stores(columns, base.columns)
+        with metrics.span('indicators'):
+            indicators = with_columns(base, columns, entry['interval'])
+        updated = dict(entry, indicators=indicators, nbytes=frame_nbytes(entry['data'], indicators))
+        with self.lock:
+            # 그사이 교체/제거된 항목이면 계산 결과만 돌려준다
+            if self.entries.get(key) is entry:
+                self.entries[key] = updated
+                self.memory_bytes += updated['nbytes'] - entry['nbytes']
+        return updated
+
+    def add_columns(self, symbol, period, interval, indicators, columns, cancel=None):
+        """이미 받은 지표 프레임(indicators)에 없는 columns 열을 계산해 붙인 프레임
+
+        캐시 항목이 아직 그 프레임을 갖고 있으면 항목도 교체해 다음 로딩에서 다시 계산하지 않는다.
+        항목이 만료/교체된 뒤라도 새로 받지 않고 주어진 프레임으로 계산한다 (화면의 봉과 맞추기 위해).
+        """
+        if all(column in indicators.columns for column in columns):
+            return indicators
+        key = make_key(symbol, period, interval)
+        lock = self._key_lock(key)
+        self._acquire(lock, cancel)
+        try:
+            with self.lock:
+                entry = self.entries.get(key)
+            if entry is not None and entry['indicators'] is indicators:
+                return self._add_columns(key, entry, columns)['indicators']
+            self._refresh_stores(columns, indicators.columns, cancel)
+            with metrics.span('indicators'):
+                return with_columns(indicators, columns, interval)
+        finally:
+            lock.release()
+
+    @staticmethod
+    def _has_columns(entry, columns):
+        indicators = entry['indicators']
+        return not columns or (indicators is not None and all(c in indicators.columns for c in columns))
+
+    def load(self, symbol, period, interval, fetcher=None, cancel=None, columns=None):
+        """캐시에서 읽거나, 없으면 수집 후 지표까지 계산해 저장. 실패 시 None
+
+        columns는 호출한 화면이 쓰는 지표 열 (기본: 전체). 새로 불러올 때는 이 열만 계산하고,
+        캐시 항목에 없는 열은 그 열만 계산해 항목에 추가한다. Fear_Greed 열을 계산해야 하면
+        먼저 fear_greed_store를 갱신한다 (오래됐을 때만 요청).
+        cancel(CancelToken)이 취소되면 LoadCancelled가 발생한다.
+        """
+        columns = INDICATOR_COLUMNS if columns is None else list(columns)
+        entry = self.get(symbol, period, interval)
+        if entry is not None and self._has_columns(entry, columns):
+            return entry
+
+        key = make_key(symbol, period, interval)
+        lock = self._key_lock(key)
+        self._acquire(lock, cancel)
+        try:
+            # 잠금을 기다리는 동안 다른 스레드가 채웠을 수 있음
+            entry = self.get(symbol, period, interval)
+            if entry is not None:
+                if self._has_columns(entry, columns):
+                    return entry
+                return self._add_columns(key, entry, columns)
+
+            data, fetched_at = self._load_spilled(key[0], period, interval)
+            if data is None:
+                data = (fetcher or self._fetcher()).get_stock_data(key[0], period, interval, cancel=cancel)
+                if data is None:
+                    return None
+            if cancel is not None:
+                cancel.check()
+            self._refresh_stores(columns, cancel=cancel)
+            with metrics.span('indicators'):
+                indicators = TechnicalAnalysis(data, interval).calculate_all_indicators(columns)
+            return self.put(key[0], period, interval, data, indicators, fetched_at=fetched_at)
+        finally:
+            lock.release()
+
+    def load_info(self, symbol, fetcher=None, cancel=None, period=None, interval=None):
+        """종목 기본 정보 (config.CACHE_TTL_INFO 동안 재사용, period/interval은 get_stock_info로 전달)"""
+        symbol = symbol.upper()
+        with self.lock:
+            cached = self.infos.get(symbol)
+        if cached is not None and time.time() - cached[0] <= config.CACHE_TTL_INFO:
+            return cached[1]
+        info = (fetcher or self._fetcher()).get_stock_info(symbol, period, interval, cancel=cancel)
+        with self.lock:
+            self.infos[symbol] = (time.time(), info)
+        return info
+
+    def put_info(self, symbol, info, fetched_at=None):
+        with self.lock:
+            self.infos[symbol.upper()] = (fetched_at or time.time(), info)
+
+    def memory_report(self):
+        """종목별 메모리 사용량 (최근에 쓴 순서)
+
+        bars_bytes는 압축한 봉 데이터, indicator_bytes는 봉 열을 제외한 지표 열의 크기다.
+        """
+        with self.lock:
+            entries = list(self.entries.values())
+            total = self.memory_bytes
+        rows = []
+        for entry in reversed(entries):
+            bars_bytes = frame_nbytes(entry['data'])
+            rows.append({
+                'symbol': entry['symbol'],
+                'period': entry['period'],
+                'interval': entry['interval'],
+                'rows': len(entry['data']),
+                'bars_bytes': bars_bytes,
+                'indicator_bytes': entry['nbytes'] - bars_bytes,
+                'total_bytes': entry['nbytes'],
+            })
+        return {
+            'entries': rows,
+            'total_bytes': total,
+            'budget_bytes': self.memory_budget,
+            'spilled': self.stats['spilled'],
+            'disk_hits': self.stats['disk_hits'],
+        }
+
+    def invalidate(self, symbol=None):
+        """특정 종목(또는 전체) 캐시 삭제"""
+        with self.lock:
+            if symbol is None:
+                self.entries.clear()
+                self.infos.clear()
+                self.memory_bytes = 0
+                return
+            symbol = symbol.upper()
+            for key in [k for k in self.entries if k[0] == symbol]:
+                self.memory_bytes -= self.entries.pop(key)['nbytes']
+            self.infos.pop(symbol, None)
+
+
+shared_cache = DataCache()
@@ -1,22 +1,265 @@
-import yfinance as yf
-import pandas as pd
-import requests
-from datetime import datetime, timedelta
-from fredapi import Fred
 import config
+import contextlib
+import importlib
+import logging
 import time
+import threading
+import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class _LazyModule:
+    """처음 속성에 접근할 때 import하는 모듈 대리 객체 (프로그램 시작 시간 단축)"""
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+yf = _LazyModule('yfinance')
+requests = _LazyModule('requests')
+fredapi = _LazyModule('fredapi')
+
+
+class LoadCancelled(Exception):
+    """취소된(더 새로운 요청으로 대체된) 로딩 작업"""
+
+
+class CancelToken:
+    """로딩 작업 취소 플래그. 대기(sleep) 중에도 즉시 깨어난다"""
+    
+    def __init__(self):
+        self._event = threading.Event()
+    
+    def cancel(self):
+        self._event.set()
+    
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+    
+    def check(self):
+        if self._event.is_set():
+            raise LoadCancelled()
+    
+    def sleep(self, seconds):
+        if self._event.wait(seconds):
+            raise LoadCancelled()
+
+
+def wait(seconds, cancel=None):
+    """취소 가능한 대기"""
+    if cancel is None:
+        time.sleep(seconds)
+    else:
+        cancel.sleep(seconds)
+
+
+class RateLimiter:
+    """토큰 버킷 방식의 요청 속도 제한 (여러 스레드에서 공유)"""
+    
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def acquire(self, cancel=None):
+        """요청 1건을 보낼 수 있을 때까지 대기 (cancel이 취소되면 LoadCancelled)"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            with metrics.span('wait.ratelimit'):
+                wait(wait_time, cancel)
+    
+    def available(self):
+        """지금 바로 보낼 수 있는 요청 수 (대략)"""
+        with self.lock:
+            self._refill()
+            return self.tokens
+    
+    def try_acquire(self):
+        """대기 없이 토큰 1개 획득 시도"""
+        with self.lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+yahoo_limiter = RateLimiter(config.YAHOO_REQUESTS_PER_SECOND, config.YAHOO_BURST)
+
+
+class ProviderUnavailable(Exception):
+    """회로 차단기가 열려 있어 요청을 보내지 않음"""
+
+
+class CircuitBreaker:
+    """공급자별 회로 차단기 (여러 스레드에서 공유)
+
+    연속 실패가 threshold번이면 reset_sec 동안 열려(차단) 요청 없이 바로 실패한다.
+    그 뒤에는 시험 요청 하나만 통과시키고, 성공하면 닫히고 실패하면 다시 열린다.
+    """
+    
+    def __init__(self, name, threshold=None, reset_sec=None):
+        default_threshold, default_reset = config.CIRCUIT_BREAKERS.get(name, (3, 60))
+        self.name = name
+        self.threshold = threshold or default_threshold
+        self.reset_sec = reset_sec or default_reset
+        self.failures = 0
+        self.opened_at = None
+        self.trial_at = None
+        self.lock = threading.Lock()
+    
+    def allow(self):
+        """지금 요청을 보내도 되는지 (열린 상태에서 차단 시간이 지났으면 시험 요청 하나만 허용)"""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at < self.reset_sec:
+                return False
+            # 시험 요청이 결과를 알리지 못하고 끝났으면(취소 등) 차단 시간이 지난 뒤 다시 허용
+            if self.trial_at is not None and now - self.trial_at < self.reset_sec:
+                return False
+            self.trial_at = now
+            return True
+    
+    def success(self):
+        with self.lock:
+            if self.opened_at is not None:
+                logger.info("%s 요청 차단 해제", self.name)
+            self.failures = 0
+            self.opened_at = None
+            self.trial_at = None
+    
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_at is not None or (self.opened_at is None and self.failures >= self.threshold):
+                if self.opened_at is None:
+                    logger.warning("%s 요청이 %d번 연속 실패해 %d초 동안 차단합니다", self.name,
+                                   self.failures, self.reset_sec)
+                self.opened_at = time.monotonic()
+                self.trial_at = None
+    
+    @property
+    def is_open(self):
+        with self.lock:
+            return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_sec
+    
+    def retry_in(self):
+        """차단이 풀리기까지 남은 시간(초). 닫혀 있으면 0"""
+        with self.lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_sec - (time.monotonic() - self.opened_at))
+    
+    @contextlib.contextmanager
+    def guard(self):
+        """블록 안의 요청 결과를 기록 (차단 중이면 ProviderUnavailable)"""
+        if not self.allow():
+            raise ProviderUnavailable(f"{self.name} 요청 차단 중 ({self.retry_in():.0f}초 후 재시도)")
+        try:
+            yield
+        except LoadCancelled:
+            raise
+        except Exception:
+            self.failure()
+            raise
+        self.success()
+
+
+class NegativeCache:
+    """데이터가 없는 심볼 기억 (config.NEGATIVE_CACHE_TTL 동안 요청 없이 바로 실패)
+
+    빈 응답은 요청 제한 때문일 수도 있어 그 (기간, 간격)만 기억한다.
+    period/interval 없이 add하면 심볼 전체를 기억한다 (잘못된 심볼임이 확실할 때만).
+    """
+    
+    def __init__(self, ttl=None):
+        self.ttl = ttl or config.NEGATIVE_CACHE_TTL
+        self.entries = {}
+        self.lock = threading.Lock()
+    
+    def add(self, symbol, reason, period=None, interval=None):
+        key = (symbol.upper(), period, interval)
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, reason)
+    
+    def get(self, symbol, period=None, interval=None):
+        """기억된 실패 이유 (심볼 전체 또는 해당 기간/간격). 없으면 None"""
+        symbol = symbol.upper()
+        now = time.monotonic()
+        with self.lock:
+            for key in ((symbol, None, None), (symbol, period, interval)):
+                entry = self.entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] > now:
+                    return entry[1]
+                del self.entries[key]
+        return None
+    
+    def discard(self, symbol):
+        symbol = symbol.upper()
+        with self.lock:
+            for key in [key for key in self.entries if key[0] == symbol]:
+                del self.entries[key]
+    
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+negative_cache = NegativeCache()
+breakers = {name: CircuitBreaker(name) for name in config.CIRCUIT_BREAKERS}
+
 
 class DataFetcher:
     def __init__(self):
-        self.fred = None
-        if config.FRED_API_KEY != "b6e11573d0679dafc29142db963c4025":
-            try:
-                self.fred = Fred(api_key=config.FRED_API_KEY)
-            except:
-                print("FRED API 초기화 실패")
-        
-        self.session = requests.Session()
-        self.session.headers.update({
+        # FRED 클라이언트와 HTTP 세션은 처음 사용할 때 만든다
+        self._fred = None
+        self._fred_initialized = False
+        self._session = None
+    
+    @property
+    def fred(self):
+        if not self._fred_initialized:
+            self._fred_initialized = True
+            if config.FRED_API_KEY != "b6e11573d0679dafc29142db963c4025":
+                try:
+                    self._fred = fredapi.Fred(api_key=config.FRED_API_KEY)
+                except:
+                    logger.warning("FRED API 초기화 실패")
+        return self._fred
+    
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+    
+    def _create_session(self):
+        session = requests.Session()
+        session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
@@ -29,21 +272,30 @@ class DataFetcher:
             'Cache-Control': 'max-age=0'
         })
         
-        self.session.proxies = {}
-        self.session.verify = True
+        session.proxies = {}
+        session.verify = True
+        return session
     
-    def get_stock_data(self, symbol, period="1y", interval="1d"):
+    def get_stock_data(self, symbol, period="1y", interval="1d", cancel=None):
         try:
-            print(f"데이터 요청: {symbol}, period={period}, interval={interval}")
+            logger.info("데이터 요청: %s, period=%s, interval=%s", symbol, period, interval)
             
             intraday_intervals = ['1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h']
             short_periods = ['1d', '5d']
             
             if interval in intraday_intervals and period not in short_periods + ['1mo']:
-                print(f"경고: {interval} 간격은 짧은 기간(1d, 5d, 1mo)에서만 사용 가능합니다. 1mo로 변경합니다.")
+                logger.warning("%s 간격은 짧은 기간(1d, 5d, 1mo)에서만 사용 가능합니다. 1mo로 변경합니다.", interval)
                 period = '1mo'
             
-            time.sleep(1.5)
+            # 최근에 데이터가 없던 심볼이나 차단 중인 공급자는 요청(속도 제한 토큰 포함) 없이 바로 실패
+            reason = negative_cache.get(symbol, period, interval)
+            if reason is not None:
+                logger.info("❌ %s: %s (최근 확인, 요청 생략)", symbol, reason)
+                return None
+            breaker = breakers['yahoo']
+            if not breaker.allow():
+                logger.warning("야후 파이낸스 요청 차단 중 (%.0f초 후 재시도): %s", breaker.retry_in(), symbol)
+                return None
             
             stock = yf.Ticker(symbol)
             
@@ -52,67 +304,98 @@ class DataFetcher:
             
             for attempt in range(max_retries):
                 try:
-                    print(f"데이터 다운로드 시도 {attempt + 1}/{max_retries}...")
+                    logger.debug("데이터 다운로드 시도 %d/%d...", attempt + 1, max_retries)
+                    yahoo_limiter.acquire(cancel)
                     
-                    df = stock.history(
-                        period=period, 
-                        interval=interval
-                    )
+                    with metrics.span('fetch.history'):
+                        df = stock.history(
+                            period=period, 
+                            interval=interval
+                        )
+                    if cancel is not None:
+                        cancel.check()
                     
                     if not df.empty:
-                        print(f"받은 데이터: {len(df)} 행")
+                        # 요청 제한에 걸려도 빈 프레임이 오므로 데이터를 받았을 때만 성공으로 기록
+                        breaker.success()
+                        logger.info("받은 데이터: %d 행", len(df))
                         
                         if len(df) < 2:
-                            print(f"데이터가 너무 적음: {len(df)} 행")
+                            logger.warning("데이터가 너무 적음: %d 행", len(df))
                             return None
                         
                         return df
                     else:
-                        print(f"빈 데이터프레임 반환됨 - 심볼: {symbol} (시도 {attempt + 1}/{max_retries})")
+                        logger.warning("빈 데이터프레임 반환됨 - 심볼: %s (시도 %d/%d)", symbol, attempt + 1, max_retries)
                         
                         if attempt < max_retries - 1:
                             wait_time = retry_delay * (attempt + 1)
-                            print(f"{wait_time}초 대기 후 재시도...")
-                            time.sleep(wait_time)
+                            logger.info("%s초 대기 후 재시도...", wait_time)
+                            with metrics.span('wait.backoff'):
+                                wait(wait_time, cancel)
                         else:
-                            print(f"❌ {symbol}: 유효하지 않은 심볼이거나 데이터가 없습니다.")
+                            logger.error("❌ %s: 유효하지 않은 심볼이거나 데이터가 없습니다.", symbol)
+                            # 잘못된 심볼도 빈 프레임이므로 차단기에는 기록하지 않고(오타 몇 번에 전체가
+                            # 막히지 않도록), 요청 제한일 수도 있어 심볼 전체가 아닌 이 (기간, 간격)만 기억
+                            negative_cache.add(symbol, f"{period}/{interval} 데이터 없음", period, interval)
                             return None
                 
+                except LoadCancelled:
+                    raise
                 except Exception as inner_e:
                     error_str = str(inner_e)
-                    print(f"시도 {attempt + 1}/{max_retries} 실패: {error_str}")
+                    logger.warning("시도 %d/%d 실패: %s", attempt + 1, max_retries, error_str)
+                    breaker.failure()
+                    if breaker.is_open:
+                        logger.error("❌ 야후 파이낸스 요청이 계속 실패해 잠시 차단합니다: %s", symbol)
+                        return None
                     
                     if '429' in error_str or 'Too Many Requests' in error_str:
                         if attempt < max_retries - 1:
                             wait_time = retry_delay * (attempt + 2)  # 5초, 15초
-                            print(f"⚠️ Rate Limit 감지! {wait_time}초 대기 후 재시도...")
-                            time.sleep(wait_time)
+                            logger.warning("⚠️ Rate Limit 감지! %s초 대기 후 재시도...", wait_time)
+                            with metrics.span('wait.backoff'):
+                                wait(wait_time, cancel)
                         else:
-                            print("❌ 야후 파이낸스 접근 제한. 잠시 후 다시 시도하세요.")
+                            logger.error("❌ 야후 파이낸스 접근 제한. 잠시 후 다시 시도하세요.")
                             return None
                     else:
                         if attempt < max_retries - 1:
-                            print(f"{retry_delay}초 대기 후 재시도...")
-                            time.sleep(retry_delay)
+                            logger.info("%s초 대기 후 재시도...", retry_delay)
+                            with metrics.span('wait.backoff'):
+                                wait(retry_delay, cancel)
                         else:
                             raise
             
             return None
             
+        except LoadCancelled:
+            logger.info("요청 취소됨: %s", symbol)
+            raise
         except Exception as e:
-            print(f"주식 데이터 가져오기 실패 [{symbol}]: {type(e).__name__} - {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("주식 데이터 가져오기 실패 [%s]: %s - %s", symbol, type(e).__name__, e)
             return None
     
-    def get_stock_info(self, symbol):
+    def get_stock_info(self, symbol, period=None, interval=None, cancel=None):
+        """종목 기본 정보 (period/interval을 주면 그 봉 데이터가 최근 비어 있던 심볼은 요청 생략)"""
         try:
-            time.sleep(1)
+            if negative_cache.get(symbol, period, interval) is not None or breakers['yahoo'].is_open:
+                # 데이터가 없는 심볼이거나 야후 요청이 차단 중이면 요청 없이 기본 정보만
+                return {
+                    'symbol': symbol,
+                    'longName': symbol,
+                    'currentPrice': 'N/A',
+                    'regularMarketPrice': 'N/A',
+                    'currency': 'USD',
+                    'marketCap': 'N/A'
+                }
+            yahoo_limiter.acquire(cancel)
             
             stock = yf.Ticker(symbol)
             
             try:
-                stock_info = stock.info
+                with metrics.span('fetch.info'):
+                    stock_info = stock.info
                 info = {
                     'symbol': symbol,
                     'longName': stock_info.get('longName', stock_info.get('shortName', symbol)),
@@ -122,8 +405,10 @@ class DataFetcher:
                     'marketCap': stock_info.get('marketCap', 'N/A')
                 }
                 return info
-            except:
-                print(f"⚠️ {symbol} 상세 정보를 가져올 수 없습니다. 기본 정보만 표시합니다.")
+            except Exception as e:
+                if '429' in str(e) or 'Too Many Requests' in str(e):
+                    breakers['yahoo'].failure()
+                logger.warning("⚠️ %s 상세 정보를 가져올 수 없습니다. 기본 정보만 표시합니다.", symbol)
                 return {
                     'symbol': symbol,
                     'longName': symbol,
@@ -133,8 +418,10 @@ class DataFetcher:
                     'marketCap': 'N/A'
                 }
             
+        except LoadCancelled:
+            raise
         except Exception as e:
-            print(f"주식 정보 가져오기 실패: {e}")
+            logger.error("주식 정보 가져오기 실패: %s", e)
             return {
                 'symbol': symbol,
                 'longName': symbol,
@@ -151,20 +438,23 @@ class DataFetcher:
         }
         
         if self.fred:
-            try:
-                nominal_rate_series = self.fred.get_series('DGS10', 
-                                                           observation_start=datetime.now() - timedelta(days=30))
-                result['nominal_rate'] = nominal_rate_series.iloc[-1] if not nominal_rate_series.empty else None
-                
-                real_rate_series = self.fred.get_series('DFII10', 
-                                                         observation_start=datetime.now() - timedelta(days=30))
-                result['real_rate'] = real_rate_series.iloc[-1] if not real_rate_series.empty else None
-            except Exception as e:
-                result['error'] = f'미국 금리 데이터 가져오기 실패: {str(e)}'
+            from fred_store import fred_store, latest_value
+            # 명목/실질 금리 시계열을 동시에 갱신 (저장소에 있으면 새 관측치만 요청)
+            series = fred_store.refresh(config.FRED_US_SERIES.values(), self.fred)
+            errors = []
+            for key, series_id in config.FRED_US_SERIES.items():
+                value = series.get(series_id)
+                if isinstance(value, Exception):
+                    errors.append(str(value))
+                else:
+                    result[key] = latest_value(value)
+            if errors:
+                result['error'] = f'미국 금리 데이터 가져오기 실패: {errors[0]}'
         else:
             result['error'] = 'FRED API 키가 설정되지 않았습니다.'
         
         try:
+            yahoo_limiter.acquire()
             kr_bond = yf.Ticker("KR10YT=X")
             kr_info = kr_bond.info
             if 'regularMarketPrice' in kr_info:
@@ -181,21 +471,20 @@ class DataFetcher:
         return result
     
     def get_fear_greed_index(self):
+        from fear_greed_store import fear_greed_store
         try:
-            url = "https://api.alternative.me/fng/"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'data' in data and len(data['data']) > 0:
-                    fng_data = data['data'][0]
-                    return {
-                        'value': int(fng_data['value']),
-                        'classification': fng_data['value_classification'],
-                        'timestamp': fng_data['timestamp'],
-                        'note': '암호화폐 Fear & Greed Index (참고용)',
-                        'error': None
-                    }
+            # 저장소에 이력이 있으면 새 값만 요청 (config.FEAR_GREED_REFRESH_SEC 안에서는 요청 없음)
+            fear_greed_store.update()
+            latest = fear_greed_store.latest()
+            if latest is not None:
+                timestamp, value, classification = latest
+                return {
+                    'value': int(value),
+                    'classification': classification,
+                    'timestamp': str(int(timestamp.timestamp())),
+                    'note': '암호화폐 Fear & Greed Index (참고용)',
+                    'error': None
+                }
             
             return {
                 'value': None,
@@ -209,6 +498,12 @@ class DataFetcher:
                 'error': f'Fear & Greed Index 가져오기 실패: {str(e)}'
             }
     
+    def get_fear_greed_history(self, start=None):
+        """저장소의 Fear & Greed 이력 (value, classification). 저장소가 오래됐을 때만 요청"""
+        from fear_greed_store import fear_greed_store
+        fear_greed_store.update()
+        return fear_greed_store.history(start=start)
+    
     def get_country_rates(self, country_code):
         if not self.fred:
             return {
@@ -216,15 +511,7 @@ class DataFetcher:
                 'error': 'FRED API 키가 설정되지 않았습니다.'
             }
         
-        series_map = {
-            'US': 'DGS10',
-            'KR': 'IRLTLT01KRM156N',
-            'JP': 'IRLTLT01JPM156N',
-            'GB': 'IRLTLT01GBM156N',
-            'DE': 'IRLTLT01DEM156N'
-        }
-        
-        series_code = series_map.get(country_code.upper())
+        series_code = config.FRED_COUNTRY_SERIES.get(country_code.upper())
         
         if not series_code:
             return {
@@ -232,13 +519,11 @@ class DataFetcher:
                 'error': f'{country_code} 국가의 금리 데이터를 사용할 수 없습니다.'
             }
         
+        from fred_store import fred_store, latest_value
         try:
-            rate_series = self.fred.get_series(series_code, 
-                                               observation_start=datetime.now() - timedelta(days=90))
-            rate = rate_series.iloc[-1] if not rate_series.empty else None
-            
+            rate_series = fred_store.update(series_code, self.fred)
             return {
-                'rate': rate,
+                'rate': latest_value(rate_series),
                 'series_code': series_code,
                 'error': None
             }
@@ -247,3 +532,32 @@ class DataFetcher:
                 'rate': None,
                 'error': f'금리 데이터 가져오기 실패: {str(e)}'
             }
+    
+    def get_all_country_rates(self, country_codes=None):
+        """설정된 모든 국가(또는 지정한 국가)의 금리를 한 번에 동시 갱신. 국가 코드 → get_country_rates 형식"""
+        codes = [c.upper() for c in (country_codes or config.FRED_COUNTRY_SERIES)]
+        if not self.fred:
+            return {code: self.get_country_rates(code) for code in codes}
+        
+        from fred_store import fred_store, latest_value
+        series_codes = {code: config.FRED_COUNTRY_SERIES.get(code) for code in codes}
+        series = fred_store.refresh([s for s in series_codes.values() if s], self.fred)
+        result = {}
+        for code, series_code in series_codes.items():
+            if not series_code:
+                result[code] = {'rate': None, 'error': f'{code} 국가의 금리 데이터를 사용할 수 없습니다.'}
+            elif isinstance(series[series_code], Exception):
+                result[code] = {'rate': None, 'error': f'금리 데이터 가져오기 실패: {series[series_code]}'}
+            else:
+                result[code] = {'rate': latest_value(series[series_code]), 'series_code': series_code, 'error': None}
+        return result
+    
+    def get_rate_history(self, series_or_country, start=None):
+        """저장소의 금리 이력 (국가 코드 또는 FRED 시계열 ID). 저장소가 비어 있을 때만 요청"""
+        from fred_store import fred_store
+        series_code = config.FRED_COUNTRY_SERIES.get(series_or_country.upper(), series_or_country)
+        history = fred_store.history(series_code, start=start)
+        if history.empty and self.fred:
+            fred_store.update(series_code, self.fred)
+            history = fred_store.history(series_code, start=start)
+        return history
@@ -0,0 +1,65 @@
+import os
+import re
+import threading
+import time
+
+import pandas as pd
+
+import config
+from data_cache import make_key, ttl_for
+
+
+def file_stem(symbol, period, interval):
+    """파일 이름으로 쓸 수 있는 '심볼_기간_간격' (^GSPC, KRW=X 같은 기호는 _로 치환)"""
+    symbol, period, interval = make_key(symbol, period, interval)
+    return f"{re.sub(r'[^A-Za-z0-9._-]', '_', symbol)}_{period}_{interval}"
+
+
+class DiskCache:
+    """OHLCV 디스크 캐시 (종목/기간/간격별 pickle 파일)
+
+    여러 프로세스가 동시에 읽을 수 있도록 임시 파일에 쓴 뒤 교체한다.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or config.DISK_CACHE_DIR
+
+    def path_for(self, symbol, period, interval):
+        return os.path.join(self.directory, f"{file_stem(symbol, period, interval)}.pkl")
+
+    def age(self, symbol, period, interval):
+        """캐시 파일이 만들어진 뒤 지난 시간(초). 없으면 None"""
+        try:
+            return time.time() - os.path.getmtime(self.path_for(symbol, period, interval))
+        except OSError:
+            return None
+
+    def load(self, symbol, period, interval, max_age=None):
+        """유효한 캐시 데이터 반환 (없거나 오래됐으면 None)
+
+        max_age가 None이면 간격별 기본 TTL, 음수이면 오래돼도 사용한다.
+        """
+        age = self.age(symbol, period, interval)
+        if age is None:
+            return None
+        max_age = ttl_for(interval) if max_age is None else max_age
+        if 0 <= max_age < age:
+            return None
+        try:
+            return pd.read_pickle(self.path_for(symbol, period, interval))
+        except Exception:
+            return None
+
+    def save(self, symbol, period, interval, data):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(symbol, period, interval)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        data.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+        return path
+
+    def remove(self, symbol, period, interval):
+        try:
+            os.remove(self.path_for(symbol, period, interval))
+        except OSError:
+            pass
@@ -0,0 +1,216 @@
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import config
+import metrics
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ['value', 'classification']
+
+
+def _utc_ns(index):
+    """DatetimeIndex → UTC 기준 나노초 배열 (시간대가 없으면 UTC로 간주)"""
+    index = index.tz_convert('UTC') if index.tz is not None else index.tz_localize('UTC')
+    return index.as_unit('ns').asi8
+
+
+def _utc_timestamp(value):
+    timestamp = pd.Timestamp(value)
+    return timestamp.tz_convert('UTC') if timestamp.tz is not None else timestamp.tz_localize('UTC')
+
+
+def parse_readings(payload):
+    """alternative.me 응답 → 날짜(UTC) 순으로 정렬한 value/classification 프레임"""
+    rows = pd.DataFrame(payload.get('data') or [])
+    if rows.empty:
+        return pd.DataFrame(columns=COLUMNS, index=pd.DatetimeIndex([], tz='UTC'))
+    index = pd.to_datetime(rows['timestamp'].astype(np.int64), unit='s', utc=True)
+    readings = pd.DataFrame({
+        'value': rows['value'].astype(float).to_numpy(),
+        'classification': rows['value_classification'].to_numpy(),
+    }, index=pd.DatetimeIndex(index, name='timestamp'))
+    return readings[~readings.index.duplicated(keep='last')].sort_index()
+
+
+def asof_values(readings, index, max_gap_days=None):
+    """각 봉 시각 이전의 마지막 지수 값 배열 (searchsorted 한 번으로 as-of 조인)
+
+    max_gap_days보다 오래된 값밖에 없는 봉과 이력 시작 전의 봉은 NaN.
+    """
+    result = np.full(len(index), np.nan)
+    if readings.empty or not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
+        return result
+    max_gap_days = config.FEAR_GREED_MAX_GAP_DAYS if max_gap_days is None else max_gap_days
+    observed = _utc_ns(readings.index)
+    bars = _utc_ns(index)
+    position = np.searchsorted(observed, bars, side='right') - 1
+    found = position >= 0
+    position = np.maximum(position, 0)
+    fresh = bars - observed[position] <= max_gap_days * 86_400 * 10**9
+    keep = found & fresh
+    result[keep] = readings['value'].to_numpy(dtype=float)[position[keep]]
+    return result
+
+
+class FearGreedStore:
+    """Fear & Greed Index 전체 이력 로컬 저장소
+
+    처음에는 전체 이력을 내려받고, 이후에는 마지막 저장일 이후의 값만 요청해 이어 붙인다.
+    config.FEAR_GREED_REFRESH_SEC 안에 확인했으면 요청하지 않는다 (파일 수정 시각 기준).
+    출처 표시가 없는 파일은 쓰지 않고, 이어 받을 때는 마지막 저장일부터 요청해 겹치는 날의 값이
+    저장된 값과 다르면 저장된 이력을 버리고 전체 이력을 다시 받는다.
+
+    technical_analysis의 Fear_Greed 지표 열(INDICATOR_COLUMNS)은 이 파일의 이력을 봉에
+    맞춘 값이라, 파일이 잘못되면 그 열도 잘못된다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or config.FEAR_GREED_STORE_PATH
+        self.readings = None
+        self.lock = threading.Lock()
+        self.update_lock = threading.Lock()
+
+    def checked_age(self):
+        """마지막으로 확인한 뒤 지난 시간(초). 저장된 적 없으면 None"""
+        try:
+            return time.time() - os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def load(self):
+        """저장된 이력 (없으면 빈 프레임)"""
+        with self.lock:
+            if self.readings is not None:
+                return self.readings
+        try:
+            readings = pd.read_pickle(self.path)
+        except Exception:
+            readings = parse_readings({})
+        if readings.attrs.get('source') != config.FEAR_GREED_URL:
+            # 다른 곳에서 받은(또는 출처를 모르는) 이력은 쓰지 않고 전체를 다시 받음
+            readings = parse_readings({})
+        with self.lock:
+            self.readings = readings
+        return readings
+
+    def _save(self, readings):
+        readings.attrs['source'] = config.FEAR_GREED_URL
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        readings.to_pickle(tmp_path)
+        os.replace(tmp_path, self.path)
+        with self.lock:
+            self.readings = readings
+
+    def _touch(self):
+        try:
+            os.utime(self.path)
+        except OSError:
+            pass
+
+    def _fetch(self, limit):
+        # data_fetcher의 지연 import 대리 객체를 써서 오프라인 스텁과 같은 경로로 요청
+        import data_fetcher
+        with data_fetcher.breakers['fng'].guard():
+            with metrics.span('fetch.fng'):
+                response = data_fetcher.requests.get(config.FEAR_GREED_URL,
+                                                     params={'limit': limit, 'format': 'json'}, timeout=10)
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+        with metrics.span('parse.fng'):
+            return parse_readings(response.json())
+
+    @staticmethod
+    def _matches(stored, fetched):
+        """새로 받은 값과 저장된 이력이 겹치는 날짜가 있고 그 값이 모두 같은지"""
+        common = stored.index.intersection(fetched.index)
+        return (len(common) > 0
+                and np.array_equal(stored.loc[common, 'value'].to_numpy(dtype=float),
+                                   fetched.loc[common, 'value'].to_numpy(dtype=float)))
+
+    def update(self, max_age=None):
+        """저장소를 최신으로 맞춘 뒤 전체 이력 반환
+
+        요청이 실패하면 저장된(오래된) 이력을 그대로 돌려주고, 저장된 것도 없으면 예외를 올린다.
+        """
+        max_age = config.FEAR_GREED_REFRESH_SEC if max_age is None else max_age
+        with self.update_lock:
+            stored = self.load()
+            age = self.checked_age()
+            if not stored.empty and age is not None and age < max_age:
+                return stored
+
+            if stored.empty:
+                limit = 0  # 0이면 전체 이력
+            else:
+                days = (pd.Timestamp.now(tz='UTC').normalize() - stored.index[-1].normalize()).days
+                if days <= 0:
+                    self._touch()
+                    return stored
+                limit = days + 1  # 마지막 저장일도 다시 받아 저장된 값과 비교
+            try:
+                fetched = self._fetch(limit)
+                if limit and not fetched.empty and not self._matches(stored, fetched):
+                    logger.warning("저장된 Fear & Greed 이력이 받은 값과 달라 전체 이력을 다시 받습니다 (%s ~ %s)",
+                                   stored.index[0].date(), stored.index[-1].date())
+                    stored = parse_readings({})
+                    fetched = self._fetch(0)
+            except Exception as e:
+                if stored.empty:
+                    raise
+                logger.warning("Fear & Greed 갱신 실패, 저장된 데이터 사용: %s", e)
+                return stored
+
+            if fetched.empty:
+                self._touch()
+                return stored
+            readings = pd.concat([stored, fetched]) if not stored.empty else fetched
+            readings = readings[~readings.index.duplicated(keep='last')].sort_index()
+            self._save(readings)
+            logger.info("Fear & Greed: %d개 값 추가 (총 %d개)", len(readings) - len(stored), len(readings))
+            return readings
+
+    def refresh(self):
+        """Fear_Greed 열을 계산하기 전에 부르는 update() (실패해도 예외 없이 저장된 이력 반환)
+
+        저장된 이력도 없으면 그 열이 모두 비므로 경고를 남긴다.
+        """
+        try:
+            readings = self.update()
+        except Exception as e:
+            logger.warning("Fear & Greed 이력을 가져오지 못했습니다: %s", e)
+            readings = self.load()
+        if readings.empty:
+            logger.warning("저장된 Fear & Greed 이력이 없어 Fear_Greed 지표 열이 비어 있습니다")
+        return readings
+
+    def latest(self):
+        """저장된 마지막 값 (timestamp, value, classification). 없으면 None"""
+        readings = self.load()
+        if readings.empty:
+            return None
+        return readings.index[-1], readings['value'].iloc[-1], readings['classification'].iloc[-1]
+
+    def history(self, start=None, end=None):
+        """저장된 이력 구간 (요청 없음, 시간대가 없는 날짜는 UTC로 간주)"""
+        readings = self.load()
+        if start is not None:
+            readings = readings[readings.index >= _utc_timestamp(start)]
+        if end is not None:
+            readings = readings[readings.index <= _utc_timestamp(end)]
+        return readings
+
+    def aligned(self, index, max_gap_days=None):
+        """저장된 이력을 봉 인덱스에 as-of로 맞춘 배열 (요청 없음)"""
+        return asof_values(self.load(), index, max_gap_days)
+
+
+fear_greed_store = FearGreedStore()
@@ -0,0 +1,150 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import config
+import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class FredStore:
+    """FRED 시계열 전체 이력 로컬 저장소
+
+    처음에는 전체 이력을 내려받고, 이후에는 마지막 저장 날짜 다음 관측치만 요청해
+    이어 붙인다. config.FRED_REFRESH_SEC 안에 확인한 시계열은 요청하지 않는다.
+    파일 수정 시각을 마지막 확인 시각으로 사용한다.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or config.FRED_STORE_DIR
+        self.series = {}
+        self.lock = threading.Lock()
+        self.series_locks = {}
+
+    def path_for(self, series_id):
+        return os.path.join(self.directory, f"{series_id}.pkl")
+
+    def _series_lock(self, series_id):
+        with self.lock:
+            lock = self.series_locks.get(series_id)
+            if lock is None:
+                lock = threading.Lock()
+                self.series_locks[series_id] = lock
+            return lock
+
+    def checked_age(self, series_id):
+        """마지막으로 FRED에 확인한 뒤 지난 시간(초). 저장된 적 없으면 None"""
+        try:
+            return time.time() - os.path.getmtime(self.path_for(series_id))
+        except OSError:
+            return None
+
+    def load(self, series_id):
+        """저장된 시계열 (없으면 빈 Series)"""
+        with self.lock:
+            cached = self.series.get(series_id)
+        if cached is not None:
+            return cached
+        try:
+            series = pd.read_pickle(self.path_for(series_id))
+        except Exception:
+            return pd.Series(dtype=float)
+        with self.lock:
+            self.series[series_id] = series
+        return series
+
+    def _save(self, series_id, series):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(series_id)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        series.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+        with self.lock:
+            self.series[series_id] = series
+
+    def _touch(self, series_id):
+        try:
+            os.utime(self.path_for(series_id))
+        except OSError:
+            pass
+
+    def update(self, series_id, fred, max_age=None):
+        """저장소를 최신으로 맞춘 뒤 전체 시계열 반환
+
+        요청이 실패하면 저장된(오래된) 시계열을 그대로 돌려주고, 저장된 것도 없으면 예외를 올린다.
+        """
+        max_age = config.FRED_REFRESH_SEC if max_age is None else max_age
+        with self._series_lock(series_id):
+            stored = self.load(series_id)
+            age = self.checked_age(series_id)
+            if not stored.empty and age is not None and age < max_age:
+                return stored
+
+            from data_fetcher import breakers
+            try:
+                if stored.empty:
+                    with breakers['fred'].guard(), metrics.span('fetch.fred'):
+                        fetched = fred.get_series(series_id)
+                else:
+                    start = stored.index[-1] + pd.Timedelta(days=1)
+                    if start > pd.Timestamp.now().normalize():
+                        self._touch(series_id)
+                        return stored
+                    with breakers['fred'].guard(), metrics.span('fetch.fred'):
+                        fetched = fred.get_series(series_id, observation_start=start)
+            except Exception as e:
+                if stored.empty:
+                    raise
+                logger.warning("FRED %s 갱신 실패, 저장된 데이터 사용: %s", series_id, e)
+                return stored
+
+            fetched = fetched.dropna()
+            if fetched.empty:
+                self._touch(series_id)
+                return stored
+            if stored.empty:
+                series = fetched.sort_index()
+            else:
+                series = pd.concat([stored, fetched])
+                series = series[~series.index.duplicated(keep='last')].sort_index()
+            self._save(series_id, series)
+            logger.info("FRED %s: %d개 관측치 추가 (총 %d개)", series_id, len(series) - len(stored), len(series))
+            return series
+
+    def refresh(self, series_ids, fred, max_age=None):
+        """여러 시계열을 동시에 갱신. 시계열 ID → Series 또는 예외"""
+        series_ids = list(dict.fromkeys(series_ids))
+        workers = max(1, min(len(series_ids), config.ASYNC_PROVIDER_CONCURRENCY['fred']))
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fred') as pool:
+            futures = {series_id: pool.submit(self.update, series_id, fred, max_age)
+                       for series_id in series_ids}
+            for series_id, future in futures.items():
+                try:
+                    results[series_id] = future.result()
+                except Exception as e:
+                    results[series_id] = e
+        return results
+
+    def history(self, series_id, start=None, end=None):
+        """저장된 이력 구간 (요청 없음)"""
+        series = self.load(series_id)
+        if start is not None:
+            series = series[series.index >= pd.Timestamp(start)]
+        if end is not None:
+            series = series[series.index <= pd.Timestamp(end)]
+        return series
+
+
+def latest_value(series):
+    """마지막 유효 관측치 (없으면 None)"""
+    series = series.dropna()
+    return series.iloc[-1] if not series.empty else None
+
+
+fred_store = FredStore()
@@ -0,0 +1,179 @@
+import numpy as np
+from PyQt5.QtWidgets import QTableView, QHeaderView, QAbstractItemView, QMenu
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+import config
+from technical_analysis import BAR_INPUTS, INDICATOR_COLUMNS
+
+# 열별 표시 형식 (없으면 소수 둘째 자리)
+COLUMN_FORMATS = {
+    'Volume': '{:,.0f}',
+    'OBV': '{:,.0f}',
+    'Volume_MA': '{:,.0f}',
+    'Fear_Greed': '{:.0f}',
+}
+DATE_HEADER = "날짜"
+LEFT_ALIGNED = int(Qt.AlignLeft | Qt.AlignVCenter)
+RIGHT_ALIGNED = int(Qt.AlignRight | Qt.AlignVCenter)
+
+
+class IndicatorTableModel(QAbstractTableModel):
+    """봉/지표 프레임 전체 기간 표 모델
+
+    프레임 열의 numpy 배열을 복사 없이 참조하고, 칸 문자열은 뷰가 그리는(보이는) 칸만 그때 만든다.
+    날짜순 정렬은 행 번호 계산만으로 처리하고, 지표 열로 정렬할 때만 행 순서 배열(int32) 하나를 만든다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.dates = None
+        self.rows = 0
+        self.columns = []
+        self.arrays = []
+        self.formats = []
+        self.date_format = '%Y-%m-%d'
+        self.sort_key = None  # 정렬 기준 열 이름 (None이면 날짜)
+        self.descending = True
+        self.order = None
+
+    def set_frame(self, frame, columns, intraday=False):
+        """frame(봉 + 지표)의 columns 열을 표시 (frame에 없는 열은 건너뜀)"""
+        self.beginResetModel()
+        if frame is None:
+            self.dates = None
+            self.rows = 0
+            self.columns = []
+        else:
+            self.dates = frame.index
+            self.rows = len(frame.index)
+            self.columns = [column for column in columns if column in frame.columns]
+        self.arrays = [frame[column].to_numpy() for column in self.columns]
+        self.formats = [COLUMN_FORMATS.get(column, '{:,.2f}') for column in self.columns]
+        self.date_format = '%Y-%m-%d %H:%M' if intraday else '%Y-%m-%d'
+        if self.sort_key not in self.columns:
+            self.sort_key = None
+        self._sort()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns) + 1
+
+    def position(self, row):
+        """표의 row번째 행이 가리키는 프레임 행 번호"""
+        if self.order is not None:
+            return int(self.order[row])
+        return self.rows - 1 - row if self.descending else row
+
+    def data(self, index, role=Qt.DisplayRole):
+        # 뷰는 칸마다 여러 역할을 묻기 때문에 표시/정렬 외의 역할은 바로 돌려보냄
+        if role == Qt.DisplayRole:
+            column = index.column()
+            position = self.position(index.row())
+            if column == 0:
+                return self.dates[position].strftime(self.date_format)
+            value = self.arrays[column - 1][position]
+            if value != value:  # NaN
+                return ""
+            return self.formats[column - 1].format(value)
+        if role == Qt.TextAlignmentRole:
+            return RIGHT_ALIGNED if index.column() else LEFT_ALIGNED
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return None
+        return DATE_HEADER if section == 0 else self.columns[section - 1]
+
+    def sort_section(self):
+        """현재 정렬 기준 열의 위치 (날짜는 0)"""
+        return 0 if self.sort_key is None else self.columns.index(self.sort_key) + 1
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self.sort_key = self.columns[column - 1] if 0 < column <= len(self.columns) else None
+        self.descending = order == Qt.DescendingOrder
+        self._sort()
+        self.layoutChanged.emit()
+
+    def _sort(self):
+        if self.sort_key is None or self.dates is None:
+            # 날짜순은 프레임 순서 그대로 (순서 배열 없음)
+            self.order = None
+            return
+        values = self.arrays[self.columns.index(self.sort_key)].astype(float, copy=False)
+        # 내림차순도 같은 값끼리는 날짜순, 빈 값(NaN)은 항상 마지막
+        keys = -values if self.descending else values
+        self.order = np.argsort(keys, kind='stable').astype(np.int32)
+
+
+class IndicatorTable(QTableView):
+    """전체 기간 지표 표 (행 높이 고정, 보이는 행만 그림)
+
+    열 머리글을 우클릭해 표시할 열을 고르고, 머리글을 눌러 정렬한다.
+    프레임에 없는 지표 열을 고르면 columns_changed로 알려 계산을 맡긴다.
+    """
+    columns_changed = pyqtSignal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.columns = list(config.INDICATOR_TABLE_COLUMNS)
+        self.frame = None
+        self.intraday = False
+        self.table_model = IndicatorTableModel(self)
+        self.setModel(self.table_model)
+
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setAlternatingRowColors(True)
+        self.setWordWrap(False)
+        # 행 높이를 고정해야 행 수와 상관없이 스크롤 위치를 바로 계산한다 (내용 기준 크기 조절은 전체 행을 읽음)
+        rows = self.verticalHeader()
+        rows.hide()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.fontMetrics().height() + 6)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(config.INDICATOR_TABLE_COLUMN_WIDTH)
+        header.setContextMenuPolicy(Qt.CustomContextMenu)
+        header.customContextMenuRequested.connect(self.show_column_menu)
+        self.setSortingEnabled(True)
+        header.setSortIndicator(0, Qt.DescendingOrder)
+
+    def set_frame(self, frame, intraday=False):
+        """표시할 봉/지표 프레임 교체 (정렬 기준은 유지)"""
+        self.frame = frame
+        self.intraday = intraday
+        self.refresh()
+        sample = '0000-00-00 00:00' if intraday else '0000-00-00'
+        self.setColumnWidth(0, self.fontMetrics().horizontalAdvance(sample) + 24)
+
+    def show_column_menu(self, pos):
+        menu = QMenu(self)
+        for column in BAR_INPUTS + INDICATOR_COLUMNS:
+            action = menu.addAction(column)
+            action.setCheckable(True)
+            action.setChecked(column in self.columns)
+        chosen = menu.exec_(self.horizontalHeader().mapToGlobal(pos))
+        if chosen is None:
+            return
+        column = chosen.text()
+        if column in self.columns:
+            self.columns.remove(column)
+        else:
+            # 열 순서는 메뉴(봉 → 지표) 순서를 따름
+            order = BAR_INPUTS + INDICATOR_COLUMNS
+            self.columns = [name for name in order if name in self.columns or name == column]
+        self.columns_changed.emit(list(self.columns))
+        self.refresh()
+
+    def refresh(self):
+        self.table_model.set_frame(self.frame, self.columns, self.intraday)
+        # 정렬하던 열을 숨겼으면 날짜순으로 돌아간 것을 머리글에도 표시
+        header = self.horizontalHeader()
+        if header.sortIndicatorSection() != self.table_model.sort_section():
+            header.blockSignals(True)
+            header.setSortIndicator(self.table_model.sort_section(), header.sortIndicatorOrder())
+            header.blockSignals(False)
@@ -1,327 +1,22 @@
+import time
+_STARTED = time.perf_counter()
+
 import sys
+import logging
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QPushButton, 
                              QComboBox, QTextEdit, QTabWidget, QScrollArea,
-                             QGridLayout, QGroupBox, QMessageBox, QFrame)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QPainter, QColor, QPen
-import matplotlib
-matplotlib.use('Qt5Agg')
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from matplotlib.gridspec import GridSpec
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import pandas as pd
-
-# 한글 폰트 설정
-try:
-    plt.rcParams['font.family'] = 'Malgun Gothic'  # Windows
-    plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
-except:
-    try:
-        plt.rcParams['font.family'] = 'AppleGothic'  # Mac
-        plt.rcParams['axes.unicode_minus'] = False
-    except:
-        pass  # 폰트 설정 실패해도 프로그램은 계속 실행
+                             QGridLayout, QGroupBox, QMessageBox, QFrame, QCompleter)
+from PyQt5.QtCore import Qt, QThreadPool, QTimer, QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QFont, QPainter, QColor, QPen, QPixmap, QStandardItem, QStandardItemModel
 
-from data_fetcher import DataFetcher
-from technical_analysis import TechnicalAnalysis
 import config
+import metrics
+import session
+from startup import StartupTimer, ModuleWarmupTask
 
-class DataLoadThread(QThread):
-    """데이터 로딩을 위한 스레드"""
-    finished = pyqtSignal(object, object)
-    error = pyqtSignal(str)
-    
-    def __init__(self, symbol, period, interval):
-        super().__init__()
-        self.symbol = symbol
-        self.period = period
-        self.interval = interval
-    
-    def run(self):
-        try:
-            fetcher = DataFetcher()
-            data = fetcher.get_stock_data(self.symbol, self.period, self.interval)
-            info = fetcher.get_stock_info(self.symbol)
-            
-            if data is None:
-                error_msg = f"주식 데이터를 가져올 수 없습니다.\n\n"
-                error_msg += f"입력한 심볼: {self.symbol}\n"
-                error_msg += f"기간: {self.period}, 간격: {self.interval}\n\n"
-                error_msg += "가능한 원인:\n"
-                error_msg += "1. 잘못된 티커 심볼\n"
-                error_msg += "2. 기간/간격 조합이 지원되지 않음\n"
-                error_msg += "   (예: 분봉은 최근 1개월만 가능)\n"
-                error_msg += "3. 네트워크 연결 문제\n\n"
-                error_msg += "한국 주식은 .KS 추가 (예: 005930.KS)"
-                self.error.emit(error_msg)
-            else:
-                self.finished.emit(data, info)
-        except Exception as e:
-            self.error.emit(f"데이터 로딩 중 오류 발생:\n{type(e).__name__}: {str(e)}")
-
-
-class ChartCanvas(FigureCanvas):
-    """차트를 표시하는 캔버스"""
-    
-    def __init__(self, parent=None, width=10, height=6, dpi=100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
-        super().__init__(self.fig)
-        self.setParent(parent)
-        
-        self.data = None
-        self.symbol = None
-        self.indicators_data = None
-        self.main_ax = None
-        self.sub_axes = []
-        self.hover_line = None
-        self.hover_annotation = None
-        
-        self.mpl_connect('motion_notify_event', self.on_hover)
-    
-    def plot_candlestick(self, data, symbol, indicators_data=None):
-        """캔들스틱 차트와 기술적 지표 그리기"""
-        self.fig.clear()
-        
-        if data is None or len(data) == 0:
-            return
-        
-        self.data = data
-        self.symbol = symbol
-        self.indicators_data = indicators_data
-        
-        # 서브플롯 구성 - GridSpec으로 높이 비율 조정
-        if indicators_data is not None:
-            # 메인 차트를 더 크게 (3:1:1:1 비율)
-            gs = GridSpec(4, 1, figure=self.fig, height_ratios=[3, 1, 1, 1], hspace=0.3)
-            ax1 = self.fig.add_subplot(gs[0])
-            ax2 = self.fig.add_subplot(gs[1], sharex=ax1)
-            ax3 = self.fig.add_subplot(gs[2], sharex=ax1)
-            ax4 = self.fig.add_subplot(gs[3], sharex=ax1)
-            
-            self.main_ax = ax1
-            self.sub_axes = [ax2, ax3, ax4]
-            
-            ax1.clear()
-            
-            for idx in range(len(data)):
-                open_price = data['Open'].iloc[idx]
-                close_price = data['Close'].iloc[idx]
-                high = data['High'].iloc[idx]
-                low = data['Low'].iloc[idx]
-                
-                if close_price >= open_price:
-                    body_color = 'red'
-                else:
-                    body_color = 'blue'
-                
-                ax1.plot([idx, idx], [low, high], color='black', linewidth=0.8, zorder=1)
-                
-                body_height = abs(close_price - open_price)
-                body_bottom = min(open_price, close_price)
-                
-                if body_height > 0:
-                    rect = plt.Rectangle((idx - 0.3, body_bottom), 0.6, body_height,
-                                        facecolor=body_color, edgecolor='black', 
-                                        linewidth=0.5, zorder=2)
-                    ax1.add_patch(rect)
-                else:
-                    ax1.plot([idx - 0.3, idx + 0.3], [open_price, open_price], 
-                           color=body_color, linewidth=1.5, zorder=2)
-            
-            if 'MA20' in indicators_data.columns:
-                ax1.plot(range(len(indicators_data)), indicators_data['MA20'].values, 
-                        label='MA20', linewidth=1.5, alpha=0.8, color='orange')
-            if 'MA50' in indicators_data.columns:
-                ax1.plot(range(len(indicators_data)), indicators_data['MA50'].values, 
-                        label='MA50', linewidth=1.5, alpha=0.8, color='green')
-            
-            if 'BB_Upper' in indicators_data.columns and 'BB_Lower' in indicators_data.columns:
-                ax1.plot(range(len(indicators_data)), indicators_data['BB_Upper'].values, 
-                        '--', label='BB Upper', linewidth=1, alpha=0.5, color='gray')
-                ax1.plot(range(len(indicators_data)), indicators_data['BB_Middle'].values, 
-                        '--', label='BB Middle', linewidth=1, alpha=0.5, color='purple')
-                ax1.plot(range(len(indicators_data)), indicators_data['BB_Lower'].values, 
-                        '--', label='BB Lower', linewidth=1, alpha=0.5, color='gray')
-                ax1.fill_between(range(len(indicators_data)), 
-                               indicators_data['BB_Upper'].values,
-                               indicators_data['BB_Lower'].values,
-                               alpha=0.1, color='purple')
-            
-            ax1.set_title(f'{symbol} Stock Price (마우스를 차트 위에 올려보세요)', 
-                         fontsize=13, fontweight='bold')
-            ax1.set_ylabel('Price ($)', fontsize=10)
-            ax1.legend(loc='upper left', fontsize=8, ncol=2)
-            ax1.grid(True, alpha=0.3, linestyle='--')
-            ax1.set_xlim(-1, len(data))
-            ax1.tick_params(labelbottom=False)
-            
-            # RSI
-            ax2.clear()
-            ax2.plot(range(len(indicators_data)), indicators_data['RSI'].values, 
-                    label='RSI', color='purple', linewidth=1.5)
-            ax2.axhline(y=70, color='r', linestyle='--', linewidth=1, alpha=0.5)
-            ax2.axhline(y=30, color='g', linestyle='--', linewidth=1, alpha=0.5)
-            ax2.fill_between(range(len(indicators_data)), 70, 100, alpha=0.1, color='red')
-            ax2.fill_between(range(len(indicators_data)), 0, 30, alpha=0.1, color='green')
-            ax2.set_ylabel('RSI', fontsize=10)
-            ax2.set_ylim(0, 100)
-            ax2.legend(loc='upper left', fontsize=8)
-            ax2.grid(True, alpha=0.3, linestyle='--')
-            ax2.set_xlim(-1, len(indicators_data))
-            ax2.tick_params(labelbottom=False)
-            
-            # MACD
-            ax3.clear()
-            ax3.plot(range(len(indicators_data)), indicators_data['MACD'].values, 
-                    label='MACD', color='blue', linewidth=1.5)
-            ax3.plot(range(len(indicators_data)), indicators_data['MACD_Signal'].values, 
-                    label='Signal', color='red', linewidth=1.5)
-            
-            colors = ['green' if val >= 0 else 'red' 
-                     for val in indicators_data['MACD_Histogram'].values]
-            ax3.bar(range(len(indicators_data)), indicators_data['MACD_Histogram'].values,
-                   label='Histogram', color=colors, alpha=0.3, width=0.8)
-            ax3.axhline(y=0, color='black', linewidth=0.8)
-            ax3.set_ylabel('MACD', fontsize=10)
-            ax3.legend(loc='upper left', fontsize=8)
-            ax3.grid(True, alpha=0.3, linestyle='--')
-            ax3.set_xlim(-1, len(indicators_data))
-            ax3.tick_params(labelbottom=False)
-            
-            # Williams %R
-            ax4.clear()
-            ax4.plot(range(len(indicators_data)), indicators_data['Williams_R'].values, 
-                    label='Williams %R', color='orange', linewidth=1.5)
-            ax4.axhline(y=-20, color='r', linestyle='--', linewidth=1, alpha=0.5)
-            ax4.axhline(y=-80, color='g', linestyle='--', linewidth=1, alpha=0.5)
-            ax4.fill_between(range(len(indicators_data)), -20, 0, alpha=0.1, color='red')
-            ax4.fill_between(range(len(indicators_data)), -100, -80, alpha=0.1, color='green')
-            ax4.set_ylabel('Williams %R', fontsize=10)
-            ax4.set_xlabel('Days', fontsize=10)
-            ax4.set_ylim(-100, 0)
-            ax4.legend(loc='upper left', fontsize=8)
-            ax4.grid(True, alpha=0.3, linestyle='--')
-            ax4.set_xlim(-1, len(indicators_data))
-            
-        else:
-
-            ax = self.fig.add_subplot(111)
-            ax.clear()
-            
-            self.main_ax = ax
-            self.sub_axes = []
-            
-            for idx in range(len(data)):
-                open_price = data['Open'].iloc[idx]
-                close_price = data['Close'].iloc[idx]
-                high = data['High'].iloc[idx]
-                low = data['Low'].iloc[idx]
-                
-                if close_price >= open_price:
-                    color = 'red'
-                else:
-                    color = 'blue'
-                
-                ax.plot([idx, idx], [low, high], color='black', linewidth=0.8, zorder=1)
-                
-                body_height = abs(close_price - open_price)
-                body_bottom = min(open_price, close_price)
-                
-                if body_height > 0:
-                    rect = plt.Rectangle((idx - 0.3, body_bottom), 0.6, body_height,
-                                        facecolor=color, edgecolor='black', 
-                                        linewidth=0.5, zorder=2)
-                    ax.add_patch(rect)
-                else:
-                    ax.plot([idx - 0.3, idx + 0.3], [open_price, open_price], 
-                           color=color, linewidth=1.5, zorder=2)
-            
-            ax.set_title(f'{symbol} Stock Price (마우스를 차트 위에 올려보세요)', 
-                        fontsize=14, fontweight='bold')
-            ax.set_ylabel('Price ($)', fontsize=11)
-            ax.set_xlabel('Days', fontsize=11)
-            ax.grid(True, alpha=0.3, linestyle='--')
-            ax.set_xlim(-1, len(data))
-        
-        self.fig.tight_layout()
-        self.draw()
-    
-    def on_hover(self, event):
-        """마우스 호버 이벤트 처리"""
-        if event.inaxes != self.main_ax or self.data is None:
-            if self.hover_line:
-                self.hover_line.remove()
-                self.hover_line = None
-            if self.hover_annotation:
-                self.hover_annotation.remove()
-                self.hover_annotation = None
-            self.draw_idle()
-            return
-        
-        x_pos = event.xdata
-        if x_pos is None:
-            return
-        
-        idx = int(round(x_pos))
-        if idx < 0 or idx >= len(self.data):
-            return
-        
-        date = self.data.index[idx]
-        open_price = self.data['Open'].iloc[idx]
-        high = self.data['High'].iloc[idx]
-        low = self.data['Low'].iloc[idx]
-        close = self.data['Close'].iloc[idx]
-        volume = self.data['Volume'].iloc[idx]
-        
-        date_str = date.strftime('%Y-%m-%d %H:%M') if hasattr(date, 'strftime') else str(date)
-        
-        if self.hover_line:
-            self.hover_line.remove()
-        if self.hover_annotation:
-            self.hover_annotation.remove()
-        
-        self.hover_line = self.main_ax.axvline(x=idx, color='gray', linestyle='--', 
-                                                linewidth=1, alpha=0.7, zorder=10)
-        
-        change = close - open_price
-        change_pct = (change / open_price) * 100 if open_price != 0 else 0
-        change_color = 'red' if change >= 0 else 'blue'
-        
-        info_text = f'{date_str}\n'
-        info_text += f'시가: ${open_price:.2f}\n'
-        info_text += f'고가: ${high:.2f}\n'
-        info_text += f'저가: ${low:.2f}\n'
-        info_text += f'종가: ${close:.2f}\n'
-        info_text += f'변화: ${change:+.2f} ({change_pct:+.2f}%)\n'
-        info_text += f'거래량: {volume:,.0f}'
-        
-        bbox_props = dict(boxstyle='round,pad=0.5', facecolor='wheat', 
-                         alpha=0.9, edgecolor=change_color, linewidth=2)
-        
-        x_range = self.main_ax.get_xlim()
-        if idx < (x_range[1] - x_range[0]) / 2:
-            x_offset = 50
-            ha = 'left'
-        else:
-            x_offset = -50
-            ha = 'right'
-        
-        self.hover_annotation = self.main_ax.annotate(
-            info_text,
-            xy=(idx, high),
-            xytext=(x_offset, 20),
-            textcoords='offset points',
-            bbox=bbox_props,
-            fontsize=9,
-            ha=ha,
-            va='bottom',
-            zorder=20
-        )
-        
-        self.draw_idle()
+# 상태 표시줄에 최근값을 보여줄 측정 구간
+STATUS_SPANS = ['fetch.history', 'indicators', 'chart.rasterize', 'ui.draw']
 
 
 class FearGreedGauge(QWidget):
@@ -396,14 +91,254 @@ class FearGreedGauge(QWidget):
 class TradingApp(QMainWindow):
     """메인 트레이딩 애플리케이션"""
     
-    def __init__(self):
+    def __init__(self, startup_timer=None):
         super().__init__()
-        self.data_fetcher = DataFetcher()
+        self.startup_timer = startup_timer or StartupTimer()
+        self._data_fetcher = None
         self.current_data = None
         self.current_info = None
         self.current_symbol = None
+        self.current_period = None
+        self.current_interval = None
+        self.current_indicators = None
+        self.current_ta = None
+        self.current_chart_arrays = None
+        self.current_task = None
+        self.load_generation = 0
+        
+        # 보이지 않는 탭은 갱신을 미루고 표시될 때 한 번만 계산
+        self.dirty_tabs = set()
+        self.economic_loaded_at = None
+        self.economic_loading = False
+        self.economic_result = None
+        
+        # 이전 세션 스냅샷 (모듈 로딩 후 데이터 복원 → 백그라운드 갱신)
+        self.restored = None
+        self.revalidate_generation = None
+        self.pending_revalidate = False
+        
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(4)
+        
+        # 차트/데이터 모듈은 창을 띄운 뒤 백그라운드에서 불러오고 준비되면 위젯을 만든다
+        self.modules_ready = False
+        self.pending_search = False
+        self.latency_monitor = None
+        self.chart_canvas = None
+        self.indicator_table = None
+        self.watchlist = None
+        self.prefetcher = None
+        
+        # 티커 심볼 색인 (검색창에 처음 입력할 때 워커에서 불러옴)
+        self.symbol_index = None
+        self.symbol_index_state = None  # None → 'wanted'(모듈 로딩 대기) → 'loading' → 'ready'
         
         self.init_ui()
+        if config.SESSION_RESTORE_ENABLED:
+            self.restore_session()
+        self.startup_timer.mark('window_created')
+        # 첫 화면을 그린 다음 이벤트 루프 차례에 모듈 로딩 시작
+        self.startup_timer.first_painted.connect(
+            lambda: QTimer.singleShot(0, self.start_module_warmup))
+        self.startup_timer.watch_first_paint(self)
+    
+    @property
+    def data_fetcher(self):
+        """경제 지표용 DataFetcher (처음 사용할 때 생성)"""
+        if self._data_fetcher is None:
+            from data_fetcher import DataFetcher
+            self._data_fetcher = DataFetcher()
+        return self._data_fetcher
+    
+    def start_module_warmup(self):
+        """창이 표시된 뒤 무거운 모듈을 워커 스레드에서 미리 불러오기"""
+        task = ModuleWarmupTask()
+        task.signals.finished.connect(self.on_modules_ready)
+        self.thread_pool.start(task)
+    
+    def on_modules_ready(self, timings):
+        """모듈 로딩 완료 - 차트 캔버스/관심 종목/프리페치 생성"""
+        from chart_canvas import ChartCanvas
+        from pipeline import UiLatencyMonitor
+        from watchlist import WatchlistWidget
+        from prefetch import Prefetcher
+        from indicator_table import IndicatorTable
+        
+        self.latency_monitor = UiLatencyMonitor(parent=self)
+        
+        self.chart_placeholder.hide()
+        self.chart_layout.removeWidget(self.chart_placeholder)
+        self.chart_placeholder.deleteLater()
+        self.chart_canvas = ChartCanvas(self, width=12, height=8)
+        self.chart_layout.addWidget(self.chart_canvas)
+        
+        self.watchlist_placeholder.hide()
+        self.watchlist_layout.removeWidget(self.watchlist_placeholder)
+        self.watchlist_placeholder.deleteLater()
+        self.watchlist = WatchlistWidget()
+        self.watchlist.symbol_activated.connect(self.open_symbol)
+        self.watchlist_layout.addWidget(self.watchlist)
+        
+        self.indicator_table_placeholder.hide()
+        self.indicators_tab_layout.removeWidget(self.indicator_table_placeholder)
+        self.indicator_table_placeholder.deleteLater()
+        self.indicator_table = IndicatorTable()
+        self.indicator_table.columns_changed.connect(self.on_indicator_columns_changed)
+        self.indicators_tab_layout.addWidget(self.indicator_table, 1)
+        
+        self.prefetcher = Prefetcher(
+            [self.period_combo.itemText(i) for i in range(self.period_combo.count())],
+            [self.interval_combo.itemText(i) for i in range(self.interval_combo.count())],
+            parent=self
+        )
+        self.prefetcher.install(QApplication.instance())
+        
+        self.modules_ready = True
+        self.refresh_button.setEnabled(True)
+        if self.symbol_index_state == 'wanted':
+            self.load_symbol_index()
+        self.startup_timer.mark('modules_ready')
+        slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:3]
+        logging.getLogger(__name__).info(
+            "시작 시간: %s (가장 느린 모듈: %s)", self.startup_timer.report(),
+            ", ".join(f"{name} {ms:.0f}ms" for name, ms in slowest))
+        
+        if self.pending_search:
+            # 로딩 중에 새로 검색했으면 이전 세션은 복원하지 않음
+            self.restored = None
+            self.pending_search = False
+            self.search_stock()
+        elif self.restored is not None:
+            self.restore_workspace()
+        else:
+            self.status_label.setText(f"준비 (시작 {self.startup_timer.marks['modules_ready']:.0f}ms)")
+            self.update_visible_tab()
+    
+    def restore_session(self):
+        """이전 세션의 화면 값을 바로 표시 (pandas/matplotlib 없이 가능한 부분만)"""
+        snapshot = session.load_snapshot()
+        if snapshot is None:
+            return
+        
+        for combo, value in ((self.period_combo, snapshot['period']),
+                             (self.interval_combo, snapshot['interval'])):
+            combo.blockSignals(True)
+            combo.setCurrentText(value)
+            combo.blockSignals(False)
+        self.symbol_input.setText(snapshot['symbol'])
+        self.current_symbol = snapshot['symbol']
+        self.stock_info_label.setText(snapshot['stock_info_text'])
+        if snapshot.get('indicator_texts'):
+            self.update_indicators(snapshot['indicator_texts'])
+        if snapshot.get('economic'):
+            self.apply_economic_data(snapshot['economic'])
+            # 저장된 값은 보여주기만 하고 경제 지표 탭을 열면 다시 수집
+            self.economic_loaded_at = None
+            self.refresh_button.setEnabled(False)
+        if snapshot.get('chart_png'):
+            pixmap = QPixmap()
+            if pixmap.loadFromData(snapshot['chart_png'], 'PNG'):
+                self.chart_placeholder.setPixmap(pixmap)
+        self.tab_widget.setCurrentIndex(snapshot.get('tab', 0))
+        
+        self.restored = snapshot
+        saved = time.strftime('%m-%d %H:%M', time.localtime(snapshot['saved_at']))
+        self.status_label.setText(f"이전 세션 복원: {snapshot['symbol']} ({saved} 저장) - 최신 데이터 확인 준비 중...")
+        self.startup_timer.mark('session_restored')
+    
+    def restore_workspace(self):
+        """스냅샷 데이터를 캐시/현재 상태로 되돌린 뒤 백그라운드에서 최신 데이터로 갱신
+
+        저장 시각이 캐시 TTL 안이면 갱신도 캐시에서 끝나고, 갱신에 실패하면 복원한 데이터를 그대로 둔다.
+        """
+        from data_cache import shared_cache
+        from technical_analysis import TechnicalAnalysis
+        
+        snapshot = self.restored
+        try:
+            frames = session.unpack_frames(snapshot['frames'])
+        except Exception as e:
+            logging.getLogger(__name__).warning("세션 데이터 복원 실패: %s", e)
+            self.restored = None
+            self.update_visible_tab()
+            self.search_stock()
+            return
+        
+        symbol, period, interval = snapshot['symbol'], snapshot['period'], snapshot['interval']
+        entry = shared_cache.put(symbol, period, interval, frames['data'], frames['indicators'],
+                                 fetched_at=snapshot['saved_at'])
+        shared_cache.put_info(symbol, frames['info'], fetched_at=snapshot['saved_at'])
+        
+        self.current_period = period
+        self.current_interval = interval
+        self.current_data = frames['data']
+        self.current_info = frames['info']
+        # 캐시 항목의 지표 프레임을 써야 나중에 계산한 열이 캐시에도 붙음
+        self.current_indicators = entry['indicators']
+        self.current_ta = TechnicalAnalysis(frames['data'], interval)
+        self.current_chart_arrays = frames['chart_arrays']
+        self.restored = None
+        
+        self.dirty_tabs.add(self.indicators_tab)
+        if self.economic_is_stale():
+            self.dirty_tabs.add(self.economic_tab)
+        if self.is_tab_visible(self.chart_tab) and shared_cache.get(symbol, period, interval) is None:
+            # 저장된 데이터가 오래됐으면 복원한 차트를 먼저 그린 뒤 갱신 시작 (느린 네트워크에서도 차트가 비지 않도록)
+            self.pending_revalidate = True
+            self.render_chart()
+        else:
+            self.dirty_tabs.add(self.chart_tab)
+            self.update_visible_tab()
+            self.revalidate_session()
+    
+    def revalidate_session(self):
+        """복원한 종목을 다시 검색 (오류가 나도 대화상자 없이 복원한 데이터를 유지)"""
+        self.search_stock()
+        self.revalidate_generation = self.load_generation
+    
+    def save_session(self):
+        """현재 작업 공간을 스냅샷으로 저장 (표시 중인 데이터가 없으면 이전 스냅샷 유지)"""
+        if not self.modules_ready or self.current_data is None:
+            return
+        from pipeline import summarize_indicators
+        
+        snapshot = {
+            'symbol': self.current_symbol,
+            'period': self.current_period,
+            'interval': self.current_interval,
+            'tab': self.tab_widget.currentIndex(),
+            'stock_info_text': self.stock_info_label.text(),
+            # 이미 계산된 열의 마지막 값만 읽음 (지표 탭을 열지 않아 없는 열은 N/A)
+            'indicator_texts': summarize_indicators(self.current_indicators, self.current_ta),
+            'economic': None,
+            'chart_png': self.grab_chart_png(),
+            'frames': session.pack_frames(self.current_data, self.current_info,
+                                          self.current_indicators, self.current_chart_arrays),
+        }
+        if self.economic_result is not None:
+            snapshot['economic'] = {key: session.plain_values(values)
+                                    for key, values in self.economic_result.items()}
+        try:
+            path = session.save_snapshot(snapshot)
+            logging.getLogger(__name__).info("세션 저장: %s", path)
+        except OSError as e:
+            logging.getLogger(__name__).error("세션 저장 실패: %s", e)
+    
+    def grab_chart_png(self):
+        """화면에 그려진 차트 이미지(PNG 바이트). 아직 그리지 않았으면 None"""
+        if self.chart_canvas is None or self.chart_canvas.arrays is None or self.chart_tab in self.dirty_tabs:
+            return None
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        self.chart_canvas.grab().save(buffer, 'PNG')
+        buffer.close()
+        return bytes(data)
+    
+    def closeEvent(self, event):
+        if config.SESSION_RESTORE_ENABLED:
+            self.save_session()
+        super().closeEvent(event)
     
     def init_ui(self):
         """UI 초기화"""
@@ -433,8 +368,24 @@ class TradingApp(QMainWindow):
         self.tab_widget.addTab(self.economic_tab, "경제 지표")
         self.setup_economic_tab()
         
-        self.status_label = QLabel("준비")
-        main_layout.addWidget(self.status_label)
+        self.watchlist_tab = QWidget()
+        self.watchlist_layout = QVBoxLayout(self.watchlist_tab)
+        self.watchlist_layout.setContentsMargins(0, 0, 0, 0)
+        self.watchlist_placeholder = QLabel("관심 종목 모듈을 불러오는 중...")
+        self.watchlist_placeholder.setAlignment(Qt.AlignCenter)
+        self.watchlist_layout.addWidget(self.watchlist_placeholder)
+        self.tab_widget.addTab(self.watchlist_tab, "관심 종목")
+        
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+        
+        status_layout = QHBoxLayout()
+        self.status_label = QLabel("모듈 불러오는 중...")
+        status_layout.addWidget(self.status_label, 1)
+        self.metrics_label = QLabel("")
+        self.metrics_label.setStyleSheet("color: gray;")
+        self.metrics_label.setVisible(metrics.is_enabled())
+        status_layout.addWidget(self.metrics_label)
+        main_layout.addLayout(status_layout)
     
     def create_input_panel(self):
         """입력 패널 생성"""
@@ -445,18 +396,29 @@ class TradingApp(QMainWindow):
         self.symbol_input = QLineEdit()
         self.symbol_input.setPlaceholderText("예: AAPL, TSLA, 005930.KS")
         self.symbol_input.setMinimumWidth(200)
+        self.symbol_input.returnPressed.connect(self.search_stock)
+        self.symbol_input.textEdited.connect(self.on_symbol_edited)
+        # 심볼/회사 이름 자동 완성: 목록은 색인 검색 결과로 직접 채우고, 고르면 심볼만 입력
+        self.symbol_model = QStandardItemModel(self)
+        self.symbol_completer = QCompleter(self.symbol_model, self)
+        self.symbol_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.symbol_completer.setCompletionRole(Qt.UserRole)
+        self.symbol_completer.setMaxVisibleItems(config.SYMBOL_SUGGESTIONS)
+        self.symbol_input.setCompleter(self.symbol_completer)
         layout.addWidget(self.symbol_input)
         
         layout.addWidget(QLabel("기간:"))
         self.period_combo = QComboBox()
         self.period_combo.addItems(['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', 'max'])
         self.period_combo.setCurrentText('1y')
+        self.period_combo.currentTextChanged.connect(self.on_view_changed)
         layout.addWidget(self.period_combo)
         
         layout.addWidget(QLabel("간격:"))
         self.interval_combo = QComboBox()
         self.interval_combo.addItems(['1m', '5m', '15m', '30m', '1h', '1d', '1wk', '1mo'])
         self.interval_combo.setCurrentText('1d')
+        self.interval_combo.currentTextChanged.connect(self.on_view_changed)
         layout.addWidget(self.interval_combo)
         
         self.search_button = QPushButton("검색")
@@ -465,6 +427,7 @@ class TradingApp(QMainWindow):
         
         self.refresh_button = QPushButton("새로고침")
         self.refresh_button.clicked.connect(self.refresh_economic_data)
+        self.refresh_button.setEnabled(False)
         layout.addWidget(self.refresh_button)
         
         layout.addStretch()
@@ -475,13 +438,16 @@ class TradingApp(QMainWindow):
     def setup_chart_tab(self):
         """차트 탭 설정"""
         layout = QVBoxLayout(self.chart_tab)
+        self.chart_layout = layout
         
         self.stock_info_label = QLabel("주식 정보가 여기에 표시됩니다")
         self.stock_info_label.setStyleSheet("font-size: 12pt; padding: 10px;")
         layout.addWidget(self.stock_info_label)
         
-        self.chart_canvas = ChartCanvas(self, width=12, height=8)
-        layout.addWidget(self.chart_canvas)
+        # 차트 캔버스는 matplotlib 로딩이 끝난 뒤 on_modules_ready에서 교체
+        self.chart_placeholder = QLabel("차트 모듈을 불러오는 중...")
+        self.chart_placeholder.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.chart_placeholder, 1)
     
     def setup_economic_tab(self):
         """경제 지표 탭 설정"""
@@ -610,13 +576,68 @@ class TradingApp(QMainWindow):
         self.indicators_group.setLayout(indicators_layout)
         scroll_layout.addWidget(self.indicators_group)
         
-        self.indicators_text = QTextEdit()
-        self.indicators_text.setReadOnly(True)
-        self.indicators_text.setMinimumHeight(300)
-        scroll_layout.addWidget(self.indicators_text)
-        
         scroll.setWidget(scroll_widget)
         layout.addWidget(scroll)
+        
+        # 전체 기간 지표 표 (모듈 로딩 후 생성)
+        self.indicators_tab_layout = layout
+        self.indicator_table_placeholder = QLabel("지표 표 모듈을 불러오는 중...")
+        self.indicator_table_placeholder.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.indicator_table_placeholder, 1)
+    
+    def load_symbol_index(self):
+        """티커 심볼 색인을 워커에서 불러오기 (모듈 로딩 전이면 끝난 뒤로 미룸)"""
+        if self.symbol_index_state in ('loading', 'ready'):
+            return
+        if not self.modules_ready:
+            self.symbol_index_state = 'wanted'
+            return
+        from pipeline import SymbolIndexTask
+        self.symbol_index_state = 'loading'
+        task = SymbolIndexTask()
+        task.signals.finished.connect(self.on_symbol_index_ready)
+        task.signals.error.connect(self.on_symbol_index_error)
+        self.thread_pool.start(task)
+    
+    def on_symbol_index_ready(self, index):
+        self.symbol_index = index
+        self.symbol_index_state = 'ready'
+        if self.symbol_input.hasFocus() and self.symbol_input.text().strip():
+            self.update_symbol_suggestions(self.symbol_input.text())
+    
+    def on_symbol_index_error(self, error_msg):
+        # 색인 없이도 검색은 그대로 동작 (확인만 건너뜀)
+        logging.getLogger(__name__).warning(error_msg)
+        self.symbol_index_state = None
+    
+    def on_symbol_edited(self, text):
+        """입력할 때마다 자동 완성 후보 갱신 (처음 입력할 때 색인 로딩 시작)"""
+        if self.symbol_index is None:
+            self.load_symbol_index()
+            return
+        self.update_symbol_suggestions(text)
+    
+    def update_symbol_suggestions(self, text):
+        self.symbol_model.clear()
+        for symbol, name in self.symbol_index.search(text):
+            item = QStandardItem(f"{symbol}    {name}" if name else symbol)
+            item.setData(symbol, Qt.UserRole)
+            self.symbol_model.appendRow(item)
+        if self.symbol_model.rowCount():
+            self.symbol_completer.complete()
+        else:
+            self.symbol_completer.popup().hide()
+    
+    def confirm_unknown_symbol(self, symbol, suggestions):
+        """심볼 목록에 없는 심볼을 그래도 검색할지 확인 (비슷한 심볼 안내)"""
+        message = f"'{symbol}'은(는) 심볼 목록에 없습니다."
+        if suggestions:
+            message += "\n\n비슷한 심볼:\n" + "\n".join(
+                f"  {candidate}  {name}" for candidate, name in suggestions)
+        message += "\n\n그래도 검색하시겠습니까?"
+        answer = QMessageBox.question(self, "심볼 확인", message,
+                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        return answer == QMessageBox.Yes
     
     def search_stock(self):
         """주식 검색"""
@@ -625,40 +646,221 @@ class TradingApp(QMainWindow):
             QMessageBox.warning(self, "경고", "티커 심볼을 입력하세요.")
             return
         
+        if not self.modules_ready:
+            # 모듈 로딩이 끝나면 on_modules_ready에서 다시 호출됨
+            self.pending_search = True
+            self.status_label.setText(f"모듈 불러오는 중... (완료 후 {symbol} 검색)")
+            return
+        
+        # 색인에 없는 심볼은 네트워크 요청 전에 확인 (이미 보고 있는 종목은 건너뜀)
+        if self.symbol_index is not None and symbol != self.current_symbol:
+            check = self.symbol_index.validate(symbol)
+            if check['valid'] is False and not self.confirm_unknown_symbol(symbol, check['suggestions']):
+                self.status_label.setText(f"검색 취소: {symbol}")
+                return
+        
+        from pipeline import StockLoadTask
+        from chart_renderer import chart_columns
+        from technical_analysis import SIGNAL_COLUMNS
+        
         period = self.period_combo.currentText()
         interval = self.interval_combo.currentText()
         
+        self.cancel_current_load()
+        self.pending_revalidate = False
+        self.load_generation += 1
+        generation = self.load_generation
+        
         self.current_symbol = symbol
         self.status_label.setText(f"데이터 로딩 중: {symbol}...")
-        self.search_button.setEnabled(False)
-        
-        self.load_thread = DataLoadThread(symbol, period, interval)
-        self.load_thread.finished.connect(self.on_data_loaded)
-        self.load_thread.error.connect(self.on_data_error)
-        self.load_thread.start()
+        self.latency_monitor.start()
+        
+        # 차트 탭이 보이지 않으면 래스터화는 탭을 열 때로 미룸
+        canvas_size = self.chart_canvas.render_size() if self.is_tab_visible(self.chart_tab) else None
+        # 차트에 그리는 지표만 계산하고, 기술적 지표 탭이 보일 때만 그 탭의 지표(표의 열 포함)까지 함께 계산
+        columns = chart_columns()
+        if self.is_tab_visible(self.indicators_tab):
+            columns += [column for column in SIGNAL_COLUMNS + self.indicator_table.columns
+                        if column not in columns]
+        task = StockLoadTask(symbol, period, interval, canvas_size, generation, columns)
+        task.signals.stage.connect(lambda text, g=generation: self.on_load_stage(text, g))
+        task.signals.finished.connect(self.on_data_loaded)
+        task.signals.error.connect(lambda msg, g=generation: self.on_data_error(msg, g))
+        self.current_task = task
+        self.thread_pool.start(task)
     
-    def on_data_loaded(self, data, info):
-        """데이터 로딩 완료"""
-        self.current_data = data
-        self.current_info = info
-        
-        ta = TechnicalAnalysis(data)
-        indicators_data = ta.calculate_all_indicators()
-        
-        self.chart_canvas.plot_candlestick(data, self.current_symbol, indicators_data)
+    def cancel_current_load(self):
+        """진행 중인 로딩을 취소 (아직 시작 전이면 대기열에서 제거)"""
+        task = self.current_task
+        if task is None:
+            return
+        self.current_task = None
+        if not self.thread_pool.tryTake(task):
+            task.cancel()
+    
+    def on_view_changed(self, _text):
+        """기간/간격 변경 시 현재 종목을 다시 로딩 (이전 요청은 대체됨)"""
+        if self.current_symbol and self.symbol_input.text().strip():
+            self.search_stock()
+    
+    def on_load_stage(self, text, generation):
+        if generation == self.load_generation:
+            self.status_label.setText(text)
+    
+    def open_symbol(self, symbol):
+        """워치리스트에서 선택한 종목을 차트 분석 탭에서 열기"""
+        self.symbol_input.setText(symbol)
+        self.tab_widget.setCurrentWidget(self.chart_tab)
+        self.search_stock()
+    
+    def on_data_loaded(self, result):
+        """데이터 로딩 완료 - 미리 계산된 결과를 위젯에 반영만 한다"""
+        if result['generation'] != self.load_generation:
+            # 더 새로운 요청으로 대체된 결과는 그리지 않음
+            return
+        self.current_task = None
+        self.current_data = result['data']
+        self.current_info = result['info']
+        self.current_indicators = result['indicators']
+        self.current_ta = result['ta']
+        self.current_chart_arrays = result['chart_arrays']
+        self.current_period = result['period']
+        self.current_interval = result['interval']
+        self.prefetcher.view_loaded(result['symbol'], result['period'], result['interval'])
+        if self.symbol_index is not None:
+            self.symbol_index.add(result['symbol'], (result['info'] or {}).get('longName', ''))
         
         self.update_stock_info()
-        self.update_indicators(indicators_data, ta)
-        self.refresh_economic_data()
+        
+        if result['rendered'] is not None:
+            self.chart_canvas.adopt_rendered(result['rendered'], result['chart_arrays'],
+                                             self.current_symbol, result['indicators'])
+        else:
+            self.dirty_tabs.add(self.chart_tab)
+        self.dirty_tabs.add(self.indicators_tab)
+        if self.economic_is_stale():
+            self.dirty_tabs.add(self.economic_tab)
+        self.update_visible_tab()
         
         self.status_label.setText(f"완료: {self.current_symbol}")
-        self.search_button.setEnabled(True)
+        # 차트 페인트까지 측정에 포함되도록 다음 이벤트 루프 이후에 종료
+        QTimer.singleShot(100, self.report_ui_latency)
     
-    def on_data_error(self, error_msg):
+    def on_data_error(self, error_msg, generation):
         """데이터 로딩 오류"""
+        if generation != self.load_generation:
+            return
+        self.current_task = None
+        self.latency_monitor.stop()
+        if generation == self.revalidate_generation and self.current_data is not None:
+            self.status_label.setText(f"최신 데이터를 가져오지 못해 저장된 데이터를 표시합니다: {self.current_symbol}")
+            return
         QMessageBox.critical(self, "오류", error_msg)
         self.status_label.setText("오류 발생")
-        self.search_button.setEnabled(True)
+    
+    def report_ui_latency(self):
+        """로딩 중 UI 입력 지연 통계 표시"""
+        from pipeline import FRAME_BUDGET_MS
+        stats = self.latency_monitor.stop()
+        budget = "OK" if stats['max_ms'] <= FRAME_BUDGET_MS else "초과"
+        self.status_label.setText(
+            f"완료: {self.current_symbol} | UI 지연 최대 {stats['max_ms']:.1f}ms, "
+            f"p95 {stats['p95_ms']:.1f}ms (1프레임 {FRAME_BUDGET_MS:.1f}ms {budget})"
+        )
+        self.update_metrics_label()
+    
+    def update_metrics_label(self):
+        """구간별 최근 소요 시간을 상태 표시줄에 표시"""
+        if metrics.is_enabled():
+            self.metrics_label.setText(metrics.summary_line(STATUS_SPANS))
+    
+    def is_tab_visible(self, tab):
+        return self.tab_widget.currentWidget() is tab
+    
+    def economic_is_stale(self):
+        return (self.economic_loaded_at is None
+                or time.monotonic() - self.economic_loaded_at > config.ECONOMIC_REFRESH_SEC)
+    
+    def on_tab_changed(self, _index):
+        if self.is_tab_visible(self.economic_tab) and self.economic_is_stale():
+            self.dirty_tabs.add(self.economic_tab)
+        self.update_visible_tab()
+    
+    def update_visible_tab(self):
+        """현재 보이는 탭이 갱신 대상(dirty)이면 그 탭만 계산/표시"""
+        tab = self.tab_widget.currentWidget()
+        if tab not in self.dirty_tabs or not self.modules_ready:
+            return
+        self.dirty_tabs.discard(tab)
+        if tab is self.chart_tab:
+            self.render_chart()
+        elif tab is self.indicators_tab:
+            self.load_indicator_columns()
+        elif tab is self.economic_tab:
+            self.refresh_economic_data()
+    
+    def is_intraday(self):
+        from technical_analysis import INTRADAY_INTERVALS
+        return self.current_interval in INTRADAY_INTERVALS
+    
+    def indicator_tab_columns(self):
+        from technical_analysis import SIGNAL_COLUMNS
+        return SIGNAL_COLUMNS + [column for column in self.indicator_table.columns if column not in SIGNAL_COLUMNS]
+    
+    def load_indicator_columns(self):
+        """기술적 지표 탭에 필요한 열(신호 + 표 열) 중 로딩할 때 계산하지 않은 열은 워커에서 계산"""
+        if self.current_indicators is None:
+            return
+        from pipeline import IndicatorColumnsTask
+        task = IndicatorColumnsTask(self.current_symbol, self.current_period, self.current_interval,
+                                    self.current_indicators, self.indicator_tab_columns(),
+                                    self.current_ta, self.load_generation)
+        task.signals.finished.connect(self.on_indicator_columns_ready)
+        task.signals.error.connect(self.on_indicator_columns_error)
+        self.thread_pool.start(task)
+    
+    def on_indicator_columns_ready(self, result):
+        # 다른 종목을 불러왔거나 그사이 표 열이 또 바뀌었으면 나중 결과가 반영함
+        if result['generation'] != self.load_generation:
+            return
+        indicators = result['indicators']
+        if any(column not in indicators.columns for column in self.indicator_tab_columns()):
+            return
+        self.current_indicators = indicators
+        self.update_indicators(result['texts'])
+        self.indicator_table.set_frame(indicators, self.is_intraday())
+    
+    def on_indicator_columns_error(self, error_msg):
+        logging.getLogger(__name__).error(error_msg)
+    
+    def on_indicator_columns_changed(self, _columns):
+        """표에 새로 고른 지표 열이 없으면 워커에서 계산해 현재 지표에 붙임"""
+        self.load_indicator_columns()
+    
+    def render_chart(self):
+        """미뤄둔 차트 렌더링을 워커에서 수행"""
+        if self.current_chart_arrays is None:
+            return
+        from pipeline import ChartRenderTask
+        task = ChartRenderTask(self.current_chart_arrays, self.current_symbol,
+                               self.chart_canvas.render_size(), self.load_generation)
+        task.signals.finished.connect(self.on_chart_rendered)
+        task.signals.error.connect(self.on_chart_error)
+        self.thread_pool.start(task)
+    
+    def on_chart_rendered(self, result):
+        if result['generation'] != self.load_generation:
+            return
+        self.chart_canvas.adopt_rendered(result['rendered'], self.current_chart_arrays,
+                                         self.current_symbol, self.current_indicators)
+        self.update_metrics_label()
+        if self.pending_revalidate:
+            self.revalidate_session()
+    
+    def on_chart_error(self, error_msg):
+        logging.getLogger(__name__).error(error_msg)
+        if self.pending_revalidate:
+            self.revalidate_session()
     
     def update_stock_info(self):
         """주식 정보 업데이트"""
@@ -676,80 +878,48 @@ class TradingApp(QMainWindow):
             
             self.stock_info_label.setText(info_text)
     
-    def update_indicators(self, indicators_data, ta):
-        """기술적 지표 업데이트"""
-        latest = indicators_data.iloc[-1]
-        
-        rsi_val = latest['RSI']
-        self.rsi_value_label.setText(f"{rsi_val:.2f}" if not pd.isna(rsi_val) else "N/A")
-        self.rsi_signal_label.setText(ta.get_latest_rsi_signal(rsi_val))
-        
-        macd_val = latest['MACD']
-        signal_val = latest['MACD_Signal']
-        self.macd_value_label.setText(
-            f"MACD: {macd_val:.2f}, Signal: {signal_val:.2f}" 
-            if not pd.isna(macd_val) else "N/A"
-        )
-        self.macd_signal_label.setText(ta.get_macd_signal(macd_val, signal_val))
-        
-        wr_val = latest['Williams_R']
-        self.wr_value_label.setText(f"{wr_val:.2f}" if not pd.isna(wr_val) else "N/A")
-        self.wr_signal_label.setText(ta.get_latest_williams_r_signal(wr_val))
-        
-        ma20 = latest.get('MA20', None)
-        ma50 = latest.get('MA50', None)
-        ma200 = latest.get('MA200', None)
-        
-        self.ma20_label.setText(f"{ma20:.2f}" if not pd.isna(ma20) else "N/A")
-        self.ma50_label.setText(f"{ma50:.2f}" if not pd.isna(ma50) else "N/A")
-        self.ma200_label.setText(f"{ma200:.2f}" if not pd.isna(ma200) else "N/A")
-        
-        bb_upper = latest.get('BB_Upper', None)
-        bb_middle = latest.get('BB_Middle', None)
-        bb_lower = latest.get('BB_Lower', None)
-        close_price = latest['Close']
-        
-        if not pd.isna(bb_upper) and not pd.isna(bb_lower):
-            bb_width = ((bb_upper - bb_lower) / bb_middle) * 100 if bb_middle != 0 else 0
-            bb_position = "상단 근처" if close_price > bb_middle else "하단 근처"
-            self.bb_label.setText(f"U: {bb_upper:.2f}, M: {bb_middle:.2f}, L: {bb_lower:.2f} (폭: {bb_width:.1f}%, {bb_position})")
-        else:
-            self.bb_label.setText("N/A")
-        
-        atr_val = latest.get('ATR', None)
-        if not pd.isna(atr_val):
-            atr_pct = (atr_val / close_price) * 100 if close_price != 0 else 0
-            volatility = "높음" if atr_pct > 3 else "중간" if atr_pct > 1.5 else "낮음"
-            self.atr_label.setText(f"{atr_val:.2f} ({atr_pct:.2f}% - {volatility})")
-        else:
-            self.atr_label.setText("N/A")
-        
-        obv_val = latest.get('OBV', None)
-        if not pd.isna(obv_val):
-            obv_formatted = f"{obv_val:,.0f}"
-            self.obv_label.setText(obv_formatted)
-        else:
-            self.obv_label.setText("N/A")
-        
-        volume = latest['Volume']
-        volume_ma = latest.get('Volume_MA', None)
-        if not pd.isna(volume_ma) and volume_ma != 0:
-            volume_ratio = (volume / volume_ma) * 100
-            volume_status = "매우 높음" if volume_ratio > 150 else "높음" if volume_ratio > 120 else "보통"
-            self.volume_ratio_label.setText(f"{volume:,.0f} ({volume_ratio:.0f}% - {volume_status})")
-        else:
-            self.volume_ratio_label.setText(f"{volume:,.0f}")
-        
-        detail_text = "=== 최근 10일 데이터 ===\n\n"
-        available_cols = ['Close', 'RSI', 'MACD', 'Williams_R', 'Volume']
-        if 'ATR' in indicators_data.columns:
-            available_cols.insert(-1, 'ATR')
-        detail_text += indicators_data[available_cols].tail(10).to_string()
-        self.indicators_text.setPlainText(detail_text)
+    def update_indicators(self, texts):
+        """기술적 지표 업데이트 (summarize_indicators 결과 반영)"""
+        self.rsi_value_label.setText(texts['rsi_value'])
+        self.rsi_signal_label.setText(texts['rsi_signal'])
+        self.macd_value_label.setText(texts['macd_value'])
+        self.macd_signal_label.setText(texts['macd_signal'])
+        self.wr_value_label.setText(texts['wr_value'])
+        self.wr_signal_label.setText(texts['wr_signal'])
+        self.ma20_label.setText(texts['ma20'])
+        self.ma50_label.setText(texts['ma50'])
+        self.ma200_label.setText(texts['ma200'])
+        self.bb_label.setText(texts['bb'])
+        self.atr_label.setText(texts['atr'])
+        self.obv_label.setText(texts['obv'])
+        self.volume_ratio_label.setText(texts['volume_ratio'])
     
     def refresh_economic_data(self):
-        """경제 지표 새로고침"""
-        interest_data = self.data_fetcher.get_interest_rates()
+        """경제 지표 새로고침 (네트워크 요청은 워커 스레드에서 실행)"""
+        if self.economic_loading or not self.modules_ready:
+            return
+        from pipeline import EconomicLoadTask
+        self.economic_loading = True
+        self.dirty_tabs.discard(self.economic_tab)
+        self.refresh_button.setEnabled(False)
+        task = EconomicLoadTask(self.data_fetcher)
+        task.signals.finished.connect(self.apply_economic_data)
+        task.signals.error.connect(self.on_economic_error)
+        self.thread_pool.start(task)
+    
+    def on_economic_error(self, error_msg):
+        """경제 지표 로딩 오류"""
+        self.economic_loading = False
+        self.economic_text.setPlainText(error_msg)
+        self.refresh_button.setEnabled(True)
+    
+    def apply_economic_data(self, result):
+        """경제 지표 결과를 위젯에 반영"""
+        self.economic_loading = False
+        self.economic_loaded_at = time.monotonic()
+        self.economic_result = result
+        interest_data = result['interest']
+        fng_data = result['fng']
         
         if interest_data['error']:
             self.nominal_rate_label.setText(interest_data['error'])
@@ -771,8 +941,6 @@ class TradingApp(QMainWindow):
         else:
             self.kr_base_rate_label.setText("N/A")
         
-        fng_data = self.data_fetcher.get_fear_greed_index()
-        
         if fng_data['error']:
             self.fng_value_label.setText(fng_data['error'])
             self.fng_class_label.setText("")
@@ -796,11 +964,27 @@ class TradingApp(QMainWindow):
             detail_text += f"참고: {fng_data['note']}\n"
         
         self.economic_text.setPlainText(detail_text)
+        self.refresh_button.setEnabled(True)
+
+
+def export_metrics():
+    """종료 시 측정 결과 저장 (config.METRICS_EXPORT_PATH)"""
+    try:
+        path = metrics.export_json(config.METRICS_EXPORT_PATH)
+        logging.getLogger(__name__).info("측정 결과 저장: %s", path)
+    except OSError as e:
+        logging.getLogger(__name__).error("측정 결과 저장 실패: %s", e)
 
 
 def main():
+    logging.basicConfig(level=config.LOG_LEVEL,
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    startup_timer = StartupTimer(_STARTED)
+    startup_timer.mark('imports')
     app = QApplication(sys.argv)
-    window = TradingApp()
+    if metrics.is_enabled() and config.METRICS_EXPORT_PATH:
+        app.aboutToQuit.connect(export_metrics)
+    window = TradingApp(startup_timer)
     window.show()
     sys.exit(app.exec_())
 
@@ -0,0 +1,179 @@
+"""핫패스 구간 시간 측정
+
+    with metrics.span('fetch.history'):
+        ...
+
+비활성화 상태에서는 span()이 미리 만들어 둔 빈 컨텍스트를 돌려주므로 측정 비용이
+함수 호출 한 번 수준이다. 측정값은 이름별 로그 스케일 히스토그램으로 모인다.
+"""
+import bisect
+import json
+import math
+import threading
+import time
+from functools import wraps
+
+import config
+
+# 0.05ms ~ 약 100초 구간을 로그 스케일로 나눈 버킷 경계(초)
+BUCKET_BOUNDS = [0.00005 * (2 ** (i / 2)) for i in range(0, 43)]
+
+_enabled = config.METRICS_ENABLED
+_lock = threading.Lock()
+_histograms = {}
+
+
+class Histogram:
+    """구간별 소요 시간 분포 (버킷 카운트 + 합계/최소/최대/최근값)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q):
+        """버킷 상한 기준 근사 백분위수(초)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        running = 0
+        for i, c in enumerate(self.counts):
+            running += c
+            if running >= target:
+                return min(BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max, self.max)
+        return self.max
+
+    def stats(self):
+        return {
+            'count': self.count,
+            'total_ms': self.total * 1000,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'min_ms': self.min * 1000 if self.count else 0.0,
+            'max_ms': self.max * 1000,
+            'p50_ms': self.percentile(0.5) * 1000,
+            'p95_ms': self.percentile(0.95) * 1000,
+            'last_ms': self.last * 1000,
+        }
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def enable(flag=True):
+    global _enabled
+    _enabled = flag
+
+
+def is_enabled():
+    return _enabled
+
+
+def span(name):
+    """구간 측정 컨텍스트 매니저"""
+    if not _enabled:
+        return _NOOP
+    return _Span(name)
+
+
+def timed(name):
+    """함수 전체를 하나의 구간으로 측정하는 데코레이터"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record(name, seconds):
+    """측정값 직접 기록"""
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = Histogram(name)
+            _histograms[name] = histogram
+        histogram.add(seconds)
+
+
+def snapshot():
+    """이름별 통계 사전"""
+    with _lock:
+        return {name: h.stats() for name, h in sorted(_histograms.items())}
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+def export_json(path):
+    """현재 통계를 JSON 파일로 저장"""
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'bucket_bounds_s': BUCKET_BOUNDS,
+        'spans': snapshot(),
+        'histograms': {},
+    }
+    with _lock:
+        for name, h in _histograms.items():
+            report['histograms'][name] = list(h.counts)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def summary_line(names=None):
+    """상태 표시줄용 한 줄 요약 (최근값 기준)"""
+    stats = snapshot()
+    names = names or list(stats)
+    parts = []
+    for name in names:
+        s = stats.get(name)
+        if s is None:
+            continue
+        parts.append(f"{name} {s['last_ms']:.0f}ms (p95 {s['p95_ms']:.0f})")
+    return " · ".join(parts)
@@ -0,0 +1,290 @@
+import logging
+import time
+import pandas as pd
+from PyQt5.QtCore import Qt, QObject, QRunnable, QTimer, pyqtSignal
+
+from data_cache import shared_cache
+from data_fetcher import CancelToken, LoadCancelled, breakers, negative_cache
+from symbol_index import symbol_store
+from technical_analysis import TechnicalAnalysis
+from chart_renderer import chart_columns, prepare_chart_arrays, render_figure
+
+logger = logging.getLogger(__name__)
+
+FRAME_BUDGET_MS = 1000.0 / 60
+
+
+class TaskSignals(QObject):
+    """워커 작업 결과 전달용 시그널 (메인 스레드에서 수신)"""
+    stage = pyqtSignal(str)
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+def build_load_error_message(symbol, period, interval):
+    error_msg = f"주식 데이터를 가져올 수 없습니다.\n\n"
+    error_msg += f"입력한 심볼: {symbol}\n"
+    error_msg += f"기간: {period}, 간격: {interval}\n\n"
+    if breakers['yahoo'].is_open:
+        error_msg += f"야후 파이낸스 요청이 계속 실패해 {breakers['yahoo'].retry_in():.0f}초 동안 요청을 보내지 않습니다.\n\n"
+    elif negative_cache.get(symbol, period, interval) is not None:
+        error_msg += f"최근 확인 결과: {negative_cache.get(symbol, period, interval)}\n\n"
+    error_msg += "가능한 원인:\n"
+    error_msg += "1. 잘못된 티커 심볼\n"
+    error_msg += "2. 기간/간격 조합이 지원되지 않음\n"
+    error_msg += "   (예: 분봉은 최근 1개월만 가능)\n"
+    error_msg += "3. 네트워크 연결 문제\n\n"
+    error_msg += "한국 주식은 .KS 추가 (예: 005930.KS)"
+    return error_msg
+
+
+def _fmt(value, spec=".2f"):
+    return format(value, spec) if not pd.isna(value) else "N/A"
+
+
+def summarize_indicators(indicators_data, ta):
+    """기술적 지표 탭에 표시할 문자열을 미리 포맷팅 (라벨 이름 → 텍스트)
+
+    이미 계산된 열의 마지막 값만 읽으므로(없는 열은 N/A) 메인 스레드에서 불러도 된다.
+    SIGNAL_COLUMNS를 채우는 계산은 IndicatorColumnsTask가 워커에서 한다.
+    """
+    signals = ta.latest_signals(indicators_data)
+    texts = {}
+
+    rsi = signals['rsi']
+    texts['rsi_value'] = _fmt(rsi['value'])
+    texts['rsi_signal'] = rsi['signal']
+
+    macd = signals['macd']
+    texts['macd_value'] = (
+        f"MACD: {macd['value']:.2f}, Signal: {_fmt(macd['signal_line'])}"
+        if macd['value'] is not None else "N/A"
+    )
+    texts['macd_signal'] = macd['signal']
+
+    wr = signals['williams_r']
+    texts['wr_value'] = _fmt(wr['value'])
+    texts['wr_signal'] = wr['signal']
+
+    mas = signals['moving_averages']
+    texts['ma20'] = _fmt(mas['MA20'])
+    texts['ma50'] = _fmt(mas['MA50'])
+    texts['ma200'] = _fmt(mas['MA200'])
+
+    bb = signals['bollinger']
+    if bb is not None:
+        texts['bb'] = (f"U: {bb['upper']:.2f}, M: {bb['middle']:.2f}, L: {bb['lower']:.2f} "
+                       f"(폭: {bb['width_pct']:.1f}%, {bb['position']})")
+    else:
+        texts['bb'] = "N/A"
+
+    atr = signals['atr']
+    if atr is not None:
+        texts['atr'] = f"{atr['value']:.2f} ({atr['pct']:.2f}% - {atr['volatility']})"
+    else:
+        texts['atr'] = "N/A"
+
+    texts['obv'] = f"{signals['obv']:,.0f}" if signals['obv'] is not None else "N/A"
+
+    volume = signals['volume']
+    if volume['ratio_pct'] is not None:
+        texts['volume_ratio'] = f"{volume['value']:,.0f} ({volume['ratio_pct']:.0f}% - {volume['status']})"
+    else:
+        texts['volume_ratio'] = f"{volume['value']:,.0f}"
+
+    return texts
+
+
+class StockLoadTask(QRunnable):
+    """주식 로딩 파이프라인 (수집 → 지표 계산 → 렌더링용 배열 준비)
+
+    모든 단계가 워커 스레드에서 실행되며, 메인 스레드는 finished 시그널로
+    전달된 결과를 위젯에 반영하기만 한다. canvas_size(가로 px, 세로 px, dpi)가
+    주어지면 차트 래스터화까지 워커에서 끝낸다.
+
+    cancel()이 호출되면 대기/재시도 중이라도 즉시 중단되고 아무 시그널도
+    보내지 않는다. generation은 결과를 받는 쪽에서 오래된 결과를 걸러내는 데 쓴다.
+    """
+
+    def __init__(self, symbol, period, interval, canvas_size=None, generation=0, columns=None):
+        super().__init__()
+        self.symbol = symbol
+        self.period = period
+        self.interval = interval
+        self.canvas_size = canvas_size
+        self.generation = generation
+        # 계산할 지표 열 (기본: 차트에 그리는 열)
+        self.columns = chart_columns() if columns is None else columns
+        self.cancel_token = CancelToken()
+        self.signals = TaskSignals()
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    def run(self):
+        cancel = self.cancel_token
+        try:
+            cancel.check()
+            self.signals.stage.emit(f"데이터 수집/지표 계산 중: {self.symbol}...")
+            entry = shared_cache.load(self.symbol, self.period, self.interval, cancel=cancel,
+                                      columns=self.columns)
+            if entry is None:
+                cancel.check()
+                self.signals.error.emit(build_load_error_message(self.symbol, self.period, self.interval))
+                return
+            info = shared_cache.load_info(self.symbol, cancel=cancel, period=self.period, interval=self.interval)
+
+            data = entry['data']
+            indicators_data = entry['indicators']
+            ta = TechnicalAnalysis(data, self.interval)
+
+            cancel.check()
+            self.signals.stage.emit(f"차트 준비 중: {self.symbol}...")
+            chart_arrays = prepare_chart_arrays(data, indicators_data)
+            rendered = None
+            if self.canvas_size is not None:
+                width_px, height_px, dpi = self.canvas_size
+                rendered = render_figure(chart_arrays, self.symbol, width_px, height_px, dpi)
+            cancel.check()
+
+            result = {
+                'generation': self.generation,
+                'symbol': self.symbol,
+                'period': self.period,
+                'interval': self.interval,
+                'data': data,
+                'info': info,
+                'indicators': indicators_data,
+                'chart_arrays': chart_arrays,
+                'rendered': rendered,
+                'ta': ta,
+            }
+            self.signals.finished.emit(result)
+        except LoadCancelled:
+            return
+        except Exception as e:
+            self.signals.error.emit(f"데이터 로딩 중 오류 발생:\n{type(e).__name__}: {str(e)}")
+
+
+class IndicatorColumnsTask(QRunnable):
+    """표시 중인 지표 프레임에 없는 열을 워커에서 계산 (기술적 지표 탭을 열거나 표 열을 바꿀 때)
+
+    계산한 열은 공유 캐시 항목에도 붙이고, 지표 탭 문자열까지 만들어 finished로 보낸다.
+    """
+
+    def __init__(self, symbol, period, interval, indicators, columns, ta, generation=0):
+        super().__init__()
+        self.symbol = symbol
+        self.period = period
+        self.interval = interval
+        self.indicators = indicators
+        self.columns = columns
+        self.ta = ta
+        self.generation = generation
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            indicators = shared_cache.add_columns(self.symbol, self.period, self.interval,
+                                                  self.indicators, self.columns)
+            self.signals.finished.emit({
+                'generation': self.generation,
+                'indicators': indicators,
+                'texts': summarize_indicators(indicators, self.ta),
+            })
+        except Exception as e:
+            self.signals.error.emit(f"지표 계산 중 오류 발생:\n{type(e).__name__}: {str(e)}")
+
+
+class ChartRenderTask(QRunnable):
+    """이미 준비된 차트 배열을 워커에서 래스터화 (차트 탭이 늦게 열릴 때 사용)"""
+
+    def __init__(self, chart_arrays, symbol, canvas_size, generation=0):
+        super().__init__()
+        self.chart_arrays = chart_arrays
+        self.symbol = symbol
+        self.canvas_size = canvas_size
+        self.generation = generation
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            width_px, height_px, dpi = self.canvas_size
+            rendered = render_figure(self.chart_arrays, self.symbol, width_px, height_px, dpi)
+            self.signals.finished.emit({'generation': self.generation, 'rendered': rendered})
+        except Exception as e:
+            self.signals.error.emit(f"차트 렌더링 중 오류 발생:\n{type(e).__name__}: {str(e)}")
+
+
+class EconomicLoadTask(QRunnable):
+    """경제 지표(금리, Fear & Greed) 수집 작업"""
+
+    def __init__(self, data_fetcher):
+        super().__init__()
+        self.data_fetcher = data_fetcher
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            result = {
+                'interest': self.data_fetcher.get_interest_rates(),
+                'fng': self.data_fetcher.get_fear_greed_index(),
+            }
+            self.signals.finished.emit(result)
+        except Exception as e:
+            self.signals.error.emit(f"경제 지표 로딩 중 오류 발생:\n{type(e).__name__}: {str(e)}")
+
+
+class SymbolIndexTask(QRunnable):
+    """티커 심볼 색인 불러오기/갱신 (검색창을 처음 쓸 때 실행, 오타 검색 배열까지 미리 만듦)"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(symbol_store.update().prepare())
+        except Exception as e:
+            self.signals.error.emit(f"심볼 목록 로딩 중 오류 발생:\n{type(e).__name__}: {str(e)}")
+
+
+class UiLatencyMonitor(QObject):
+    """이벤트 루프 지연(입력 반응 지연) 측정
+
+    짧은 주기의 타이머가 예정보다 얼마나 늦게 실행되는지를 기록한다.
+    이 값이 한 프레임(약 16.7ms)을 넘으면 그동안 입력 처리가 밀린 것이다.
+    """
+
+    def __init__(self, interval_ms=5, parent=None):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.samples = []
+        self._last = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_tick)
+
+    def start(self):
+        self.samples = []
+        self._last = time.perf_counter()
+        self._timer.start(self.interval_ms)
+
+    def _on_tick(self):
+        now = time.perf_counter()
+        lag_ms = (now - self._last) * 1000.0 - self.interval_ms
+        self.samples.append(max(lag_ms, 0.0))
+        self._last = now
+
+    def stop(self):
+        """측정 종료 후 통계 반환"""
+        self._timer.stop()
+        if not self.samples:
+            return {'max_ms': 0.0, 'p95_ms': 0.0, 'samples': 0, 'over_budget': 0}
+        ordered = sorted(self.samples)
+        return {
+            'max_ms': ordered[-1],
+            'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            'samples': len(ordered),
+            'over_budget': sum(1 for lag in ordered if lag > FRAME_BUDGET_MS),
+        }
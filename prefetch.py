@@ -0,0 +1,177 @@
+import logging
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, QEvent, pyqtSignal
+
+import config
+from data_cache import shared_cache, INTRADAY_INTERVALS
+from data_fetcher import CancelToken, LoadCancelled, RateLimiter, breakers, negative_cache, yahoo_limiter
+
+SHORT_PERIODS = ['1d', '5d', '1mo']
+ACTIVITY_EVENTS = (QEvent.KeyPress, QEvent.MouseButtonPress, QEvent.Wheel)
+
+logger = logging.getLogger(__name__)
+
+
+def is_supported_view(period, interval):
+    """get_stock_data가 다른 기간으로 바꾸지 않는 조합인지"""
+    return interval not in INTRADAY_INTERVALS or period in SHORT_PERIODS
+
+
+def _neighbors(items, current):
+    if current not in items:
+        return []
+    idx = items.index(current)
+    return [items[i] for i in (idx + 1, idx - 1) if 0 <= i < len(items)]
+
+
+def predict_views(symbol, period, interval, periods, intervals, recent_views=()):
+    """다음에 볼 가능성이 높은 (심볼, 기간, 간격) 목록 (가능성 높은 순)
+
+    현재 종목의 인접 기간/간격을 먼저, 그다음 최근 본 종목의 마지막 화면을 넣는다.
+    """
+    candidates = []
+    for next_period in _neighbors(periods, period):
+        candidates.append((symbol, next_period, interval))
+    for next_interval in _neighbors(intervals, interval):
+        candidates.append((symbol, period, next_interval))
+    for recent_symbol, recent_period, recent_interval in recent_views:
+        if recent_symbol != symbol:
+            candidates.append((recent_symbol, recent_period, recent_interval))
+
+    seen = set()
+    views = []
+    for view in candidates:
+        if view in seen or not is_supported_view(view[1], view[2]):
+            continue
+        seen.add(view)
+        views.append(view)
+    return views
+
+
+class PrefetchSignals(QObject):
+    finished = pyqtSignal(int)
+
+
+class PrefetchTask(QRunnable):
+    """후보 화면을 낮은 우선순위로 차례대로 캐시에 채움"""
+
+    def __init__(self, views, cache, budget):
+        super().__init__()
+        self.views = views
+        self.cache = cache
+        self.budget = budget
+        self.cancel_token = CancelToken()
+        self.signals = PrefetchSignals()
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    def run(self):
+        from chart_renderer import chart_columns
+        QThread.currentThread().setPriority(QThread.LowestPriority)
+        columns = chart_columns()
+        loaded = 0
+        try:
+            for symbol, period, interval in self.views:
+                self.cancel_token.check()
+                if self.cache.get(symbol, period, interval) is not None:
+                    continue
+                # 데이터가 없다고 알려진 심볼은 예산을 쓰지 않고 건너뛰고, 야후가 차단 중이면 중단
+                if negative_cache.get(symbol, period, interval) is not None:
+                    continue
+                if breakers['yahoo'].is_open:
+                    break
+                # 사용자 요청 몫의 토큰은 남겨두고, 프리페치 예산이 없으면 중단
+                if yahoo_limiter.available() < config.PREFETCH_TOKEN_RESERVE + 1:
+                    break
+                if not self.budget.try_acquire():
+                    break
+                if self.cache.load(symbol, period, interval, cancel=self.cancel_token,
+                                   columns=columns) is not None:
+                    loaded += 1
+        except LoadCancelled:
+            pass
+        except Exception as e:
+            logger.warning("프리페치 실패: %s - %s", type(e).__name__, e)
+        self.signals.finished.emit(loaded)
+
+
+class Prefetcher(QObject):
+    """유휴 시간 예측 프리페치
+
+    종목을 불러온 뒤 사용자가 잠시 아무 입력도 하지 않으면 같은 종목의 인접
+    기간/간격과 최근 본 종목을 미리 캐시에 넣는다. 키보드/마우스 입력이 들어오면
+    진행 중인 프리페치는 바로 취소되고 다시 유휴 상태가 될 때까지 기다린다.
+    """
+    prefetched = pyqtSignal(int)
+
+    def __init__(self, periods, intervals, cache=None, parent=None):
+        super().__init__(parent)
+        self.periods = list(periods)
+        self.intervals = list(intervals)
+        self.cache = cache or shared_cache
+        self.budget = RateLimiter(config.PREFETCH_MAX_PER_MINUTE / 60.0, config.PREFETCH_MAX_PER_MINUTE)
+        self.recent = OrderedDict()
+        self.current_view = None
+        self.task = None
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(config.PREFETCH_IDLE_MS)
+        self.idle_timer.timeout.connect(self.start_prefetch)
+
+    def install(self, app):
+        """애플리케이션 전체 입력 이벤트를 감시"""
+        app.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() in ACTIVITY_EVENTS:
+            self.notify_activity()
+        return False
+
+    def notify_activity(self):
+        """사용자 입력 발생: 진행 중인 프리페치 취소, 유휴 대기 재시작"""
+        self.cancel()
+        if config.PREFETCH_ENABLED and self.current_view is not None:
+            self.idle_timer.start()
+
+    def view_loaded(self, symbol, period, interval):
+        """화면에 새 종목/기간/간격이 표시됨"""
+        self.current_view = (symbol, period, interval)
+        self.recent.pop(symbol, None)
+        self.recent[symbol] = (symbol, period, interval)
+        while len(self.recent) > config.PREFETCH_RECENT_SYMBOLS:
+            self.recent.popitem(last=False)
+        if config.PREFETCH_ENABLED:
+            self.idle_timer.start()
+
+    def cancel(self):
+        self.idle_timer.stop()
+        task = self.task
+        self.task = None
+        if task is not None and not self.pool.tryTake(task):
+            task.cancel()
+
+    def start_prefetch(self):
+        if not config.PREFETCH_ENABLED or self.current_view is None or self.task is not None:
+            return
+        symbol, period, interval = self.current_view
+        recent_views = reversed(list(self.recent.values()))
+        views = predict_views(symbol, period, interval, self.periods, self.intervals, recent_views)
+        views = [view for view in views if self.cache.get(*view) is None]
+        if not views:
+            return
+        task = PrefetchTask(views, self.cache, self.budget)
+        task.signals.finished.connect(lambda loaded, t=task: self._on_finished(t, loaded))
+        self.task = task
+        self.pool.start(task)
+
+    def _on_finished(self, task, loaded):
+        if self.task is task:
+            self.task = None
+        if loaded:
+            self.prefetched.emit(loaded)
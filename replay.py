@@ -0,0 +1,305 @@
+"""저장된 봉 재생 부하 테스트
+
+저장된 봉 데이터를 한 봉씩 실시간처럼 흘려보내면서 앱과 같은 단계(캐시 저장 → 지표 계산 →
+차트 배열 준비/래스터화, --gui면 ChartCanvas에 반영)를 거치게 하고 처리량과 지연을 잰다.
+
+    python replay.py AAPL --interval 1m --period 5d --speed 60      # 1분봉을 60배속으로
+    python replay.py AAPL MSFT NVDA --speed 0 --bars 500             # 가능한 한 빠르게
+    python replay.py AAPL --offline --gui --output replay.json
+
+- 배속(speed)은 간격 기준이다. 1분봉 1배속은 60초에 한 봉, 0은 기다리지 않고 최대 속도.
+- 각 갱신은 마지막 config.REPLAY_WINDOW_BARS개 봉으로 지표와 차트를 다시 만든다.
+- 배속 재생에서 차트 종목의 다음 봉이 이미 도착해 있으면 이번 봉의 차트는 건너뛰고(누락 프레임)
+  다음 봉과 함께 그린다 (Qt가 밀린 이벤트를 처리한 뒤 한 번 다시 그리는 것과 같음). 다만 마지막으로
+  그린 뒤 config.REPLAY_MAX_STALE_MS가 지났으면 밀려 있어도 그려 화면이 멈추지 않게 한다.
+- 최대 속도에서는 파이프라인이 끝나는 즉시 다음 봉을 넣으므로 모든 봉을 그린다.
+- 지연은 봉이 도착한 시각부터 화면(차트 종목) 또는 지표(그 외 종목)에 반영된 시각까지다.
+"""
+import argparse
+import contextlib
+import heapq
+import json
+import logging
+import sys
+import time
+
+import numpy as np
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# 배속 1일 때 봉 사이 간격(초)
+INTERVAL_SECONDS = {
+    '1m': 60, '2m': 120, '5m': 300, '15m': 900, '30m': 1800, '60m': 3600, '90m': 5400,
+    '1h': 3600, '1d': 86400, '5d': 5 * 86400, '1wk': 7 * 86400, '1mo': 30 * 86400, '3mo': 91 * 86400,
+}
+
+
+def percentiles(samples):
+    """밀리초 단위 p50/p95/p99/최대 (samples는 초 단위)"""
+    if not samples:
+        return {'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0, 'count': 0}
+    values = np.asarray(samples) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99),
+            'max_ms': float(values.max()), 'count': len(values)}
+
+
+def replay_schedule(frames, start_rows):
+    """(봉 순번, 종목, 행 번호) 목록을 시각 순으로 정렬 (같은 시각의 봉은 순번이 같음)
+
+    frames: 종목 → 봉 데이터, start_rows: 종목 → 재생을 시작할 행 번호
+    """
+    def stream(symbol, frame):
+        index = frame.index
+        for row in range(start_rows[symbol], len(frame)):
+            yield index[row], symbol, row
+
+    streams = [stream(symbol, frame) for symbol, frame in frames.items()]
+    schedule = []
+    step, last_time = -1, None
+    for timestamp, symbol, row in heapq.merge(*streams, key=lambda item: item[0]):
+        if timestamp != last_time:
+            step, last_time = step + 1, timestamp
+        schedule.append((step, symbol, row))
+    return schedule
+
+
+class ChartSink:
+    """차트 단계: 배열 준비 후 Agg 래스터화 (canvas가 있으면 앱처럼 ChartCanvas에 반영)"""
+
+    def __init__(self, canvas=None, app=None, size=None):
+        self.canvas = canvas
+        self.app = app
+        if canvas is not None:
+            self.size = canvas.render_size()
+        else:
+            width_px, height_px = size or config.BATCH_IMAGE_SIZE
+            self.size = (width_px, height_px, config.BATCH_IMAGE_DPI)
+
+    def show(self, symbol, data, indicators):
+        from chart_renderer import prepare_chart_arrays, render_figure
+        arrays = prepare_chart_arrays(data, indicators)
+        width_px, height_px, dpi = self.size
+        rendered = render_figure(arrays, symbol, width_px, height_px, dpi)
+        if self.canvas is not None:
+            self.canvas.adopt_rendered(rendered, arrays, symbol, indicators)
+            self.app.processEvents()
+
+
+class BarReplay:
+    """저장된 봉을 배속에 맞춰 파이프라인에 흘려보내고 처리량/지연/누락 프레임 측정"""
+
+    def __init__(self, frames, interval, chart_symbols=None, window=None, max_stale_ms=None,
+                 sink=None, cache=None):
+        from data_cache import DataCache
+        self.frames = {symbol: frame for symbol, frame in frames.items() if frame is not None and len(frame)}
+        self.interval = interval
+        self.window = window or config.REPLAY_WINDOW_BARS
+        self.max_stale = (config.REPLAY_MAX_STALE_MS if max_stale_ms is None else max_stale_ms) / 1000
+        symbols = list(self.frames)
+        self.chart_symbols = set(symbols[:1] if chart_symbols is None else chart_symbols)
+        self.sink = sink or ChartSink()
+        # 사용자의 공유 캐시를 밀어내지 않도록 재생 전용 캐시 사용
+        self.cache = cache or DataCache(max_entries=len(symbols) + 1)
+
+    def _update(self, symbol, row, timings):
+        from technical_analysis import TechnicalAnalysis
+        from chart_renderer import chart_columns
+        start = time.perf_counter()
+        data = self.frames[symbol].iloc[max(0, row + 1 - self.window):row + 1]
+        # 차트 종목은 차트에 그리는 지표만, 그 외 종목은 전체 지표 계산
+        columns = chart_columns() if symbol in self.chart_symbols else None
+        indicators = TechnicalAnalysis(data, self.interval).calculate_all_indicators(columns)
+        computed = time.perf_counter()
+        entry = self.cache.put(symbol, 'replay', self.interval, data, indicators)
+        timings['indicators'].append(computed - start)
+        timings['cache'].append(time.perf_counter() - computed)
+        return entry
+
+    def run(self, speed=0, bars=None, progress=None):
+        """재생 실행 후 결과 사전 반환
+
+        speed: 간격 기준 배속 (0이면 최대 속도), bars: 종목마다 재생할 마지막 봉 수 (기본: 지표 창 이후 전부)
+        """
+        start_rows = {}
+        for symbol, frame in self.frames.items():
+            # 기본은 지표 창만큼(데이터가 짧으면 절반)을 이력으로 두고 나머지를 재생
+            start_rows[symbol] = max(1, len(frame) - bars) if bars else min(self.window, len(frame) // 2)
+        schedule = replay_schedule(self.frames, start_rows)
+        step_seconds = INTERVAL_SECONDS.get(self.interval, 86400) / speed if speed else 0.0
+
+        from fear_greed_store import fear_greed_store
+        # 재생 중에는 공유 캐시를 거치지 않고 직접 계산하므로 Fear_Greed 저장소를 한 번 갱신
+        fear_greed_store.refresh()
+
+        timings = {'indicators': [], 'cache': [], 'chart': []}
+        latencies = []
+        pending = {}          # 차트 종목 → 아직 그리지 않은 봉들의 도착 시각
+        last_draw = {}
+        frames_drawn = dropped = 0
+        max_behind = 0.0
+
+        t0 = time.perf_counter()
+        for i, (step, symbol, row) in enumerate(schedule):
+            if step_seconds:
+                due = t0 + step * step_seconds
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    max_behind = max(max_behind, -delay)
+            else:
+                due = time.perf_counter()
+
+            entry = self._update(symbol, row, timings)
+            if symbol not in self.chart_symbols:
+                latencies.append(time.perf_counter() - due)
+                continue
+
+            pending.setdefault(symbol, []).append(due)
+            now = time.perf_counter()
+            if step_seconds and now - last_draw.get(symbol, t0) < self.max_stale:
+                next_due = self._next_due(schedule, i, symbol, t0, step_seconds)
+                if next_due is not None and next_due <= now:
+                    dropped += 1
+                    continue
+            self._draw(symbol, entry, timings)
+            finished = time.perf_counter()
+            last_draw[symbol] = finished
+            frames_drawn += 1
+            latencies.extend(finished - arrived for arrived in pending.pop(symbol))
+            if progress and frames_drawn % 50 == 0:
+                progress(f"{i + 1}/{len(schedule)} 봉, {(i + 1) / (finished - t0):.1f} bars/s")
+
+        for symbol, arrivals in pending.items():
+            # 끝까지 밀려 있던 봉은 마지막 상태로 한 번 그림
+            entry = self.cache.get(symbol, 'replay', self.interval, max_age=float('inf'))
+            self._draw(symbol, entry, timings)
+            finished = time.perf_counter()
+            frames_drawn += 1
+            latencies.extend(finished - arrived for arrived in arrivals)
+        elapsed = time.perf_counter() - t0
+
+        return {
+            'symbols': list(self.frames),
+            'chart_symbols': sorted(self.chart_symbols),
+            'interval': self.interval,
+            'speed': speed,
+            'window': self.window,
+            'bars': len(schedule),
+            'elapsed_s': elapsed,
+            'bars_per_sec': len(schedule) / elapsed if elapsed else 0.0,
+            'target_bars_per_sec': (len(self.frames) / step_seconds) if step_seconds else None,
+            'frames': frames_drawn,
+            'dropped_frames': dropped,
+            'max_behind_s': max_behind,
+            'latency': percentiles(latencies),
+            'stages': {name: percentiles(samples) for name, samples in timings.items()},
+        }
+
+    def _next_due(self, schedule, i, symbol, t0, step_seconds):
+        """schedule[i] 다음에 오는 같은 종목 봉의 도착 예정 시각 (없으면 None)"""
+        for step, other, _ in schedule[i + 1:i + 1 + 4 * len(self.frames)]:
+            if other == symbol:
+                return t0 + step * step_seconds
+        return None
+
+    def _draw(self, symbol, entry, timings):
+        start = time.perf_counter()
+        self.sink.show(symbol, entry['data'], entry['indicators'])
+        timings['chart'].append(time.perf_counter() - start)
+
+
+def load_frames(symbols, period, interval):
+    """공유 캐시(디스크/네트워크)에서 재생할 봉 데이터 로딩. 실패한 종목은 건너뜀"""
+    from data_cache import shared_cache
+    frames = {}
+    for symbol in symbols:
+        entry = shared_cache.load(symbol, period, interval, columns=())
+        if entry is None:
+            logger.warning("%s 데이터를 가져올 수 없어 재생에서 제외합니다", symbol)
+            continue
+        frames[entry['symbol']] = entry['data']
+    return frames
+
+
+def format_report(report):
+    latency = report['latency']
+    lines = [
+        f"종목 {len(report['symbols'])}개, 봉 {report['bars']}개, {report['elapsed_s']:.1f}s "
+        f"→ {report['bars_per_sec']:.1f} bars/s"
+        + (f" (목표 {report['target_bars_per_sec']:.1f})" if report['target_bars_per_sec'] else " (최대 속도)"),
+        f"차트 프레임 {report['frames']}개, 누락 {report['dropped_frames']}개, "
+        f"최대 밀림 {report['max_behind_s'] * 1000:.0f}ms",
+        f"갱신 지연 p50 {latency['p50_ms']:.1f}ms, p95 {latency['p95_ms']:.1f}ms, "
+        f"p99 {latency['p99_ms']:.1f}ms, 최대 {latency['max_ms']:.1f}ms",
+    ]
+    for name, stats in report['stages'].items():
+        lines.append(f"  {name:<10} p50 {stats['p50_ms']:.1f}ms, p95 {stats['p95_ms']:.1f}ms ({stats['count']}회)")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="STRP 저장된 봉 재생 부하 테스트")
+    parser.add_argument('symbols', nargs='+', help="티커 심볼 목록")
+    parser.add_argument('--period', default=config.DEFAULT_PERIOD)
+    parser.add_argument('--interval', default=config.DEFAULT_INTERVAL)
+    parser.add_argument('--speed', type=float, default=0, help="간격 기준 배속 (0이면 최대 속도)")
+    parser.add_argument('--bars', type=int, default=None, help="종목마다 재생할 마지막 봉 수")
+    parser.add_argument('--window', type=int, default=config.REPLAY_WINDOW_BARS, help="갱신마다 다시 계산할 봉 수")
+    parser.add_argument('--chart', default=None, help="차트를 그릴 종목 (쉼표 구분, 기본: 첫 종목, 'all'이면 전부)")
+    parser.add_argument('--gui', action='store_true', help="ChartCanvas 창에 반영 (QT_QPA_PLATFORM=offscreen 가능)")
+    parser.add_argument('--output', help="결과를 저장할 JSON 경로")
+    parser.add_argument('--offline', action='store_true',
+                        help="네트워크 대신 합성 데이터 사용 (benchmarks 스텁)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=config.LOG_LEVEL,
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    if args.offline:
+        from benchmarks.stubs import offline_providers
+        providers = offline_providers()
+    else:
+        providers = contextlib.nullcontext()
+
+    with providers:
+        frames = load_frames(args.symbols, args.period, args.interval)
+    if not frames:
+        print("재생할 데이터가 없습니다.")
+        return 1
+
+    if args.chart == 'all':
+        chart_symbols = list(frames)
+    elif args.chart:
+        chart_symbols = [s.strip().upper() for s in args.chart.split(',') if s.strip()]
+    else:
+        chart_symbols = None
+
+    sink = None
+    if args.gui:
+        from PyQt5.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication(sys.argv)
+        from chart_canvas import ChartCanvas
+        canvas = ChartCanvas(width=12, height=7)
+        canvas.setWindowTitle("STRP 봉 재생")
+        canvas.show()
+        app.processEvents()
+        sink = ChartSink(canvas, app)
+
+    replay = BarReplay(frames, args.interval, chart_symbols, window=args.window, sink=sink)
+    report = replay.run(args.speed, args.bars, progress=print)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""작업 공간 스냅샷 (종료 시 저장, 다음 실행 때 즉시 복원)
+
+스냅샷은 두 부분으로 나뉜다.
+- 화면 값: 심볼/기간/간격, 탭, 종목 정보/지표 텍스트, 경제 지표 값, 차트 이미지(PNG).
+  기본 파이썬 타입만 담으므로 pandas/matplotlib을 불러오기 전에 바로 읽어 창에 표시할 수 있다.
+- 데이터('frames'): 봉 데이터, 종목 정보, 지표, 차트 배열. 한 번 더 pickle한 바이트로
+  넣어 두고 모듈 로딩이 끝난 뒤 unpack_frames()로 푼다.
+"""
+import logging
+import numbers
+import os
+import pickle
+import time
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# 차트 배열/지표 열 구성이 바뀌면 올림 (이전 스냅샷은 무시하고 새로 불러옴)
+SNAPSHOT_VERSION = 3
+
+
+def pack_frames(data, info, indicators, chart_arrays):
+    return pickle.dumps({
+        'data': data,
+        'info': info,
+        'indicators': indicators,
+        'chart_arrays': chart_arrays,
+    }, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def unpack_frames(blob):
+    """pack_frames()로 묶은 데이터 (pandas/numpy가 import됨)"""
+    return pickle.loads(blob)
+
+
+def plain_values(values):
+    """numpy 숫자를 float로 바꾼 사전 (화면 값 부분이 numpy 없이 읽히도록)"""
+    def plain(value):
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, numbers.Integral):
+            return int(value)
+        if isinstance(value, numbers.Real):
+            return float(value)
+        return value
+    return {key: plain(value) for key, value in values.items()}
+
+
+def save_snapshot(snapshot, path=None):
+    """스냅샷 저장 (임시 파일에 쓴 뒤 교체). 저장한 경로 반환"""
+    path = path or config.SESSION_SNAPSHOT_PATH
+    snapshot = dict(snapshot, version=SNAPSHOT_VERSION, saved_at=time.time())
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_snapshot(path=None):
+    """저장된 스냅샷 (없거나 읽을 수 없으면 None)"""
+    path = path or config.SESSION_SNAPSHOT_PATH
+    try:
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("세션 스냅샷을 읽을 수 없습니다 (%s): %s", path, e)
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+        logger.info("세션 스냅샷 형식이 달라 무시합니다: %s", path)
+        return None
+    return snapshot
@@ -0,0 +1,83 @@
+import importlib
+import logging
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QEvent, pyqtSignal
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# 창을 띄운 뒤 백그라운드에서 미리 불러올 무거운 모듈 (Qt 위젯을 만들지 않는 것만)
+WARMUP_MODULES = [
+    'pandas',
+    'requests',
+    'yfinance',
+    'fredapi',
+    'matplotlib.figure',
+    'matplotlib.backends.backend_agg',
+    'data_fetcher',
+    'technical_analysis',
+    'chart_renderer',
+    'data_cache',
+]
+
+
+class StartupTimer(QObject):
+    """프로그램 시작 단계별 경과 시간 기록 (첫 화면 표시까지의 시간 추적)"""
+    first_painted = pyqtSignal()
+
+    def __init__(self, started=None, parent=None):
+        super().__init__(parent)
+        self.started = started if started is not None else time.perf_counter()
+        self.marks = {}
+        self._watched = None
+
+    def mark(self, name):
+        """시작 시점부터 지금까지의 시간(ms)을 name으로 기록"""
+        elapsed = time.perf_counter() - self.started
+        self.marks[name] = elapsed * 1000
+        metrics.record(f'startup.{name}', elapsed)
+        return self.marks[name]
+
+    def watch_first_paint(self, widget):
+        """widget의 첫 Paint 이벤트 시점을 'first_paint'로 기록"""
+        self._watched = widget
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self._watched and event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self._watched = None
+            self.mark('first_paint')
+            self.first_painted.emit()
+        return False
+
+    def report(self):
+        """단계별 시간 요약 문자열"""
+        return ", ".join(f"{name} {ms:.0f}ms" for name, ms in self.marks.items())
+
+
+class WarmupSignals(QObject):
+    finished = pyqtSignal(object)
+
+
+class ModuleWarmupTask(QRunnable):
+    """무거운 모듈을 워커 스레드에서 미리 import (결과: 모듈별 소요 시간 ms)"""
+
+    def __init__(self, modules=None):
+        super().__init__()
+        self.modules = modules or WARMUP_MODULES
+        self.signals = WarmupSignals()
+
+    def run(self):
+        timings = {}
+        for name in self.modules:
+            start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                # 실제로 사용할 때 다시 import하며 오류가 드러나도록 여기서는 기록만 한다
+                logger.warning("모듈 미리 불러오기 실패: %s - %s", name, e)
+            timings[name] = (time.perf_counter() - start) * 1000
+        self.signals.finished.emit(timings)
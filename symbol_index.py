@@ -0,0 +1,369 @@
+import csv
+import logging
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+import config
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# 색인으로 확인할 수 있는 미국 상장 티커 모양 (야후 표기: 클래스 주식은 '-', 예: BRK-B).
+# 그 밖의 심볼(005930.KS, ^GSPC, EURUSD=X, BTC-USD)은 색인으로 판단하지 않음
+US_SYMBOL = re.compile(r'^[A-Z][A-Z0-9]{0,4}(-[A-Z]{1,2})?$')
+# 다섯 글자 심볼 중 이 글자로 끝나는 것은 뮤추얼 펀드/장외 종목일 수 있어 색인에 없어도 판단하지 않음
+UNLISTED_SUFFIXES = ('X', 'Y', 'F')
+# 회사 이름에서 검색어로 쓰지 않는 흔한 단어
+STOP_WORDS = frozenset({'inc', 'corp', 'co', 'ltd', 'plc', 'llc', 'lp', 'sa', 'nv', 'ag', 'the', 'and',
+                        'of', 'class', 'common', 'stock', 'shares', 'ordinary'})
+_WORD = re.compile(r'[0-9a-z]+')
+
+
+def parse_directory(text):
+    """nasdaqtraded.txt('|' 구분) → [(야후 표기 심볼, 회사 이름), ...] (시험용 종목과 마지막 생성 시각 줄 제외)"""
+    lines = text.splitlines()
+    if not lines:
+        return []
+    header = lines[0].split('|')
+    symbol_col = header.index('Symbol')
+    name_col = header.index('Security Name')
+    test_col = header.index('Test Issue') if 'Test Issue' in header else None
+    rows = []
+    for line in lines[1:]:
+        fields = line.split('|')
+        if len(fields) != len(header) or (test_col is not None and fields[test_col] == 'Y'):
+            continue
+        symbol = fields[symbol_col].strip().replace('.', '-')
+        if US_SYMBOL.match(symbol):
+            # "Apple Inc. - Common Stock" → "Apple Inc."
+            rows.append((symbol, fields[name_col].split(' - ')[0].strip()))
+    return rows
+
+
+def name_words(name):
+    """회사 이름의 검색 단어 (소문자, 흔한 단어 제외)"""
+    return [word for word in _WORD.findall(name.lower()) if word not in STOP_WORDS]
+
+
+def _search(keys, value, side='left'):
+    """정렬된 바이트 배열에서 value의 위치 (value를 배열 dtype으로 바꿔 배열 전체가 복사되지 않게 함)"""
+    if len(value) > keys.dtype.itemsize:
+        # 배열의 어떤 값보다 긴 값: 그 앞부분과 같은 값들 바로 뒤
+        return int(np.searchsorted(keys, np.array(value[:keys.dtype.itemsize], dtype=keys.dtype),
+                                   side='right'))
+    return int(np.searchsorted(keys, np.array(value, dtype=keys.dtype), side=side))
+
+
+def _prefix_range(keys, prefix):
+    """정렬된 바이트 배열에서 prefix로 시작하는 구간 [lo, hi)"""
+    if len(prefix) > keys.dtype.itemsize:
+        return 0, 0
+    lo = _search(keys, prefix)
+    if len(prefix) == keys.dtype.itemsize:
+        return lo, _search(keys, prefix, side='right')
+    return lo, _search(keys, prefix + b'\xff')
+
+
+def _smallest(ranks, limit):
+    """ranks가 작은 순서로 limit개의 위치 (같으면 앞쪽 = 알파벳 순)
+
+    구간이 커도 전체를 정렬하지 않고, limit번째 값보다 작은 것만 정렬한 뒤
+    그 값과 같은 것을 앞에서부터 채운다.
+    """
+    if len(ranks) <= limit:
+        positions = np.arange(len(ranks))
+        return positions[np.argsort(ranks, kind='stable')]
+    cutoff = np.partition(ranks, limit - 1)[limit - 1]
+    less = np.flatnonzero(ranks < cutoff)
+    less = less[np.argsort(ranks[less], kind='stable')]
+    ties = np.flatnonzero(ranks == cutoff)[:limit - len(less)]
+    return np.concatenate([less, ties])
+
+
+def _transposed(a, b):
+    """a와 b가 이웃한 두 글자의 자리만 바뀐 관계인지"""
+    if len(a) != len(b):
+        return False
+    diff = [i for i in range(len(a)) if a[i] != b[i]]
+    return (len(diff) == 2 and diff[1] == diff[0] + 1
+            and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]])
+
+
+def _deletes(word):
+    """[(word, -1), (i번째 글자를 지운 변형, i), ...]"""
+    return [(word, -1)] + [(word[:i] + word[i + 1:], i) for i in range(len(word))]
+
+
+class SymbolIndex:
+    """심볼/회사 이름 검색 색인
+
+    심볼과 이름 단어를 각각 정렬된 바이트 배열로 두고 searchsorted 두 번으로 접두어 구간을 찾는다.
+    오타 검색용 삭제 변형 배열(편집 거리 1)은 처음 오타 검색을 할 때 만든다. 변형마다 지운 글자 위치를
+    함께 두어, 같은 변형을 공유하는 심볼이 삽입/삭제/치환인지 편집 거리 계산 없이 가린다.
+    """
+
+    def __init__(self, rows=()):
+        rows = sorted(dict(rows).items())
+        self.names = [name for _, name in rows]
+        self.symbols = np.array([symbol.encode('ascii') for symbol, _ in rows], dtype='S') \
+            if rows else np.array([], dtype='S1')
+        self.lengths = np.char.str_len(self.symbols).astype(np.int32)
+
+        tokens, owners, positions = [], [], []
+        for i, name in enumerate(self.names):
+            for position, word in enumerate(name_words(name)):
+                tokens.append(word.encode('utf-8'))
+                owners.append(i)
+                positions.append(position)
+        tokens = np.array(tokens, dtype='S') if tokens else np.array([], dtype='S1')
+        order = np.argsort(tokens, kind='stable')
+        self.tokens = tokens[order]
+        self.token_owners = np.array(owners, dtype=np.int32)[order]
+        # 이름 첫 단어 일치를 뒤쪽 단어 일치보다, 같으면 짧은 심볼을 앞에
+        self.token_ranks = (np.minimum(np.array(positions, dtype=np.int32)[order], 3) * 16
+                            + self.lengths[self.token_owners])
+
+        # 색인에는 없지만 실제로 데이터를 받은 심볼 (심볼 → 이름)
+        self.extra = {}
+        self._delete_keys = None
+        self._delete_owners = None
+        self._delete_places = None
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.symbols) + len(self.extra)
+
+    def _find(self, symbol):
+        """색인에서 심볼 위치 (없으면 None)"""
+        key = symbol.encode('ascii', 'ignore')
+        if not key or len(key) > self.symbols.dtype.itemsize:
+            return None
+        i = _search(self.symbols, key)
+        if i < len(self.symbols) and self.symbols[i] == key:
+            return i
+        return None
+
+    def contains(self, symbol):
+        symbol = symbol.upper()
+        return symbol in self.extra or self._find(symbol) is not None
+
+    def add(self, symbol, name=''):
+        """실제로 데이터를 받은 심볼을 색인에 추가 (다음 새로고침 전까지 유지)"""
+        symbol = symbol.upper()
+        if self._find(symbol) is None:
+            with self.lock:
+                self.extra[symbol] = name or self.extra.get(symbol, '')
+
+    def _build_deletes(self):
+        with self.lock:
+            if self._delete_keys is not None:
+                return
+            keys, owners, places = [], [], []
+            for i, symbol in enumerate(self.symbols.tolist()):
+                for variant, place in _deletes(symbol):
+                    keys.append(variant)
+                    owners.append(i)
+                    places.append(place)
+            keys = np.array(keys, dtype='S') if keys else np.array([], dtype='S1')
+            order = np.argsort(keys, kind='stable')
+            self._delete_owners = np.array(owners, dtype=np.int32)[order]
+            self._delete_places = np.array(places, dtype=np.int8)[order]
+            self._delete_keys = keys[order]
+
+    def prepare(self):
+        """오타 검색용 배열을 미리 만들기 (워커 스레드에서 호출하면 첫 검색이 빨라짐)"""
+        self._build_deletes()
+        return self
+
+    def _fuzzy(self, key):
+        """key와 편집 거리 1인 심볼 위치 (짧은 심볼 → 알파벳 순)"""
+        self._build_deletes()
+        query = key.encode('ascii', 'ignore')
+        found, adjacent = [], set()
+        for variant, place in _deletes(query):
+            lo = _search(self._delete_keys, variant)
+            hi = _search(self._delete_keys, variant, side='right')
+            if lo == hi:
+                continue
+            owners = self._delete_owners[lo:hi]
+            places = self._delete_places[lo:hi].astype(np.int32)
+            if place < 0:
+                # 심볼에서 한 글자를 지우면 key (삽입)
+                found.append(owners[places >= 0])
+                continue
+            # key에서 한 글자를 지우면 심볼 (삭제), 같은 자리를 지우면 같음 (치환)
+            found.append(owners[(places < 0) | (places == place)])
+            # 이웃한 자리를 지워 같아지면 인접 문자 바꿈일 수 있어 직접 확인
+            adjacent.update(owners[(places >= 0) & (np.abs(places - place) == 1)].tolist())
+        close = np.concatenate(found) if found else np.array([], dtype=np.int32)
+        close = np.union1d(close, [i for i in adjacent if _transposed(query, self.symbols[i])])
+        close = close[self.symbols[close.astype(np.int64)] != query].astype(np.int64)
+        return close[np.argsort(self.lengths[close], kind='stable')]
+
+    def search(self, text, limit=None):
+        """입력에 맞는 후보 [(심볼, 이름), ...] (순위순)
+
+        순위: 심볼 일치 → 심볼 접두어 → 회사 이름 단어 접두어 → 오타(편집 거리 1) 심볼.
+        같은 단계에서는 짧은 심볼, 그다음 알파벳 순.
+        """
+        limit = limit or config.SYMBOL_SUGGESTIONS
+        text = text.strip()
+        if not text:
+            return []
+        key = text.upper()
+        results = {}
+
+        def take(indices):
+            for i in indices:
+                if len(results) >= limit:
+                    return
+                results.setdefault(self.symbols[i].decode('ascii'), self.names[i])
+
+        with self.lock:
+            extra = sorted(self.extra.items(), key=lambda item: (len(item[0]), item[0]))
+        for symbol, name in extra:
+            if symbol == key:
+                results[symbol] = name
+
+        exact = self._find(key)
+        if exact is not None:
+            take([exact])
+        if len(results) < limit and key.isascii():
+            lo, hi = _prefix_range(self.symbols, key.encode('ascii'))
+            take(lo + _smallest(self.lengths[lo:hi], limit + 1))
+            for symbol, name in extra:
+                if len(results) < limit and symbol.startswith(key):
+                    results.setdefault(symbol, name)
+
+        words = name_words(text) or _WORD.findall(text.lower())
+        if len(results) < limit and words:
+            # 후보가 가장 많은 단어의 구간에서 순위를 매기고, 나머지 단어로도 시작하는 이름만 남김
+            ranges = sorted((_prefix_range(self.tokens, word.encode('utf-8')) for word in set(words)),
+                            key=lambda bounds: bounds[1] - bounds[0])
+            lo, hi = ranges[-1]
+            owners = self.token_owners[lo:hi]
+            ranks = self.token_ranks[lo:hi]
+            for other_lo, other_hi in ranges[:-1]:
+                mask = np.zeros(len(self.names), dtype=bool)
+                mask[self.token_owners[other_lo:other_hi]] = True
+                keep = mask[owners]
+                owners, ranks = owners[keep], ranks[keep]
+            # 같은 이름에 단어가 여러 번 걸릴 수 있어 여유 있게 고른 뒤 take에서 중복 제거
+            take(owners[_smallest(ranks, 2 * limit + 1)])
+
+        if len(results) < limit and len(key) >= 3 and US_SYMBOL.match(key):
+            take(self._fuzzy(key))
+        return list(results.items())
+
+    def validate(self, symbol):
+        """네트워크 요청 전 심볼 확인: {'valid': True/False/None, 'suggestions': [(심볼, 이름), ...]}
+
+        valid가 None이면 색인으로 판단할 수 없는 경우 (색인이 비었거나 미국 외 심볼, 지수, 환율,
+        뮤추얼 펀드/장외 종목일 수 있는 다섯 글자 심볼).
+        """
+        symbol = symbol.strip().upper()
+        unknown = {'valid': None, 'suggestions': []}
+        if not len(self) or not US_SYMBOL.match(symbol):
+            return unknown
+        if self.contains(symbol):
+            return {'valid': True, 'suggestions': []}
+        if len(symbol) == 5 and symbol.endswith(UNLISTED_SUFFIXES):
+            return unknown
+        return {'valid': False, 'suggestions': self.search(symbol)}
+
+
+class SymbolStore:
+    """티커 심볼 색인 로컬 저장소
+
+    처음 사용할 때 저장된 CSV에서 색인을 만들고, config.SYMBOL_INDEX_REFRESH_SEC보다 오래되었으면
+    나스닥 심볼 디렉터리를 다시 받는다 (파일 수정 시각 기준). 프로그램 시작 때는 읽지 않는다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or config.SYMBOL_INDEX_PATH
+        self._index = None
+        self.lock = threading.Lock()
+
+    @property
+    def index(self):
+        """이미 만든 색인 (아직 없으면 None, 파일을 읽지 않음)"""
+        return self._index
+
+    def checked_age(self):
+        """마지막으로 받은 뒤 지난 시간(초). 저장된 적 없으면 None"""
+        try:
+            return time.time() - os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def _read(self):
+        try:
+            with open(self.path, newline='', encoding='utf-8') as f:
+                return [(row[0], row[1]) for row in csv.reader(f) if len(row) >= 2]
+        except OSError:
+            return []
+
+    def _save(self, rows):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+        os.replace(tmp_path, self.path)
+
+    def _fetch(self):
+        # data_fetcher의 지연 import 대리 객체를 써서 오프라인 스텁과 같은 경로로 요청
+        import data_fetcher
+        with data_fetcher.breakers['nasdaq'].guard():
+            with metrics.span('fetch.symbols'):
+                response = data_fetcher.requests.get(config.SYMBOL_INDEX_URL, timeout=15)
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+        with metrics.span('parse.symbols'):
+            return parse_directory(response.text)
+
+    def _replace(self, rows):
+        index = SymbolIndex(rows)
+        if self._index is not None:
+            index.extra = {symbol: name for symbol, name in self._index.extra.items()
+                           if index._find(symbol) is None}
+        self._index = index
+        return index
+
+    def update(self, max_age=None):
+        """색인을 만들거나 최신으로 맞춘 뒤 반환
+
+        받기에 실패하면 저장된(오래된) 색인을, 저장된 것도 없으면 빈 색인을 돌려준다
+        (빈 색인은 모든 심볼을 '판단할 수 없음'으로 처리).
+        """
+        max_age = config.SYMBOL_INDEX_REFRESH_SEC if max_age is None else max_age
+        with self.lock:
+            age = self.checked_age()
+            if self._index is None:
+                with metrics.span('symbols.load'):
+                    self._replace(self._read())
+            if age is not None and age < max_age:
+                return self._index
+            try:
+                rows = self._fetch()
+            except Exception as e:
+                logger.warning("심볼 목록 갱신 실패, 저장된 목록 사용 (%d개): %s", len(self._index.symbols), e)
+                return self._index
+            if not rows:
+                return self._index
+            self._save(rows)
+            logger.info("심볼 목록 갱신: %d개", len(rows))
+            return self._replace(rows)
+
+    def remember(self, symbol, name=''):
+        """데이터를 받은 심볼을 색인에 추가 (색인을 아직 만들지 않았으면 무시)"""
+        if self._index is not None:
+            self._index.add(symbol, name)
+
+
+symbol_store = SymbolStore()
@@ -1,100 +1,400 @@
 import pandas as pd
 import numpy as np
-from ta.momentum import RSIIndicator, WilliamsRIndicator
-from ta.trend import MACD
-from ta.volatility import AverageTrueRange, BollingerBands
-from ta.volume import OnBalanceVolumeIndicator
+
+import config
+from fear_greed_store import fear_greed_store
+
+# calculate_all_indicators()가 봉 데이터 옆에 추가하는 열
+# (Fear_Greed는 봉이 아니라 fear_greed_store의 로컬 파일(config.FEAR_GREED_STORE_PATH) 이력에서 나옴)
+INDICATOR_COLUMNS = ['RSI', 'MACD', 'MACD_Signal', 'MACD_Histogram', 'Williams_R',
+                     'MA20', 'MA50', 'MA200', 'BB_Upper', 'BB_Middle', 'BB_Lower',
+                     'ATR', 'OBV', 'Volume_MA', 'VWAP', 'VWAP_Upper', 'VWAP_Lower', 'Fear_Greed']
+# latest_signals()(기술적 지표 탭, API /signals)가 읽는 열
+SIGNAL_COLUMNS = ['RSI', 'MACD', 'MACD_Signal', 'MACD_Histogram', 'Williams_R',
+                  'MA20', 'MA50', 'MA200', 'BB_Upper', 'BB_Middle', 'BB_Lower',
+                  'ATR', 'OBV', 'Volume_MA']
+BAR_INPUTS = ['Open', 'High', 'Low', 'Close', 'Volume']
+# 하루에 봉이 여러 개인 간격 (VWAP를 세션마다 새로 시작)
+INTRADAY_INTERVALS = ['1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h']
+# 지표 계산 그래프가 읽는 config 값 (indicator_graph(params)로 덮어쓸 수 있음)
+GRAPH_PARAMS = ['RSI_PERIOD', 'MACD_FAST', 'MACD_SLOW', 'MACD_SIGNAL', 'WILLIAMS_R_PERIOD',
+                'BB_PERIOD', 'BB_STD_DEV', 'ATR_PERIOD', 'VOLUME_MA_PERIOD', 'VWAP_BAND_STD']
+
+
+def as_float64(values):
+    """float64로 변환 (캐시의 float32 가격은 float32 유효 자릿수(7자리)로 반올림해 늘어난 꼬리 자릿수 제거)
+
+    113.07을 float32로 보관했다가 그대로 늘리면 113.07026672363281이 되므로 지표 계산과
+    출력 전에 원래 값에 가장 가까운 10진수로 되돌린다. Series를 주면 Series로 돌려준다.
+    """
+    if values.dtype != np.float32:
+        return values.astype(float)
+    widened = np.asarray(values, dtype=float)
+    with np.errstate(divide='ignore'):
+        magnitude = np.floor(np.log10(np.abs(widened)))
+    scale = 10.0 ** np.clip(6 - np.nan_to_num(magnitude, nan=0.0, posinf=0.0, neginf=0.0), 0, 12)
+    restored = np.round(widened * scale) / scale
+    if isinstance(values, pd.Series):
+        return pd.Series(restored, index=values.index, name=values.name)
+    return restored
+
+
+def _wilder_atr(true_range, n):
+    """ta의 AverageTrueRange와 같은 값 (첫 n개 평균으로 시작하는 와일더 평활, 그 전은 0)"""
+    atr = pd.Series(0.0, index=true_range.index)
+    if len(true_range) < n:
+        return atr * np.nan
+    seeded = true_range.iloc[n - 1:].copy()
+    seeded.iloc[0] = true_range.iloc[:n].mean()
+    atr.iloc[n - 1:] = seeded.ewm(alpha=1 / n, adjust=False).mean().to_numpy()
+    return atr
+
+
+def _rsi(gain, loss):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 - 100 / (1 + gain / loss)
+    return pd.Series(np.where(loss == 0, 100, rsi), index=gain.index)
+
+
+def _vwap(high, low, close, volume, std_dev, intraday):
+    """분봉(intraday)이면 세션 VWAP, 일봉 이상이면 첫 봉부터 누적한 VWAP"""
+    groups = session_ids(close.index) if intraday else None
+    return vwap_bands(high.to_numpy(), low.to_numpy(), close.to_numpy(), volume.to_numpy(),
+                      groups=groups, std_dev=std_dev)
+
+
+def _column_of(position):
+    def pick(bands):
+        return bands[position]
+    return pick
+
+
+def indicator_graph(params=None, interval=None):
+    """지표 계산 그래프: 노드 이름 → (입력 노드, 계산 함수, 값이 나오는 데 필요한 최소 봉 수)
+
+    중간 값은 '연산(입력,기간)' 이름을 쓰므로 같은 기간을 쓰는 지표(MA20과 BB 중심선,
+    MACD와 신호선의 EMA 등)는 같은 노드를 공유해 한 번만 계산된다. 기간은 호출할 때
+    config에서 읽는다 (params로 일부만 덮어쓸 수 있음). interval은 봉 간격으로, VWAP를
+    세션마다 새로 시작할지 정한다.
+    """
+    intraday = interval in INTRADAY_INTERVALS
+    p = {name: getattr(config, name) for name in GRAPH_PARAMS}
+    p.update({name: value for name, value in (params or {}).items() if value is not None})
+    graph = {}
+
+    def node(name, inputs, func, warmup=1):
+        graph.setdefault(name, (list(inputs), func, warmup))
+        return name
+
+    def sma(column, n):
+        return node(f'sma({column},{n})', [column], lambda x: x.rolling(n, min_periods=n).mean(), n)
+
+    def std(column, n):
+        return node(f'std({column},{n})', [column], lambda x: x.rolling(n, min_periods=n).std(ddof=0), n)
+
+    def ema(column, n):
+        return node(f'ema({column},{n})', [column], lambda x: x.ewm(span=n, min_periods=n, adjust=False).mean(), n)
+
+    def wilder(column, n):
+        return node(f'wilder({column},{n})', [column],
+                    lambda x: x.ewm(alpha=1 / n, min_periods=n, adjust=False).mean(), n + 1)
+
+    def rolling_max(column, n):
+        return node(f'max({column},{n})', [column], lambda x: x.rolling(n, min_periods=n).max(), n)
+
+    def rolling_min(column, n):
+        return node(f'min({column},{n})', [column], lambda x: x.rolling(n, min_periods=n).min(), n)
+
+    node('delta', ['Close'], lambda close: close.diff(), 2)
+    node('gain', ['delta'], lambda delta: delta.where(delta > 0, 0.0))
+    node('loss', ['delta'], lambda delta: -delta.where(delta < 0, 0.0))
+    node('true_range', ['High', 'Low', 'Close'],
+         lambda high, low, close: pd.concat([high - low, (high - close.shift(1)).abs(),
+                                             (low - close.shift(1)).abs()], axis=1).max(axis=1))
+
+    rsi = p['RSI_PERIOD']
+    node('RSI', [wilder('gain', rsi), wilder('loss', rsi)], _rsi, rsi + 1)
+
+    fast, slow, signal = p['MACD_FAST'], p['MACD_SLOW'], p['MACD_SIGNAL']
+    node('MACD', [ema('Close', fast), ema('Close', slow)], lambda f, s: f - s, max(fast, slow))
+    node('MACD_Signal', [ema('MACD', signal)], lambda x: x, max(fast, slow) + signal - 1)
+    node('MACD_Histogram', ['MACD', 'MACD_Signal'], lambda m, s: m - s, max(fast, slow) + signal - 1)
+
+    wr = p['WILLIAMS_R_PERIOD']
+    node('Williams_R', [rolling_max('High', wr), rolling_min('Low', wr), 'Close'],
+         lambda hh, ll, close: -100 * (hh - close) / (hh - ll), wr)
+
+    for period in (20, 50, 200):
+        node(f'MA{period}', [sma('Close', period)], lambda x: x, period)
+
+    bb, dev = p['BB_PERIOD'], p['BB_STD_DEV']
+    node('BB_Middle', [sma('Close', bb)], lambda x: x, bb)
+    node('BB_Upper', [sma('Close', bb), std('Close', bb)], lambda m, s: m + dev * s, bb)
+    node('BB_Lower', [sma('Close', bb), std('Close', bb)], lambda m, s: m - dev * s, bb)
+
+    atr = p['ATR_PERIOD']
+    node('ATR', ['true_range'], lambda tr: _wilder_atr(tr, atr), atr)
+    node('OBV', ['delta', 'Volume'], lambda delta, volume: volume.where(~(delta < 0), -volume).cumsum())
+    node('Volume_MA', [sma('Volume', p['VOLUME_MA_PERIOD'])], lambda x: x, p['VOLUME_MA_PERIOD'])
+
+    node('vwap_bands', ['High', 'Low', 'Close', 'Volume'],
+         lambda h, l, c, v: _vwap(h, l, c, v, p['VWAP_BAND_STD'], intraday))
+    for position, column in enumerate(['VWAP', 'VWAP_Upper', 'VWAP_Lower']):
+        node(column, ['vwap_bands'], _column_of(position))
+
+    # 봉이 아닌 로컬 저장소의 일별 지수를 봉 시각에 as-of로 맞춘 값 (저장소 갱신은 호출하는 쪽에서)
+    node('Fear_Greed', ['Close'], lambda close: fear_greed_store.aligned(close.index))
+    return graph
+
+
+def plan_indicators(columns, n_bars=None, graph=None):
+    """columns를 계산하는 데 필요한 노드만 의존 순서대로 나열
+
+    반환: (계산할 노드 목록, 봉이 모자라 NaN으로 채울 열 목록). n_bars가 주어지면 그보다
+    긴 창이 필요한 열(5일치 데이터의 MA200 등)은 입력까지 통째로 건너뛴다.
+    """
+    graph = graph or indicator_graph()
+    order, skipped, seen = [], [], set()
+
+    def visit(name):
+        if name in seen or name in BAR_INPUTS:
+            return
+        seen.add(name)
+        inputs, _, _ = graph[name]
+        for dependency in inputs:
+            visit(dependency)
+        order.append(name)
+
+    for column in columns:
+        if column not in graph:
+            raise KeyError(f"알 수 없는 지표: {column}")
+        if n_bars is not None and graph[column][2] > n_bars:
+            skipped.append(column)
+            continue
+        visit(column)
+    return order, skipped
+
+
+def compute_indicators(data, columns=None, params=None, interval=None):
+    """data(interval 간격 봉)에서 columns(기본: INDICATOR_COLUMNS) 지표만 계산 → {열 이름: Series}"""
+    columns = INDICATOR_COLUMNS if columns is None else list(columns)
+    graph = indicator_graph(params, interval)
+    order, skipped = plan_indicators(columns, len(data), graph)
+    values = {}
+    for name in order:
+        inputs, func, _ = graph[name]
+        args = []
+        for dependency in inputs:
+            if dependency not in values:
+                # 압축된 봉(float32/정수)도 float64로 계산
+                values[dependency] = as_float64(data[dependency])
+            args.append(values[dependency])
+        values[name] = func(*args)
+    result = {}
+    for column in columns:
+        if column in skipped:
+            result[column] = pd.Series(np.nan, index=data.index)
+        else:
+            result[column] = pd.Series(values[column], index=data.index)
+    return result
+
+
+def with_columns(frame, columns, interval=None):
+    """frame(interval 간격 봉 + 지표)에 없는 지표 열만 계산해 붙인 새 프레임 (모두 있으면 frame 그대로)"""
+    missing = [column for column in columns if column not in frame.columns]
+    if not missing:
+        return frame
+    added = compute_indicators(frame, missing, interval=interval)
+    merged = {column: frame[column] for column in frame.columns}
+    merged.update(added)
+    return pd.DataFrame(merged, index=frame.index, copy=False)
+
+
+def session_ids(index):
+    """봉마다 거래일(세션) 번호 (인덱스의 현지 날짜가 바뀔 때마다 1 증가)"""
+    if not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
+        return np.zeros(len(index), dtype=np.int64)
+    days = index.normalize().asi8
+    return np.concatenate([[0], np.cumsum(days[1:] != days[:-1])])
+
+
+def vwap_bands(high, low, close, volume, groups=None, std_dev=2):
+    """거래량 가중 평균 가격과 거래량 가중 표준편차 밴드 (vwap, upper, lower 배열)
+
+    groups가 주어지면 값이 바뀌는 지점(세션/앵커)마다 누적을 새로 시작한다.
+    누적합은 그룹 첫 봉의 대표 가격을 뺀 값으로 계산해 분산의 자릿수 손실을 줄인다.
+    """
+    typical = (high + low + close) / 3
+    weight = np.where(np.isnan(typical) | np.isnan(volume), 0.0, volume)
+    if groups is None:
+        groups = np.zeros(len(typical), dtype=np.int64)
+    is_start = np.concatenate([[True], groups[1:] != groups[:-1]])[:len(typical)]
+    starts = np.flatnonzero(is_start)
+    group_of = np.cumsum(is_start) - 1
+
+    reference = np.nan_to_num(typical[starts])[group_of]
+    centered = np.where(weight > 0, typical - reference, 0.0)
+
+    def grouped_cumsum(values):
+        total = np.cumsum(values)
+        before = np.concatenate([[0.0], total])[starts]
+        return total - before[group_of]
+
+    cum_volume = grouped_cumsum(weight)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = grouped_cumsum(weight * centered) / cum_volume
+        variance = grouped_cumsum(weight * centered * centered) / cum_volume - mean * mean
+    std = np.sqrt(np.maximum(variance, 0.0))
+    vwap = reference + mean
+    return vwap, vwap + std_dev * std, vwap - std_dev * std
+
+
+def volume_profile(high, low, volume, bins=None, value_area=None):
+    """가격대별 거래량 (각 봉의 거래량을 저가~고가 구간에 고르게 나눠 누적)
+
+    반환: {'edges', 'volume', 'poc', 'value_area_low', 'value_area_high'}
+    poc는 거래량이 가장 많은 가격대의 중간 가격, value area는 poc에서 시작해 위/아래 중
+    거래량이 많은 쪽으로 넓혀 전체 거래량의 value_area 비율을 담는 가격 구간이다.
+    """
+    bins = bins or config.VOLUME_PROFILE_BINS
+    value_area = value_area or config.VOLUME_PROFILE_VALUE_AREA
+    valid = ~(np.isnan(high) | np.isnan(low) | np.isnan(volume))
+    high, low, volume = high[valid], low[valid], volume[valid]
+    if not len(volume) or volume.sum() <= 0:
+        return None
+
+    edges = np.linspace(low.min(), high.max(), bins + 1)
+    if edges[-1] <= edges[0]:
+        edges = np.linspace(edges[0] - 0.5, edges[0] + 0.5, bins + 1)
+    first = np.clip(np.searchsorted(edges, low, side='right') - 1, 0, bins - 1)
+    last = np.clip(np.searchsorted(edges, high, side='right') - 1, 0, bins - 1)
+    share = volume / (last - first + 1)
+    # 봉마다 [first, last] 구간에 share를 더하는 대신 차분 배열에 시작/끝만 기록한 뒤 누적합
+    diff = (np.bincount(first, weights=share, minlength=bins + 1)
+            - np.bincount(last + 1, weights=share, minlength=bins + 1))
+    profile = np.cumsum(diff)[:bins]
+
+    poc = int(np.argmax(profile))
+    target = profile.sum() * value_area
+    low_bin = high_bin = poc
+    covered = profile[poc]
+    # 가격대 수(bins)만큼만 도는 반복이라 봉 수와 무관
+    while covered < target and (low_bin > 0 or high_bin < bins - 1):
+        below = profile[low_bin - 1] if low_bin > 0 else -1.0
+        above = profile[high_bin + 1] if high_bin < bins - 1 else -1.0
+        if above >= below:
+            high_bin += 1
+            covered += above
+        else:
+            low_bin -= 1
+            covered += below
+
+    return {
+        'edges': edges,
+        'volume': profile,
+        'poc': (edges[poc] + edges[poc + 1]) / 2,
+        'value_area_low': edges[low_bin],
+        'value_area_high': edges[high_bin + 1],
+    }
+
 
 class TechnicalAnalysis:
-    def __init__(self, data):
+    def __init__(self, data, interval=None):
+        self.interval = interval
+        # 캐시의 압축된 봉(float32 가격, 정수 거래량)이 들어와도 지표는 float64로 계산
+        compact = [column for column, dtype in data.dtypes.items() if dtype != np.float64]
         self.data = data.copy()
+        for column in compact:
+            self.data[column] = as_float64(data[column])
     
-    def calculate_rsi(self, period=14):
-        rsi_indicator = RSIIndicator(close=self.data['Close'], window=period)
-        return rsi_indicator.rsi()
-    
-    def calculate_macd(self, fast=12, slow=26, signal=9):
-        macd_indicator = MACD(
-            close=self.data['Close'],
-            window_slow=slow,
-            window_fast=fast,
-            window_sign=signal
-        )
-        
-        macd_line = macd_indicator.macd()
-        signal_line = macd_indicator.macd_signal()
-        histogram = macd_indicator.macd_diff()
-        
-        return macd_line, signal_line, histogram
+    def calculate(self, columns, params=None):
+        """지표 계산 그래프로 columns만 계산 → {열 이름: Series} (params로 config 기간 덮어쓰기)"""
+        return compute_indicators(self.data, columns, params, self.interval)
+    
+    def calculate_rsi(self, period=None):
+        return self.calculate(['RSI'], {'RSI_PERIOD': period})['RSI']
     
-    def calculate_williams_r(self, period=14):
-        williams_r_indicator = WilliamsRIndicator(
-            high=self.data['High'],
-            low=self.data['Low'],
-            close=self.data['Close'],
-            lbp=period
-        )
-        return williams_r_indicator.williams_r()
+    def calculate_macd(self, fast=None, slow=None, signal=None):
+        result = self.calculate(['MACD', 'MACD_Signal', 'MACD_Histogram'],
+                                {'MACD_FAST': fast, 'MACD_SLOW': slow, 'MACD_SIGNAL': signal})
+        return result['MACD'], result['MACD_Signal'], result['MACD_Histogram']
+    
+    def calculate_williams_r(self, period=None):
+        return self.calculate(['Williams_R'], {'WILLIAMS_R_PERIOD': period})['Williams_R']
     
     def calculate_moving_averages(self, periods=[20, 50, 200]):
-        mas = {}
+        graphed = [f'MA{period}' for period in periods if period in (20, 50, 200)]
+        mas = self.calculate(graphed)
         for period in periods:
-            mas[f'MA{period}'] = self.data['Close'].rolling(window=period).mean()
-        return mas
-    
-    def calculate_bollinger_bands(self, period=20, std_dev=2):
-        bb_indicator = BollingerBands(
-            close=self.data['Close'],
-            window=period,
-            window_dev=std_dev
-        )
-        
-        upper_band = bb_indicator.bollinger_hband()
-        middle_band = bb_indicator.bollinger_mavg()
-        lower_band = bb_indicator.bollinger_lband()
-        
-        return upper_band, middle_band, lower_band
+            if f'MA{period}' not in mas:
+                mas[f'MA{period}'] = self.data['Close'].rolling(window=period).mean()
+        return {f'MA{period}': mas[f'MA{period}'] for period in periods}
+    
+    def calculate_bollinger_bands(self, period=None, std_dev=None):
+        result = self.calculate(['BB_Upper', 'BB_Middle', 'BB_Lower'],
+                                {'BB_PERIOD': period, 'BB_STD_DEV': std_dev})
+        return result['BB_Upper'], result['BB_Middle'], result['BB_Lower']
     
-    def calculate_atr(self, period=14):
-        atr_indicator = AverageTrueRange(
-            high=self.data['High'],
-            low=self.data['Low'],
-            close=self.data['Close'],
-            window=period
-        )
-        return atr_indicator.average_true_range()
+    def calculate_atr(self, period=None):
+        return self.calculate(['ATR'], {'ATR_PERIOD': period})['ATR']
     
     def calculate_obv(self):
-        obv_indicator = OnBalanceVolumeIndicator(
-            close=self.data['Close'],
-            volume=self.data['Volume']
-        )
-        return obv_indicator.on_balance_volume()
+        return self.calculate(['OBV'])['OBV']
+    
+    def calculate_volume_ma(self, period=None):
+        return self.calculate(['Volume_MA'], {'VOLUME_MA_PERIOD': period})['Volume_MA']
     
-    def calculate_volume_ma(self, period=20):
-        return self.data['Volume'].rolling(window=period).mean()
+    def calculate_vwap(self, anchor=None, std_dev=None):
+        """VWAP와 표준편차 밴드 (vwap, upper, lower)
+
+        anchor가 없으면 분봉은 세션(거래일)마다 새로 시작하는 세션 VWAP, 일봉 이상은 첫 봉부터
+        누적한 VWAP이고, anchor가 있으면 그 시각부터 누적한 앵커 VWAP (이전 봉은 NaN).
+        """
+        std_dev = config.VWAP_BAND_STD if std_dev is None else std_dev
+        index = self.data.index
+        if anchor is None:
+            groups = session_ids(index) if self.interval in INTRADAY_INTERVALS else None
+        else:
+            groups = (index >= pd.Timestamp(anchor)).astype(np.int64)
+        values = [self.data[column].to_numpy(dtype=float) for column in ('High', 'Low', 'Close', 'Volume')]
+        vwap, upper, lower = vwap_bands(*values, groups=groups, std_dev=std_dev)
+        if anchor is not None:
+            before = groups == 0
+            for array in (vwap, upper, lower):
+                array[before] = np.nan
+        return (pd.Series(vwap, index=index), pd.Series(upper, index=index),
+                pd.Series(lower, index=index))
     
-    def get_latest_rsi_signal(self, rsi_value):
+    def calculate_volume_profile(self, bins=None, value_area=None, start=None):
+        """가격대별 거래량 프로필 (start가 있으면 그 시각 이후 봉만)"""
+        data = self.data if start is None else self.data[self.data.index >= pd.Timestamp(start)]
+        return volume_profile(data['High'].to_numpy(dtype=float), data['Low'].to_numpy(dtype=float),
+                              data['Volume'].to_numpy(dtype=float), bins, value_area)
+    
+    @staticmethod
+    def get_latest_rsi_signal(rsi_value):
         if pd.isna(rsi_value):
             return "데이터 부족"
-        elif rsi_value >= 70:
+        elif rsi_value >= config.RSI_OVERBOUGHT:
             return "과매수 (매도 고려)"
-        elif rsi_value <= 30:
+        elif rsi_value <= config.RSI_OVERSOLD:
             return "과매도 (매수 고려)"
         else:
             return "중립"
     
-    def get_latest_williams_r_signal(self, wr_value):
+    @staticmethod
+    def get_latest_williams_r_signal(wr_value):
         if pd.isna(wr_value):
             return "데이터 부족"
-        elif wr_value >= -20:
+        elif wr_value >= config.WILLIAMS_R_OVERBOUGHT:
             return "과매수 (매도 고려)"
-        elif wr_value <= -80:
+        elif wr_value <= config.WILLIAMS_R_OVERSOLD:
             return "과매도 (매수 고려)"
         else:
             return "중립"
     
-    def get_macd_signal(self, macd_value, signal_value):
+    @staticmethod
+    def get_macd_signal(macd_value, signal_value):
         if pd.isna(macd_value) or pd.isna(signal_value):
             return "데이터 부족"
         
@@ -107,29 +407,72 @@ class TechnicalAnalysis:
         else:
             return "중립"
     
-    def calculate_all_indicators(self):
-        result_df = self.data.copy()
+    @staticmethod
+    def latest_signals(indicators_data):
+        """마지막 봉 기준 지표 값과 신호 분류 (GUI 표시와 로컬 API 서비스 공용, 결측값과 계산하지 않은 열은 None)"""
+        latest = indicators_data.iloc[-1]
         
-        result_df['ATR'] = self.calculate_atr()
-        result_df['OBV'] = self.calculate_obv()
-        result_df['Volume_MA'] = self.calculate_volume_ma()
+        def value(column):
+            v = latest.get(column, None)
+            return None if v is None or pd.isna(v) else float(v)
         
-        result_df['RSI'] = self.calculate_rsi()
+        close_price = float(as_float64(indicators_data['Close'].to_numpy()[-1:])[0])
+        rsi_val = value('RSI')
+        macd_val = value('MACD')
+        signal_val = value('MACD_Signal')
+        wr_val = value('Williams_R')
         
-        macd_line, signal_line, histogram = self.calculate_macd()
-        result_df['MACD'] = macd_line
-        result_df['MACD_Signal'] = signal_line
-        result_df['MACD_Histogram'] = histogram
+        result = {
+            'timestamp': indicators_data.index[-1].isoformat() if hasattr(indicators_data.index[-1], 'isoformat')
+                         else str(indicators_data.index[-1]),
+            'close': close_price,
+            'rsi': {'value': rsi_val, 'signal': TechnicalAnalysis.get_latest_rsi_signal(rsi_val)},
+            'macd': {
+                'value': macd_val,
+                'signal_line': signal_val,
+                'histogram': value('MACD_Histogram'),
+                'signal': TechnicalAnalysis.get_macd_signal(macd_val, signal_val),
+            },
+            'williams_r': {'value': wr_val,
+                           'signal': TechnicalAnalysis.get_latest_williams_r_signal(wr_val)},
+            'moving_averages': {name: value(name) for name in ('MA20', 'MA50', 'MA200')},
+            'bollinger': None,
+            'atr': None,
+            'obv': value('OBV'),
+        }
         
-        result_df['Williams_R'] = self.calculate_williams_r()
+        bb_upper, bb_middle, bb_lower = value('BB_Upper'), value('BB_Middle'), value('BB_Lower')
+        if bb_upper is not None and bb_lower is not None:
+            result['bollinger'] = {
+                'upper': bb_upper,
+                'middle': bb_middle,
+                'lower': bb_lower,
+                'width_pct': ((bb_upper - bb_lower) / bb_middle) * 100 if bb_middle != 0 else 0,
+                'position': "상단 근처" if close_price > bb_middle else "하단 근처",
+            }
         
-        mas = self.calculate_moving_averages()
-        for key, value in mas.items():
-            result_df[key] = value
+        atr_val = value('ATR')
+        if atr_val is not None:
+            atr_pct = (atr_val / close_price) * 100 if close_price != 0 else 0
+            result['atr'] = {
+                'value': atr_val,
+                'pct': atr_pct,
+                'volatility': "높음" if atr_pct > 3 else "중간" if atr_pct > 1.5 else "낮음",
+            }
         
-        upper_bb, middle_bb, lower_bb = self.calculate_bollinger_bands()
-        result_df['BB_Upper'] = upper_bb
-        result_df['BB_Middle'] = middle_bb
-        result_df['BB_Lower'] = lower_bb
+        volume = float(latest['Volume'])
+        volume_ma = value('Volume_MA')
+        result['volume'] = {'value': volume, 'ma': volume_ma, 'ratio_pct': None, 'status': None}
+        if volume_ma is not None and volume_ma != 0:
+            volume_ratio = (volume / volume_ma) * 100
+            result['volume']['ratio_pct'] = volume_ratio
+            result['volume']['status'] = "매우 높음" if volume_ratio > config.VOLUME_SURGE_PCT else "높음" if volume_ratio > 120 else "보통"
         
+        return result
+    
+    def calculate_all_indicators(self, columns=None):
+        """봉 데이터에 지표 열을 붙인 프레임 (columns를 주면 화면에 필요한 열만 계산)"""
+        result_df = self.data.copy()
+        for column, values in self.calculate(INDICATOR_COLUMNS if columns is None else columns).items():
+            result_df[column] = values
         return result_df
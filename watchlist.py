@@ -0,0 +1,395 @@
+import time
+import numpy as np
+import pandas as pd
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
+                             QLineEdit, QPushButton, QComboBox, QScrollArea, QFrame, QMenu,
+                             QListWidget)
+from PyQt5.QtCore import Qt, QEvent, QObject, QRunnable, QThreadPool, QTimer, QPointF, pyqtSignal
+from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QPolygonF
+
+import config
+from alerts import AlertEngine, latest_rows, required_columns
+from data_cache import shared_cache, ttl_for
+from data_fetcher import CancelToken, LoadCancelled
+
+TILE_WIDTH = 230
+TILE_HEIGHT = 120
+SPARKLINE_POINTS = 120
+# 타일이 표시하는 지표 열 (알림 규칙이 쓰는 열은 로딩할 때 더함)
+TILE_COLUMNS = ['RSI', 'MACD', 'MACD_Signal', 'Williams_R']
+
+
+def decimate(values, buckets):
+    """구간별 최소/최대값을 남겨 스파크라인용으로 축소 (고점/저점 보존)"""
+    values = values[~np.isnan(values)]
+    if len(values) <= buckets * 2:
+        return values
+    usable = len(values) - len(values) % buckets
+    chunks = values[len(values) - usable:].reshape(buckets, -1)
+    mins = chunks.min(axis=1)
+    maxs = chunks.max(axis=1)
+    first_is_min = chunks.argmin(axis=1) < chunks.argmax(axis=1)
+    out = np.empty(buckets * 2)
+    out[0::2] = np.where(first_is_min, mins, maxs)
+    out[1::2] = np.where(first_is_min, maxs, mins)
+    return out
+
+
+def summarize_tile(entry, alert_columns=()):
+    """타일 표시용 요약 (스파크라인 + 주요 지표값 + 알림 규칙 평가용 마지막 두 봉 값)"""
+    close = entry['data']['Close'].to_numpy(dtype=float)
+    indicators = entry['indicators']
+    latest = indicators.iloc[-1]
+    last = close[-1]
+    prev = close[-2] if len(close) > 1 else close[-1]
+    macd, signal = latest['MACD'], latest['MACD_Signal']
+    return {
+        'sparkline': decimate(close, SPARKLINE_POINTS),
+        'last': last,
+        'change_pct': (last - prev) / prev * 100 if prev else 0.0,
+        'rsi': latest['RSI'],
+        'macd_up': None if pd.isna(macd) or pd.isna(signal) else bool(macd > signal),
+        'williams_r': latest['Williams_R'],
+        'alert_rows': latest_rows(indicators, alert_columns),
+        'bar_time': indicators.index[-1],
+    }
+
+
+class TileSignals(QObject):
+    finished = pyqtSignal(object, object)
+    error = pyqtSignal(object)
+
+
+class TileLoadTask(QRunnable):
+    """워치리스트 타일 하나의 데이터를 공유 캐시를 통해 로딩 (취소 가능)"""
+
+    def __init__(self, symbol, period, interval, cache, alert_columns=()):
+        super().__init__()
+        self.symbol = symbol
+        self.view_key = (period, interval)
+        self.cache = cache
+        self.alert_columns = alert_columns
+        self.cancel_token = CancelToken()
+        self.signals = TileSignals()
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    def run(self):
+        try:
+            period, interval = self.view_key
+            columns = TILE_COLUMNS + required_columns(self.alert_columns)
+            entry = self.cache.load(self.symbol, period, interval, cancel=self.cancel_token, columns=columns)
+            if entry is None:
+                self.signals.error.emit(self)
+                return
+            self.signals.finished.emit(self, summarize_tile(entry, self.alert_columns))
+        except LoadCancelled:
+            return
+        except Exception:
+            self.signals.error.emit(self)
+
+
+class SparklineTile(QFrame):
+    """종목 하나의 간단한 스파크라인 차트와 지표 요약"""
+    activated = pyqtSignal(str)
+    remove_requested = pyqtSignal(str)
+
+    def __init__(self, symbol, parent=None):
+        super().__init__(parent)
+        self.symbol = symbol
+        self.summary = None
+        self.view_key = None
+        self.updated_at = 0.0
+        self.failed = False
+        self.setFixedSize(TILE_WIDTH, TILE_HEIGHT)
+        self.setFrameShape(QFrame.StyledPanel)
+        self.setToolTip("더블클릭: 차트 분석 탭에서 열기")
+
+    def set_summary(self, view_key, summary):
+        self.view_key = view_key
+        self.summary = summary
+        self.updated_at = time.time()
+        self.failed = False
+        self.update()
+
+    def set_failed(self, view_key):
+        self.view_key = view_key
+        self.updated_at = time.time()
+        self.failed = True
+        self.update()
+
+    def is_fresh(self, view_key):
+        return self.view_key == view_key and time.time() - self.updated_at < ttl_for(view_key[1])
+
+    def mouseDoubleClickEvent(self, event):
+        self.activated.emit(self.symbol)
+
+    def contextMenuEvent(self, event):
+        menu = QMenu(self)
+        remove_action = menu.addAction("삭제")
+        if menu.exec_(event.globalPos()) == remove_action:
+            self.remove_requested.emit(self.symbol)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        width = self.width()
+        height = self.height()
+
+        painter.setPen(QPen(QColor(0, 0, 0)))
+        painter.setFont(QFont('Arial', 10, QFont.Bold))
+        painter.drawText(8, 4, width - 16, 20, Qt.AlignLeft | Qt.AlignVCenter, self.symbol)
+
+        summary = self.summary
+        if summary is None:
+            painter.setFont(QFont('Arial', 8))
+            painter.setPen(QPen(QColor(120, 120, 120)))
+            text = "데이터 없음" if self.failed else "로딩 대기..."
+            painter.drawText(0, 0, width, height, Qt.AlignCenter, text)
+            return
+
+        up = summary['change_pct'] >= 0
+        color = QColor(200, 30, 30) if up else QColor(30, 60, 200)
+        painter.setPen(QPen(color))
+        painter.setFont(QFont('Arial', 9))
+        painter.drawText(8, 4, width - 16, 20, Qt.AlignRight | Qt.AlignVCenter,
+                         f"{summary['last']:,.2f} ({summary['change_pct']:+.2f}%)")
+
+        points = summary['sparkline']
+        top, bottom = 28, height - 26
+        if len(points) > 1:
+            low, high = points.min(), points.max()
+            span = (high - low) or 1.0
+            xs = 8 + np.linspace(0, width - 16, len(points))
+            ys = bottom - (points - low) / span * (bottom - top)
+            painter.setPen(QPen(color, 1.2))
+            painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)]))
+
+        rsi = summary['rsi']
+        wr = summary['williams_r']
+        macd_up = summary['macd_up']
+        readout = f"RSI {rsi:.0f}" if not pd.isna(rsi) else "RSI -"
+        readout += "  MACD " + ("-" if macd_up is None else "▲" if macd_up else "▼")
+        readout += f"  %R {wr:.0f}" if not pd.isna(wr) else "  %R -"
+        hot = (not pd.isna(rsi) and (rsi >= config.RSI_OVERBOUGHT or rsi <= config.RSI_OVERSOLD))
+        painter.setPen(QPen(QColor(200, 100, 0) if hot else QColor(60, 60, 60)))
+        painter.setFont(QFont('Arial', 8))
+        painter.drawText(8, height - 22, width - 16, 18, Qt.AlignLeft | Qt.AlignVCenter, readout)
+
+
+class WatchlistWidget(QWidget):
+    """여러 종목을 한 화면에 보여주는 관심 종목 그리드
+
+    로딩은 제한된 크기의 스레드 풀에서 동시에 진행되며, 모든 요청이 공유 캐시를
+    거친다. 화면에 보이는 타일만 로딩/갱신한다. 타일이 갱신되면 알림 규칙(config.ALERT_RULES)을
+    로딩된 모든 종목에 대해 한 번에 평가하고, 새로 충족된 조건만 알림 목록에 추가한다.
+    """
+    symbol_activated = pyqtSignal(str)
+    alerts_triggered = pyqtSignal(list)
+
+    def __init__(self, cache=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache or shared_cache
+        self.tiles = {}
+        self.queued = {}
+        self.columns = 0
+        self.alerts = AlertEngine()
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(config.WATCHLIST_MAX_CONCURRENCY)
+
+        self.init_ui()
+
+        self.visible_timer = QTimer(self)
+        self.visible_timer.setSingleShot(True)
+        self.visible_timer.setInterval(100)
+        self.visible_timer.timeout.connect(self.refresh_visible)
+        self.scroll.verticalScrollBar().valueChanged.connect(lambda _: self.visible_timer.start())
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_visible)
+        self.refresh_timer.start(config.WATCHLIST_REFRESH_SEC * 1000)
+
+        # 여러 타일이 잇달아 갱신되면 마지막 갱신 뒤 한 번만 평가
+        self.alert_timer = QTimer(self)
+        self.alert_timer.setSingleShot(True)
+        self.alert_timer.setInterval(200)
+        self.alert_timer.timeout.connect(self.evaluate_alerts)
+
+        self.set_symbols(config.WATCHLIST_DEFAULT)
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        toolbar = QHBoxLayout()
+        toolbar.addWidget(QLabel("종목 추가:"))
+        self.symbols_input = QLineEdit()
+        self.symbols_input.setPlaceholderText("쉼표로 구분 (예: AAPL, MSFT, 005930.KS)")
+        self.symbols_input.returnPressed.connect(self.add_symbols_from_input)
+        toolbar.addWidget(self.symbols_input)
+
+        self.add_button = QPushButton("추가")
+        self.add_button.clicked.connect(self.add_symbols_from_input)
+        toolbar.addWidget(self.add_button)
+
+        toolbar.addWidget(QLabel("기간:"))
+        self.period_combo = QComboBox()
+        self.period_combo.addItems(['1mo', '3mo', '6mo', '1y', '2y', '5y'])
+        self.period_combo.setCurrentText(config.WATCHLIST_PERIOD)
+        self.period_combo.currentTextChanged.connect(lambda _: self.refresh_visible())
+        toolbar.addWidget(self.period_combo)
+
+        toolbar.addWidget(QLabel("간격:"))
+        self.interval_combo = QComboBox()
+        self.interval_combo.addItems(['1h', '1d', '1wk'])
+        self.interval_combo.setCurrentText(config.WATCHLIST_INTERVAL)
+        self.interval_combo.currentTextChanged.connect(lambda _: self.refresh_visible())
+        toolbar.addWidget(self.interval_combo)
+
+        self.status_label = QLabel("")
+        toolbar.addWidget(self.status_label)
+        toolbar.addStretch()
+        layout.addLayout(toolbar)
+
+        self.scroll = QScrollArea()
+        self.scroll.setWidgetResizable(True)
+        self.grid_widget = QWidget()
+        self.grid = QGridLayout(self.grid_widget)
+        self.grid.setSpacing(6)
+        self.grid.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.scroll.setWidget(self.grid_widget)
+        self.scroll.viewport().installEventFilter(self)
+        layout.addWidget(self.scroll, 1)
+
+        layout.addWidget(QLabel("알림"))
+        self.alert_list = QListWidget()
+        self.alert_list.setMaximumHeight(120)
+        self.alert_list.itemDoubleClicked.connect(
+            lambda item: self.symbol_activated.emit(item.data(Qt.UserRole)))
+        layout.addWidget(self.alert_list)
+
+    def view_key(self):
+        return (self.period_combo.currentText(), self.interval_combo.currentText())
+
+    def set_symbols(self, symbols):
+        for symbol in list(self.tiles):
+            self.remove_symbol(symbol)
+        self.add_symbols(symbols)
+
+    def add_symbols(self, symbols):
+        for symbol in symbols:
+            symbol = symbol.strip().upper()
+            if not symbol or symbol in self.tiles:
+                continue
+            tile = SparklineTile(symbol)
+            tile.activated.connect(self.symbol_activated)
+            tile.remove_requested.connect(self.remove_symbol)
+            self.tiles[symbol] = tile
+        self.relayout()
+
+    def add_symbols_from_input(self):
+        self.add_symbols(self.symbols_input.text().split(','))
+        self.symbols_input.clear()
+
+    def remove_symbol(self, symbol):
+        tile = self.tiles.pop(symbol, None)
+        if tile is None:
+            return
+        task = self.queued.pop(symbol, None)
+        if task is not None and not self.pool.tryTake(task):
+            task.cancel()
+        self.alerts.remove(symbol)
+        self.grid.removeWidget(tile)
+        tile.deleteLater()
+        self.relayout()
+
+    def relayout(self):
+        columns = max(1, (self.scroll.viewport().width() - 12) // (TILE_WIDTH + self.grid.spacing()))
+        for i, tile in enumerate(self.tiles.values()):
+            self.grid.addWidget(tile, i // columns, i % columns)
+        self.columns = columns
+        self.visible_timer.start()
+
+    def eventFilter(self, obj, event):
+        if obj is self.scroll.viewport() and event.type() == QEvent.Resize:
+            columns = max(1, (event.size().width() - 12) // (TILE_WIDTH + self.grid.spacing()))
+            if columns != self.columns:
+                self.relayout()
+            else:
+                self.visible_timer.start()
+        return super().eventFilter(obj, event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.visible_timer.start()
+
+    def visible_symbols(self):
+        """스크롤 영역에서 실제로 보이는 타일의 심볼"""
+        if not self.isVisible():
+            return []
+        return [symbol for symbol, tile in self.tiles.items() if not tile.visibleRegion().isEmpty()]
+
+    def refresh_visible(self):
+        """보이는 타일 중 오래된 것만 로딩 요청, 보이지 않게 되었거나 설정이 바뀐 작업은 취소"""
+        visible = set(self.visible_symbols())
+        view_key = self.view_key()
+
+        for symbol, task in list(self.queued.items()):
+            if symbol not in visible or task.view_key != view_key:
+                if not self.pool.tryTake(task):
+                    task.cancel()
+                del self.queued[symbol]
+
+        for symbol in visible:
+            if symbol in self.queued:
+                continue
+            if self.tiles[symbol].is_fresh(view_key):
+                continue
+            task = TileLoadTask(symbol, view_key[0], view_key[1], self.cache, self.alerts.rules.columns)
+            task.signals.finished.connect(self.on_tile_loaded)
+            task.signals.error.connect(self.on_tile_error)
+            self.queued[symbol] = task
+            self.pool.start(task)
+        self.update_status()
+
+    def _task_done(self, task):
+        """완료된 작업 정리. 취소/대체되지 않은 최신 작업이면 해당 타일 반환"""
+        if self.queued.get(task.symbol) is not task:
+            return None
+        del self.queued[task.symbol]
+        return self.tiles.get(task.symbol)
+
+    def on_tile_loaded(self, task, summary):
+        tile = self._task_done(task)
+        if tile is not None:
+            tile.set_summary(task.view_key, summary)
+            self.alerts.update(task.symbol, summary['alert_rows'], summary['bar_time'])
+            self.alert_timer.start()
+        self.update_status()
+
+    def on_tile_error(self, task):
+        tile = self._task_done(task)
+        if tile is not None:
+            tile.set_failed(task.view_key)
+        self.update_status()
+
+    def evaluate_alerts(self):
+        """로딩된 모든 종목에 알림 규칙 평가, 새 알림을 목록 맨 위에 추가"""
+        alerts = self.alerts.evaluate()
+        if not alerts:
+            return
+        for alert in alerts:
+            stamp = time.strftime('%H:%M:%S', time.localtime(alert['time']))
+            self.alert_list.insertItem(0, f"{stamp}  {alert['symbol']}  {alert['rule']} "
+                                          f"({alert['condition']}, 현재 {alert['value']:,.2f})")
+            self.alert_list.item(0).setData(Qt.UserRole, alert['symbol'])
+        while self.alert_list.count() > config.ALERT_HISTORY:
+            self.alert_list.takeItem(self.alert_list.count() - 1)
+        self.alerts_triggered.emit(alerts)
+
+    def update_status(self):
+        pending = len(self.queued)
+        self.status_label.setText(f"종목 {len(self.tiles)}개 | 로딩 중 {pending}개" if pending
+                                  else f"종목 {len(self.tiles)}개")